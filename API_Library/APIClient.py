@@ -1,22 +1,170 @@
 import os
-import requests
-from requests.adapters import HTTPAdapter
-from dotenv import load_dotenv
-from urllib3.util.retry import Retry
+import socket
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
+from API_Library.FastDecode import FastDecode
+
+# The _Attempt the current thread's GET belongs to, read by the connection pools of the adapter.
+_current = threading.local()
+
+class _InFlightCall:
+    """
+    A GET that is currently on the wire. The first caller for a URL performs
+    the request; later callers for the same URL wait on it and share the result.
+    """
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+    def wait(self):
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+class _AttemptAborted(Exception):
+    """Raised in a hedged attempt that lost the race, so urllib3 does not retry it."""
+
+class _Attempt:
+    """
+    One attempt of a GET. The adapter's connection pools bind every connection the
+    attempt checks out, so the caller can abort it from another thread by shutting the
+    socket down, which wakes the blocked read at once and discards the connection.
+    sent_at is when the first connection was checked out, the start of every latency sample.
+    """
+    def __init__(self):
+        self.started = threading.Event()
+        self.lock = threading.Lock()
+        self.conn = None
+        self.aborted = False
+        self.sent_at = None
+
+    def bind(self, conn):
+        with self.lock:
+            if self.aborted:
+                raise _AttemptAborted()
+            self.conn = conn
+            if self.sent_at is None:
+                self.sent_at = time.perf_counter()
+        self.started.set()
+
+    def abort(self):
+        with self.lock:
+            self.aborted = True
+            sock = getattr(self.conn, "sock", None)
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+@lru_cache(maxsize=None)
+def _abortable_adapter_class():
+    from requests.adapters import HTTPAdapter
+    from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+    def abortable(pool_class):
+        class AbortablePool(pool_class):
+            def _get_conn(self, timeout=None):
+                conn = super()._get_conn(timeout)
+                attempt = getattr(_current, "attempt", None)
+                if attempt is not None:
+                    try:
+                        attempt.bind(conn)
+                    except _AttemptAborted:
+                        # urllib3 puts an empty slot back for the connection it never received.
+                        conn.close()
+                        raise
+                return conn
+        return AbortablePool
+
+    class AbortableAdapter(HTTPAdapter):
+        def init_poolmanager(self, *args, **kwargs):
+            super().init_poolmanager(*args, **kwargs)
+            self.poolmanager.pool_classes_by_scheme = {
+                "http": abortable(HTTPConnectionPool),
+                "https": abortable(HTTPSConnectionPool),
+            }
+    return AbortableAdapter
+
+class _LatencyTracker:
+    """
+    Recent response times per endpoint, used to decide when a GET is late enough to hedge.
+    """
+    def __init__(self, percentile=95, window=200, min_samples=20):
+        self.percentile = percentile
+        self.window = window
+        self.min_samples = min_samples
+        self.samples = {}
+        self.lock = threading.Lock()
+
+    def record(self, endpoint, seconds):
+        with self.lock:
+            samples = self.samples.get(endpoint)
+            if samples is None:
+                samples = self.samples[endpoint] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def threshold(self, endpoint):
+        """
+        :return: (float | None) The endpoint's latency percentile, None until enough samples were seen.
+        """
+        with self.lock:
+            samples = self.samples.get(endpoint)
+            if samples is None or len(samples) < self.min_samples:
+                return None
+            ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, len(ordered) * self.percentile // 100)]
 
 class APIClient:
     """
     A simple and flexible API client for making requests.
+
+    Concurrent identical GETs are coalesced (single-flight): only one request
+    goes out and every caller receives the same parsed JSON object, so callers
+    must treat responses as read-only. Counters are kept in `stats`:
+    'requests' (calls to api_request), 'network' (GETs actually sent) and
+    'coalesced' (calls served by another caller's in-flight GET).
+
+    Every request carries a connect and a read timeout, so a stalled
+    connection fails (and is retried) instead of holding its worker thread
+    for the rest of the cycle.
+
+    GETs are hedged: when a GET has not answered within the learned latency
+    percentile of its endpoint (timed from when it is actually sent), an
+    identical second GET is sent and the first reply wins. As soon as a
+    winner is known the other attempt is aborted: its socket is shut down,
+    which ends a pending read immediately, frees its pooled connection and
+    skips urllib3's retries. Hedges are limited to
+    `hedge_budget` of the GETs sent, so hedging never adds more than that
+    fraction to our API traffic. 'hedged' counts hedges sent and
+    'hedge_wins' the hedges that answered first.
     """
-    def __init__(self, base_url):
+    def __init__(self, base_url, connect_timeout=5.0, read_timeout=30.0, hedge_budget=0.05, hedge_percentile=95):
         """
         Initialize the API client.
         :param base_url: (str) The base URL of the API.
+        :param connect_timeout: (float) Seconds to wait for a connection.
+        :param read_timeout: (float) Seconds to wait between bytes of a response.
+        :param hedge_budget: (float) Maximum fraction of GETs that may be hedged, 0 disables hedging.
+        :param hedge_percentile: (int) Per-endpoint latency percentile after which a GET is hedged.
         """
+        # Imported here rather than at module level to keep `import API_Library` cheap.
+        import requests
+        from dotenv import load_dotenv
+        from urllib3.util.retry import Retry
+
         load_dotenv()
         self.base_url = base_url.rstrip('/')
         self.username = os.getenv('FIRST_USERNAME')
         self.password = os.getenv('FIRST_PASS')
+        self.timeout = (connect_timeout, read_timeout)
 
         if not self.username or not self.password:
             raise EnvironmentError("Environment variables API_USERNAME and API_PASSWORD are required.")
@@ -24,7 +172,7 @@ class APIClient:
         self.session = requests.Session()
         self.session.auth = (self.username, self.password)
         
-        adapter = HTTPAdapter(
+        adapter = _abortable_adapter_class()(
             pool_connections=500,
             pool_maxsize=500,
             max_retries=Retry(total=3, backoff_factor=0.3),
@@ -33,6 +181,13 @@ class APIClient:
         self.session.mount("https://", adapter)
         self.session.mount("http://", adapter)
 
+        self.stats = Counter()
+        self._in_flight = {}
+        self._in_flight_lock = threading.Lock()
+        self.hedge_budget = hedge_budget
+        self.latency = _LatencyTracker(percentile=hedge_percentile)
+        self._hedge_pool = ThreadPoolExecutor(256, thread_name_prefix="hedge") if hedge_budget > 0 else None
+
     def build_url(self, apiParams):
         """
         Build a URL using the base URL, path segments, and optional query parameters.
@@ -50,20 +205,104 @@ class APIClient:
 
         return url
     
-    def api_request(self, api_params, params=None, headers=None):
+    def api_request(self, api_params, params=None, headers=None, record_type=None):
         """
         Make a GET request to the API.
         :param path_segments: (list) Path segments for the URL.
         :param params: (dict) Query parameters for the request.
         :param headers: (dict) Additional headers for the request.
-        :return: (dict) JSON response from the API.
+        :param record_type: (type, optional) Record dataclass to decode the body into with FastDecode.
+        :return: (dict) JSON response from the API, or a record_type instance,
+            shared with concurrent callers.
         """
         url = self.build_url(api_params)
-        response = self.session.get(url, params=params, headers=headers)
+        key = (url, tuple(sorted((params or {}).items())), tuple(sorted((headers or {}).items())), record_type)
+
+        with self._in_flight_lock:
+            self.stats["requests"] += 1
+            call = self._in_flight.get(key)
+            leader = call is None
+            if leader:
+                call = self._in_flight[key] = _InFlightCall()
+                self.stats["network"] += 1
+            else:
+                self.stats["coalesced"] += 1
+        if not leader:
+            return call.wait()
+
+        try:
+            call.result = self._hedged_get(api_params.endpoint(), url, params=params, headers=headers,
+                                           record_type=record_type)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._in_flight_lock:
+                del self._in_flight[key]
+            call.done.set()
+        return call.result
+
+    def _hedged_get(self, endpoint, url, params=None, headers=None, record_type=None):
+        delay = self.latency.threshold(endpoint) if self._hedge_pool else None
+        # Both paths time a sample from the primary attempt's connection checkout to its decoded reply,
+        # leaving out waits for a thread or a pool slot.
+        if delay is None:
+            attempt = _Attempt()
+            result = self._attempt(attempt, url, params, headers, record_type)
+            self.latency.record(endpoint, time.perf_counter() - attempt.sent_at)
+            return result
+
+        primary_attempt = _Attempt()
+        primary = self._hedge_pool.submit(self._attempt, primary_attempt, url, params, headers, record_type)
+        attempts = {primary: primary_attempt}
+        primary_attempt.started.wait()
+        start = primary_attempt.sent_at or time.perf_counter()
+        done, _ = wait([primary], timeout=max(0.0, delay - (time.perf_counter() - start)))
+        if not done and self._take_hedge():
+            hedge_attempt = _Attempt()
+            attempts[self._hedge_pool.submit(self._attempt, hedge_attempt, url, params, headers, record_type)] = hedge_attempt
+
+        # The first attempt to succeed wins; a failed attempt only counts once the other one failed too.
+        pending, error = set(attempts), None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    for loser in pending:
+                        attempts[loser].abort()
+                    if future is not primary:
+                        with self._in_flight_lock:
+                            self.stats["hedge_wins"] += 1
+                    self.latency.record(endpoint, time.perf_counter() - start)
+                    return future.result()
+                error = future.exception()
+        raise error
+
+    def _attempt(self, attempt, url, params, headers, record_type):
+        _current.attempt = attempt
+        try:
+            return self._get(url, params=params, headers=headers, record_type=record_type)
+        finally:
+            _current.attempt = None
+            attempt.started.set()
+
+    def _take_hedge(self):
+        with self._in_flight_lock:
+            if self.stats["hedged"] >= self.hedge_budget * self.stats["network"]:
+                return False
+            self.stats["hedged"] += 1
+            return True
+
+    def _get(self, url, params=None, headers=None, record_type=None):
+        # Not streamed: the body is read before returning, so the connection goes back to the pool
+        # on every path, including error responses.
+        response = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
 
         if not response.ok:
             response.raise_for_status()
 
+        if record_type is not None:
+            return FastDecode.decode(response.content, record_type)
         return response.json()
     
     def post_request(self, path_segments, data=None, headers=None):
@@ -75,7 +314,7 @@ class APIClient:
         :return: (dict) JSON response from the API.
         """
         url = self.build_url(path_segments)
-        response = self.session.post(url, json=data, headers=headers)
+        response = self.session.post(url, json=data, headers=headers, timeout=self.timeout)
 
         if not response.ok:
             response.raise_for_status()
@@ -35,6 +35,15 @@ class APIParams:
         """
         return [str(segment) for segment in self.path_segments if segment]
 
+    def endpoint(self):
+        """
+        Name of the endpoint without its season and event code, e.g. 'scores/qual' for
+        [2025, 'scores', 'USCAFFFAQ', 'qual']. FTC API paths are season/resource/eventCode/...
+        :return: (str) Endpoint name.
+        """
+        segments = self.to_path_segments()
+        return "/".join(segment for i, segment in enumerate(segments) if i not in (0, 2)) or "/"
+
     def to_query_params(self):
         """
         Return the query parameters as a dictionary.
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Dict, List, Tuple
 from .Team import Team
 
 @dataclass
@@ -95,8 +95,30 @@ class Match:
             table += f"Match Winner: {self.winner}\n"
         return table
 
+@dataclass
+class MatchResult:
+    """
+    Outcome of one played match, in the order needed by streaming rating updates.
+
+    Attributes:
+        matchKey (str): Stable key of the match, '<event>-<level>-<series>-<matchNumber>'.
+        date (str): Actual start time, None when the API did not report one.
+        redTeams (Tuple[int, int]): Team numbers of the red alliance, 0 for an empty slot.
+        blueTeams (Tuple[int, int]): Team numbers of the blue alliance, 0 for an empty slot.
+        redScore (int): Final red score.
+        blueScore (int): Final blue score.
+    """
+    matchKey: str = field(default_factory=str)
+    date: str = None
+    redTeams: Tuple[int, int] = (0, 0)
+    blueTeams: Tuple[int, int] = (0, 0)
+    redScore: int = 0
+    blueScore: int = 0
+
 @dataclass
 class Event:
     eventCode: str = field(default_factory=str)
     teams: List[Team] = field(default_factory=list)
     matches: Dict[str, Match] = field(default_factory=dict)
+    residualVariance: float = 0.0
+    rankings: Dict[int, int] = field(default_factory=dict)  # teamNumber -> rank at the event
@@ -0,0 +1,88 @@
+"""
+Compact, slotted records for the FTC API match and score payloads.
+
+Only the fields used by MatchMaker, MatrixBuilder and the ScoreAdapters are
+declared; everything else in the JSON is skipped while decoding. Field names
+match the API's JSON keys so the schema drives the decoder in FastDecode.
+"""
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+@dataclass(slots=True)
+class MatchTeam:
+    teamNumber: Optional[int] = None
+    station: str = ""
+    onField: bool = True
+
+@dataclass(slots=True)
+class MatchRecord:
+    """
+    One entry of GET /{season}/matches/{eventCode}.
+
+    scoreRedEndgame, scoreBlueEndgame, penaltyPointsRed and penaltyPointsBlue
+    are not part of the payload; they are filled in from the score breakdown
+    by FirstAPI.fetch_event_data_thread.
+    """
+    description: str = ""
+    tournamentLevel: str = ""
+    series: int = 0
+    matchNumber: int = 0
+    actualStartTime: Optional[str] = None
+    modifiedOn: Optional[str] = None
+    scoreRedFinal: int = 0
+    scoreRedAuto: int = 0
+    scoreRedFoul: int = 0
+    scoreBlueFinal: int = 0
+    scoreBlueAuto: int = 0
+    scoreBlueFoul: int = 0
+    teams: List[MatchTeam] = field(default_factory=list)
+    scoreRedEndgame: int = 0
+    scoreBlueEndgame: int = 0
+    penaltyPointsRed: int = 0
+    penaltyPointsBlue: int = 0
+
+@dataclass(slots=True)
+class AllianceScore:
+    """
+    Per-alliance score breakdown. The union of the fields read by every
+    ScoreAdapter; fields a season does not report stay 0.
+    """
+    alliance: str = ""
+    endgamePoints: int = 0
+    teleopParkPoints: int = 0
+    teleopAscentPoints: int = 0
+    parkingPoints: int = 0
+    capstonePoints: int = 0
+    penaltyPoints: int = 0
+    penaltyPointsCommitted: int = 0
+    foulPointsCommitted: int = 0
+
+@dataclass(slots=True)
+class MatchScore:
+    """One entry of GET /{season}/scores/{eventCode}/qual. alliances[0] is blue, alliances[1] is red."""
+    matchLevel: str = ""
+    matchNumber: int = 0
+    alliances: List[AllianceScore] = field(default_factory=list)
+
+@dataclass(slots=True)
+class MatchesPayload:
+    matches: List[MatchRecord] = field(default_factory=list)
+
+@dataclass(slots=True)
+class ScoresPayload:
+    matchScores: List[MatchScore] = field(default_factory=list)
+
+@dataclass(slots=True)
+class SchedulePayload:
+    """GET /{season}/schedule/{eventCode}; entries carry teams and stations but no scores."""
+    schedule: List[MatchRecord] = field(default_factory=list)
+
+@dataclass(slots=True)
+class RankingRecord:
+    """One entry of GET /{season}/rankings/{eventCode}."""
+    rank: int = 0
+    teamNumber: Optional[int] = None
+
+@dataclass(slots=True)
+class RankingsPayload:
+    rankings: List[RankingRecord] = field(default_factory=list)
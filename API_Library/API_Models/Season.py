@@ -1,6 +1,6 @@
 from dataclasses import dataclass,field
-from typing import Dict
-from .Event import Alliance, Event, Team
+from typing import Dict, List
+from .Event import Alliance, Event, MatchResult, Team
 
 @dataclass
 class Season:
@@ -10,6 +10,9 @@ class Season:
     Attributes:
         seasonCode (str): The code for the season. Example: '2021'.
         events (Dict[str, Event]): A dictionary mapping event codes to Event objects. Example: events['USAZTUQ'].
+        results (List[MatchResult]): Every played match in chronological order.
+        laggards (List[str]): Events that missed the cycle deadline.
+        fallbacks (List[str]): Events served from their last known results.
     """
     seasonCode: str = field(default_factory=str)
     totalTeams: int = field(default_factory=int)
@@ -17,6 +20,9 @@ class Season:
     events: Dict[str, Event] = field(default_factory=dict)
     teams: Dict[int, Team] = field(default_factory=dict)
     matches: Dict[str, Alliance] = field(default_factory=dict)
+    results: List[MatchResult] = field(default_factory=list)
+    laggards: List[str] = field(default_factory=list)
+    fallbacks: List[str] = field(default_factory=list)
 
 @dataclass
 class History:
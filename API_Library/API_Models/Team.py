@@ -14,12 +14,14 @@ class Team:
         teleOPR (float): The teleoperated OPR.
         endgameOPR (float): The endgame OPR.
         overallOPR (float): The overall OPR.
+        overallOPRError (float): Standard error of overallOPR at the event it comes from; the other OPRs have none.
         autoRank (float): The rank in autonomous performance.
         teleRank (float): The rank in teleoperated performance.
         endgameRank (float): The rank in endgame performance.
         overallRank (float): The overall rank.
         penalties (float): The penalties incurred.
         penaltyRank (float): The rank based on penalties.
+        eloRating (float): Streaming Elo rating carried across events.
         profileUpdate (str): The last profile update timestamp.
     """
     teamNumber: int = field(default_factory=int)
@@ -43,6 +45,8 @@ class Team:
     website: str = field(default_factory=str)
     eventsAttended: int = field(default_factory=int)
     averagePlace: float = field(default_factory=float)
+    eloRating: float = field(default_factory=float)
+    overallOPRError: float = field(default_factory=float)
 
     def __post_init__(self):
         """Calculate overall OPR if not provided."""
@@ -98,4 +102,17 @@ class Team:
         self.teleOPR += teleOPR
         self.endgameOPR += endgameOPR
         self.penalties += penalties
-        self.overallOPR = self.autoOPR + self.teleOPR + self.endgameOPR
\ No newline at end of file
+        self.overallOPR = self.autoOPR + self.teleOPR + self.endgameOPR
+
+def split_location(location):
+    """
+    Split a team location as built by FirstAPI.get_team_info ("City, State, Country").
+    :param location: (str) Location string; the last part is the country and the one before it the state.
+    :return: (tuple) city, state, country; parts that are missing are None.
+    """
+    parts = [p.strip() for p in str(location or "").split(",")]
+    parts = [p if p and p != "Unknown" else None for p in parts]
+    country = parts[-1] if parts else None
+    state = parts[-2] if len(parts) >= 2 else None
+    city = ", ".join(p for p in parts[:-2] if p) or None
+    return city, state, country
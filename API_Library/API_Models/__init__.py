@@ -1,3 +1,4 @@
-from .Team import Team
-from .Event import Alliance, Match
+from .Team import Team, split_location
+from .Event import Alliance, Match, MatchResult
 from .Season import Season, History
+from .Records import MatchRecord, MatchScore, MatchesPayload, RankingRecord, RankingsPayload, ScoresPayload, SchedulePayload
\ No newline at end of file
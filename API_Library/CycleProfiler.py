@@ -0,0 +1,229 @@
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+
+# Allocation views written for every stage. Patterns are matched against any
+# frame of an allocation's traceback, so work done inside worker threads and
+# library code called from these modules is attributed to them.
+ALLOCATION_FILTERS = {
+    "MatrixBuilder": ["*TeamMatrixBuilder.py"],
+    "MatchMaker": ["*MatchMaker.py"],
+    "JSON decoding": ["*json/decoder.py", "*json/__init__.py", "*requests/models.py"],
+}
+
+class SamplingProfiler:
+    """
+    A low-overhead statistical profiler.
+
+    A background thread snapshots the stack of every other thread at a fixed
+    interval, which keeps the cost independent of how many calls are made and
+    covers the ThreadPoolExecutor workers used by get_season.
+    """
+    def __init__(self, interval=0.005, exclude=()):
+        """
+        :param interval: (float) Seconds between samples.
+        :param exclude: (iterable) Thread idents that are not sampled.
+        """
+        self.interval = interval
+        self.exclude = set(exclude)
+        self.self_samples = Counter()
+        self.total_samples = Counter()
+        self.num_samples = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id or thread_id in self.exclude:
+                    continue
+                self.num_samples += 1
+                seen = set()
+                leaf = True
+                while frame is not None:
+                    code = frame.f_code
+                    key = (code.co_filename, code.co_firstlineno, code.co_name)
+                    if leaf:
+                        self.self_samples[key] += 1
+                        leaf = False
+                    if key not in seen:
+                        self.total_samples[key] += 1
+                        seen.add(key)
+                    frame = frame.f_back
+
+    def report(self, top=30):
+        """
+        Render the hottest functions by self and cumulative samples.
+        :param top: (int) Number of functions to list per table.
+        :return: (str) Plain-text report.
+        """
+        out = io.StringIO()
+        total = max(self.num_samples, 1)
+        out.write(f"{self.num_samples} samples every {self.interval * 1000:.1f} ms\n")
+        for title, counter in (("self", self.self_samples), ("cumulative", self.total_samples)):
+            out.write(f"\nTop {top} by {title} samples\n")
+            out.write(f"{'samples':>9} {'%':>6}  function\n")
+            for (filename, lineno, name), count in counter.most_common(top):
+                out.write(f"{count:>9} {100 * count / total:>5.1f}%  {name} ({filename}:{lineno})\n")
+        return out.getvalue()
+
+class _ThreadedCProfile:
+    """
+    cProfile for the calling thread plus a SamplingProfiler for every other
+    thread. cProfile only hooks the thread that enables it, and since Python
+    3.12 (sys.monitoring) only one cProfile can be active at a time, so the
+    ThreadPoolExecutor workers are sampled instead of getting a Profile each.
+    Both are stopped at the end of the stage.
+    """
+    def __init__(self, interval=0.005):
+        self.profile = cProfile.Profile()
+        self.workers = SamplingProfiler(interval=interval, exclude=[threading.get_ident()])
+
+    def start(self):
+        self.workers.start()
+        self.profile.enable()
+
+    def stop(self):
+        self.profile.disable()
+        self.workers.stop()
+
+    def report(self, top=30):
+        out = io.StringIO()
+        out.write("Calling thread (cProfile)\n")
+        stats = pstats.Stats(self.profile, stream=out)
+        stats.sort_stats("cumulative").print_stats(top)
+        stats.sort_stats("tottime").print_stats(top)
+        out.write("\nWorker threads (sampled)\n")
+        out.write(self.workers.report(top))
+        return out.getvalue()
+
+class CycleProfiler:
+    """
+    Profiles one ManageDatabase cycle stage by stage.
+
+    Every stage gets a CPU report from the selected profiler and a tracemalloc
+    diff against the previous stage boundary, including the top allocators
+    in MatrixBuilder, MatchMaker and JSON decoding. Reports are written to a
+    run directory together with a summary.json of stage timings.
+
+    Example usage:
+    --------------
+    profiler = CycleProfiler(mode="sample")
+    with profiler.stage("fetch"):
+        ...
+    profiler.close()
+    """
+    MODES = ("cprofile", "sample")
+
+    def __init__(self, mode="cprofile", run_dir=None, top=30, frames=25, interval=0.005):
+        """
+        :param mode: (str) 'cprofile' for deterministic or 'sample' for sampling.
+        :param run_dir: (str) Directory for the reports, defaults to profiles/<timestamp>.
+        :param top: (int) Number of entries per report table.
+        :param frames: (int) Traceback depth stored by tracemalloc.
+        :param interval: (float) Sampling interval in seconds for 'sample' mode.
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown profiler mode {mode!r}, expected one of {self.MODES}")
+        self.mode = mode
+        self.top = top
+        self.interval = interval
+        self.run_dir = run_dir or os.path.join("profiles", datetime.now().strftime("%Y%m%d-%H%M%S"))
+        os.makedirs(self.run_dir, exist_ok=True)
+        self.stages = []
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+        self._snapshot = tracemalloc.take_snapshot()
+
+    def _new_cpu_profiler(self):
+        if self.mode == "sample":
+            return SamplingProfiler(interval=self.interval)
+        return _ThreadedCProfile(interval=self.interval)
+
+    @contextmanager
+    def stage(self, name):
+        """
+        Profile the enclosed block as one stage of the cycle.
+        :param name: (str) Stage name used in report file names.
+        """
+        index = len(self.stages) + 1
+        cpu_profiler = self._new_cpu_profiler()
+        tracemalloc.reset_peak()
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        cpu_profiler.start()
+        try:
+            yield
+        finally:
+            cpu_profiler.stop()
+            wall, cpu = time.perf_counter() - wall_start, time.process_time() - cpu_start
+            current, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+
+            prefix = os.path.join(self.run_dir, f"{index:02d}_{name}")
+            with open(f"{prefix}.cpu.txt", "w") as f:
+                f.write(cpu_profiler.report(self.top))
+            with open(f"{prefix}.alloc.txt", "w") as f:
+                f.write(self.allocation_report(snapshot, self._snapshot))
+            self._snapshot = snapshot
+
+            self.stages.append({
+                "stage": name,
+                "wall_seconds": round(wall, 4),
+                "cpu_seconds": round(cpu, 4),
+                "traced_bytes": current,
+                "peak_bytes": peak,
+            })
+
+    def allocation_report(self, snapshot, previous):
+        """
+        Render the allocation growth between two snapshots.
+        :param snapshot: (tracemalloc.Snapshot) Snapshot at the end of the stage.
+        :param previous: (tracemalloc.Snapshot) Snapshot at the start of the stage.
+        :return: (str) Plain-text report.
+        """
+        snapshot = snapshot.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+        out = io.StringIO()
+        out.write(f"Top {self.top} allocation sites by growth\n")
+        for stat in snapshot.compare_to(previous, "lineno")[:self.top]:
+            out.write(f"  {stat}\n")
+
+        for label, patterns in ALLOCATION_FILTERS.items():
+            filtered = snapshot.filter_traces([tracemalloc.Filter(True, p, all_frames=True) for p in patterns])
+            stats = filtered.statistics("lineno")
+            total = sum(stat.size for stat in stats)
+            out.write(f"\n{label}: {total / 1024:.1f} KiB live in {sum(s.count for s in stats)} blocks\n")
+            for stat in stats[:self.top]:
+                out.write(f"  {stat}\n")
+        return out.getvalue()
+
+    def close(self):
+        """
+        Write summary.json and stop tracing.
+        :return: (str) The run directory.
+        """
+        with open(os.path.join(self.run_dir, "summary.json"), "w") as f:
+            json.dump({"mode": self.mode, "stages": self.stages}, f, indent=2)
+        tracemalloc.stop()
+        return self.run_dir
@@ -0,0 +1,135 @@
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+from API_Library.MatchMaker import MatchMaker
+from API_Library.API_Models.Event import Alliance, Event, MatchResult
+from API_Library.API_Models.Season import Season
+from API_Library.API_Models.Team import Team
+
+@dataclass
+class EventResult:
+    """
+    Everything one event contributes to a season: the per-event OPRs, the
+    alliance rows, the played matches and which teams attended.
+
+    Events are processed into their own EventResult and merged afterwards,
+    so a result can come from this process, from a shard worker or from the
+    cache of last known results, and an event that misses the cycle deadline
+    never touches the season being built.
+
+    Attributes:
+        eventCode (str): The event code.
+        event (Event): Per-event OPRs, None when the event has no matches yet.
+        alliances (Dict[str, Alliance]): MatchMaker alliance rows keyed by match code.
+        results (List[MatchResult]): Played matches.
+        attended (Dict[int, List[str]]): Team number -> event codes seen for the team.
+    """
+    eventCode: str
+    event: Optional[Event] = None
+    alliances: Dict[str, Alliance] = field(default_factory=dict)
+    results: List[MatchResult] = field(default_factory=list)
+    attended: Dict[int, List[str]] = field(default_factory=dict)
+
+    @classmethod
+    def collect(cls, event_code, season, match_maker, events_attended):
+        """Package what fetch_event_data_thread wrote into a Season and MatchMaker private to one event."""
+        return cls(
+            eventCode=event_code,
+            event=season.events.get(event_code),
+            alliances=dict(match_maker.get_all_matches()),
+            results=match_maker.get_match_results(),
+            attended={int(team): sorted(codes) for team, codes in events_attended.items() if team},
+        )
+
+    def to_dict(self):
+        """JSON-serializable form, for shard results and the result cache."""
+        return {
+            "eventCode": self.eventCode,
+            "event": None if self.event is None else {
+                "residualVariance": float(self.event.residualVariance),
+                "rankings": {str(team): rank for team, rank in self.event.rankings.items()},
+                "teams": [_team_dict(team) for team in self.event.teams],
+            },
+            "alliances": {
+                key: {
+                    "color": alliance.color,
+                    "team1": alliance.team1.teamNumber,
+                    "team2": alliance.team2.teamNumber,
+                    "combined_overallOPR": alliance.combined_overallOPR,
+                    "date": alliance.date,
+                    "matchType": alliance.matchType,
+                    "win": alliance.win,
+                    "tele": alliance.tele,
+                    "penalty": alliance.penalty,
+                }
+                for key, alliance in self.alliances.items()
+            },
+            "results": [asdict(result) for result in self.results],
+            "attended": {str(team): codes for team, codes in self.attended.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        event = None
+        if data["event"] is not None:
+            event = Event(eventCode=data["eventCode"], residualVariance=data["event"]["residualVariance"],
+                          teams=[Team(**team) for team in data["event"]["teams"]],
+                          rankings={int(team): rank for team, rank in data["event"].get("rankings", {}).items()})
+        alliances = {
+            key: Alliance(
+                color=a["color"],
+                team1=Team(teamNumber=a["team1"]),
+                team2=Team(teamNumber=a["team2"]),
+                combined_overallOPR=a["combined_overallOPR"],
+                date=a["date"],
+                matchType=a["matchType"],
+                win=a["win"],
+                tele=a["tele"],
+                penalty=a["penalty"],
+                skip=True,
+            )
+            for key, a in data["alliances"].items()
+        }
+        results = [
+            MatchResult(**{**r, "redTeams": tuple(r["redTeams"]), "blueTeams": tuple(r["blueTeams"])})
+            for r in data["results"]
+        ]
+        attended = {int(team): list(codes) for team, codes in data["attended"].items()}
+        return cls(data["eventCode"], event, alliances, results, attended)
+
+def merge_event_results(results: Iterable[EventResult], year) -> Season:
+    """
+    Build the Season that get_season returns from per-event results: every
+    team keeps its best per-event OPR, alliances and match results are
+    combined, and eventsAttended is rebuilt from all events.
+    :param results: (iterable) EventResults.
+    :param year: (int) Season year.
+    :return: (Season)
+    """
+    season = Season(seasonCode=year)
+    match_maker = MatchMaker()
+    events_attended = {}
+    for result in results:
+        if result.event is not None:
+            season.events[result.eventCode] = result.event
+            for team in result.event.teams:
+                existing = season.teams.get(team.teamNumber)
+                if not existing or team.overallOPR > existing.overallOPR:
+                    season.teams[team.teamNumber] = team
+        match_maker.matches_data.update(result.alliances)
+        for match in result.results:
+            match_maker.match_results[match.matchKey] = match
+        for team, codes in result.attended.items():
+            events_attended.setdefault(team, set()).update(codes)
+
+    for team_number, team in season.teams.items():
+        team.eventsAttended = sorted(events_attended.get(team_number, []))
+    season.matches = match_maker.get_all_matches()
+    season.results = match_maker.get_match_results()
+    return season
+
+def _team_dict(team):
+    data = asdict(team)
+    events = data["eventsAttended"]
+    data["eventsAttended"] = sorted(events) if isinstance(events, (list, set, tuple)) else []
+    return {k: (float(v) if hasattr(v, "dtype") else v) for k, v in data.items()}
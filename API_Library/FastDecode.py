@@ -0,0 +1,118 @@
+import json
+from dataclasses import fields, is_dataclass
+from functools import lru_cache
+from typing import List, Union, get_args, get_origin, get_type_hints
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+class FastDecode:
+    """
+    Schema-driven JSON decoding straight into the slotted records in
+    API_Models.Records.
+
+    When msgspec is installed the record dataclasses are used as its schema,
+    so the payload is parsed into records in a single C pass that skips every
+    field the records do not declare. Without msgspec the payload is parsed
+    with the standard json module and converted by a per-type converter
+    compiled once from the same dataclass fields, which checks values against
+    the declared types like msgspec does, so both paths produce the same
+    records and reject the same payloads (with a ValueError).
+
+    Example usage:
+    --------------
+    payload = FastDecode.decode(response.content, MatchesPayload)
+    for match in payload.matches:
+        print(match.matchNumber, match.scoreRedFinal)
+    """
+    @staticmethod
+    def available():
+        """
+        :return: (bool) True when the msgspec fast path is in use.
+        """
+        return msgspec is not None
+
+    @staticmethod
+    def decode(content, record_type):
+        """
+        Decode a JSON document into record_type.
+        :param content: (bytes | str) Raw JSON.
+        :param record_type: (type) Dataclass describing the payload.
+        :return: An instance of record_type.
+        """
+        if msgspec is not None:
+            return _msgspec_decoder(record_type).decode(content)
+        return _converter(record_type)(json.loads(content))
+
+    @staticmethod
+    def from_dict(data, record_type):
+        """
+        Convert an already parsed JSON object into record_type.
+        :param data: (dict) Parsed JSON.
+        :param record_type: (type) Dataclass describing the payload.
+        :return: An instance of record_type.
+        """
+        if msgspec is not None:
+            return msgspec.convert(data, record_type)
+        return _converter(record_type)(data)
+
+@lru_cache(maxsize=None)
+def _msgspec_decoder(record_type):
+    return msgspec.json.Decoder(record_type)
+
+@lru_cache(maxsize=None)
+def _converter(tp):
+    """
+    Compile a function converting parsed JSON into tp. Values are checked against
+    the declared types the way msgspec does: ints are accepted for floats, None
+    only for Optional fields, and anything else raises ValueError.
+    """
+    if is_dataclass(tp):
+        hints = get_type_hints(tp)
+        converters = [(f.name, _converter(hints[f.name])) for f in fields(tp)]
+
+        def convert_record(data):
+            if not isinstance(data, dict):
+                raise ValueError(f"Expected an object for {tp.__name__}, got {type(data).__name__}")
+            values = {}
+            for name, convert in converters:
+                if name in data:
+                    try:
+                        values[name] = convert(data[name])
+                    except ValueError as e:
+                        raise ValueError(f"{tp.__name__}.{name}: {e}") from None
+            return tp(**values)
+        return convert_record
+
+    origin, args = get_origin(tp), get_args(tp)
+    if origin in (list, List):
+        convert_item = _converter(args[0])
+
+        def convert_list(values):
+            if not isinstance(values, list):
+                raise ValueError(f"Expected an array, got {type(values).__name__}")
+            return [convert_item(value) for value in values]
+        return convert_list
+
+    if origin is Union and type(None) in args:
+        inner = [arg for arg in args if arg is not type(None)]
+        convert_value = _converter(inner[0]) if len(inner) == 1 else (lambda value: value)
+        return lambda value: None if value is None else convert_value(value)
+
+    if tp is float:
+        def convert_float(value):
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise ValueError(f"Expected a number, got {value!r}")
+            return float(value)
+        return convert_float
+
+    if tp in (int, str, bool):
+        def convert_scalar(value):
+            if not isinstance(value, tp) or (tp is int and isinstance(value, bool)):
+                raise ValueError(f"Expected {tp.__name__}, got {value!r}")
+            return value
+        return convert_scalar
+
+    return lambda value: value
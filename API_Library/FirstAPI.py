@@ -1,25 +1,33 @@
 import os
 import re
+import threading
 
-import requests
 from API_Library.MatchMaker import MatchMaker
 from API_Library.APIClient import APIClient
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, TimeoutError, as_completed
+from API_Library.EventResults import EventResult, merge_event_results
 from API_Library.APIParams import APIParams
 from API_Library.API_Models.Team import Team
 from API_Library.API_Models.Event import Event
 from API_Library.API_Models.Season import Season
-from API_Library.RobotMath import MatrixBuilder, MatrixMath as mm
+from API_Library.API_Models.Records import MatchesPayload, RankingsPayload, ScoresPayload, SchedulePayload
 from datetime import datetime, timedelta, timezone
-from dateutil import parser
-from datetime import datetime
-from tqdm import tqdm
 
-from API_Library.YearAdapters import DEFAULT_SCORE_ADAPTER, SCORE_ADAPTERS
+# requests, tqdm, dateutil, numpy (RobotMath) and the score adapters are imported
+# inside the methods that use them, so importing this module stays cheap for the
+# ManageDatabase relaunch in update_database.sh.
+
+class _EventAbandoned(Exception):
+    """Raised inside an event fetch that missed the cycle deadline, to stop it between requests."""
 
 class FirstAPI:
-    def __init__(self):
-        self.client = APIClient("https://ftc-api.firstinspires.org/v2.0")
+    BASE_URL = "https://ftc-api.firstinspires.org/v2.0"
+    LOGO_URL = "https://ftc-scoring.firstinspires.org/avatars/composed/2025.css"
+
+    def __init__(self, base_url=BASE_URL, logo_url=LOGO_URL, connect_timeout=5.0, read_timeout=30.0, hedge_budget=0.05):
+        self.client = APIClient(base_url, connect_timeout=connect_timeout, read_timeout=read_timeout,
+                                hedge_budget=hedge_budget)
+        self.logo_url = logo_url
         self.events_attended = {}
 
     def get_season_events(self, year: int):
@@ -34,12 +42,13 @@ class FirstAPI:
         yesterday = today - timedelta(days=7)
         params = APIParams(path_segments=[year, 'events'])
         response = self.client.api_request(params)
+        from dateutil import parser
         return [event.get("code") for event in response.get('events', []) if parser.isoparse(event.get("dateStart")).date() >= yesterday]
 
     def get_team_logos(self) -> dict[int, str]:
-        url = "https://ftc-scoring.firstinspires.org/avatars/composed/2025.css"
+        import requests
         try:
-            response = requests.get(url)
+            response = requests.get(self.logo_url)
             response.raise_for_status()
             css = response.text
 
@@ -57,51 +66,118 @@ class FirstAPI:
             if logo:
                 team.teamLogo = logo
                 
-    def get_season(self, year=None, debug=False, events="Future"):
+    def select_events(self, year=None, events="Future"):
         year = year or self.find_year()
         if events == "All":
-            events = self.get_season_events(year=year)
-        else:
-            events = self.get_future_season_events(year=year)
-        season = Season(seasonCode=year)
-        match_maker = MatchMaker()
+            return self.get_season_events(year=year)
+        return self.get_future_season_events(year=year)
+
+    def get_season(self, year=None, debug=False, events="Future", deadline=None, event_cache=None):
+        """
+        Fetch and solve every selected event.
+        :param deadline: (float, optional) Seconds the whole fetch may take. Events still running
+            then are left behind and reported in season.laggards.
+        :param event_cache: (EventResultCache, optional) Stores every finished event and supplies the
+            last known result of laggards and failed events (listed in season.fallbacks).
+        :return: (Season)
+
+        Laggards are told to stop and give up before their next API request, so they outlive the
+        deadline by at most one request: connect + read timeout per attempt, times the client's
+        retries. Their worker threads are not daemons, so interpreter exit waits that long at most.
+        """
+        year = year or self.find_year()
+        events = self.select_events(year=year, events=events)
 
-        progress_bar = tqdm(total=len(events), desc="Processing Events", unit=" event") if debug else None
+        progress_bar = None
+        if debug:
+            from tqdm import tqdm
+            progress_bar = tqdm(total=len(events), desc="Processing Events", unit=" event")
 
         max_threads = min(128, os.cpu_count() * 8)
-        with ThreadPoolExecutor(max_threads) as executor:
-            futures = [executor.submit(self.fetch_event_data_thread, event, year, season, progress_bar, match_maker, self.events_attended) for event in events]
-            for future in as_completed(futures):
-                future.result()
-                
-        season.matches = match_maker.get_all_matches()
+        executor = ThreadPoolExecutor(max_threads)
+        stop = threading.Event()
+        futures = {executor.submit(self.fetch_event_result, event, year, stop): event for event in events}
+        results, finished = {}, set()
+        try:
+            for future in as_completed(futures, timeout=deadline):
+                event = futures[future]
+                finished.add(event)
+                if future.result() is not None:
+                    results[event] = future.result()
+                if progress_bar:
+                    progress_bar.update(1)
+        except TimeoutError:
+            pass
+        # Laggards stop before their next request; they only ever write to their own EventResult,
+        # which is dropped, and never to state shared with the next season.
+        stop.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+        for result in results.values():
+            for team, codes in result.attended.items():
+                self.events_attended.setdefault(team, set()).update(codes)
+
+        laggards = [event for event in events if event not in finished]
+        missing = [event for event in events if event not in results]
+        fallbacks = {}
+        if event_cache is not None:
+            event_cache.save(results.values())
+            fallbacks = event_cache.load(missing)
+
+        season = merge_event_results([*results.values(), *fallbacks.values()], year)
+        season.laggards = laggards
+        season.fallbacks = sorted(fallbacks)
 
         if progress_bar:
             progress_bar.close()
+        if laggards:
+            print(f"⏰ {len(laggards)} events missed the {deadline:g}s deadline: {', '.join(laggards)}")
+        if missing:
+            print(f"↩️ Using last known results for {len(fallbacks)} of {len(missing)} unfinished events")
+        if debug:
+            stats = self.client.stats
+            print(f"🔁 {stats['requests']} API calls, {stats['network']} sent, {stats['coalesced']} coalesced, "
+                  f"{stats['hedged']} hedged ({stats['hedge_wins']} hedges answered first)")
 
         return season
 
-    def fetch_event_data_thread(self, event, year, season, progress_bar, match_maker, events_attended):
+    def fetch_event_result(self, event, year, stop=None):
+        """
+        Process one event in isolation. Touches no shared state, so it is safe to abandon.
+        :param stop: (threading.Event, optional) When set, the fetch gives up before its next API request.
+        :return: (EventResult | None) None when the event could not be processed.
+        """
+        season, match_maker, events_attended = Season(seasonCode=year), MatchMaker(), {}
+        if not self.fetch_event_data_thread(event, year, season, None, match_maker, events_attended, stop=stop):
+            return None
+        return EventResult.collect(event, season, match_maker, events_attended)
+
+    def fetch_event_data_thread(self, event, year, season, progress_bar, match_maker, events_attended, stop=None):
+        def check_stop():
+            if stop is not None and stop.is_set():
+                raise _EventAbandoned()
+
         try:
             event_data = self.get_event_data(event, year)
-            endgame_stats = self.get_endgame_stats(event, year)
-            penalties = self.get_penalties(event, year)
+            check_stop()
+            match_scores = self.get_match_scores(event, year)
+            endgame_stats = self.get_endgame_stats(event, year, match_scores=match_scores)
+            penalties = self.get_penalties(event, year, match_scores=match_scores)
             match_maker.save_matches_for_event(event, event_data)
             if event_data:
                 modified_on_match_data = {}
                 for match, endgame, penalty in zip(event_data, endgame_stats, penalties):
-                    match.update({
-                        "scoreRedEndgame": endgame["red"],
-                        "scoreBlueEndgame": endgame["blue"],
-                        "penaltyPointsRed": penalty["red"],
-                        "penaltyPointsBlue": penalty["blue"]
-                    })
-                    for team in match['teams']:
-                        team_number = team['teamNumber']
+                    match.scoreRedEndgame = endgame["red"]
+                    match.scoreBlueEndgame = endgame["blue"]
+                    match.penaltyPointsRed = penalty["red"]
+                    match.penaltyPointsBlue = penalty["blue"]
+                    for team in match.teams:
+                        team_number = team.teamNumber
                         events_attended.setdefault(team_number, set()).add(event)
-                        modified_on_match_data.setdefault(team_number, match.get('modifiedOn', 'Unknown'))
+                        modified_on_match_data.setdefault(team_number, match.modifiedOn or 'Unknown')
+
+                from API_Library.RobotMath import MatrixBuilder, MatrixMath as mm
 
-                adapter = SCORE_ADAPTERS.get(year, DEFAULT_SCORE_ADAPTER)
+                adapter = self.score_adapter(year)
                 if hasattr(adapter, "map_matches"):
                     matches = adapter.map_matches(event_data) 
                 else:
@@ -114,8 +190,14 @@ class FirstAPI:
                     for metric in ["auto", "tele", "endgame", "penalties"]
                 }
 
+                overall_matrix = matrix_builder.auto_matrix + matrix_builder.tele_matrix
+                overall_opr = team_opr_values["auto"] + team_opr_values["tele"]
+                overall_errors = mm.standard_errors(matrix_builder.binary_matrix, overall_matrix, overall_opr)
+
                 event_obj = Event(eventCode=event)
+                event_obj.residualVariance = mm.residual_variance(matrix_builder.binary_matrix, overall_matrix, overall_opr)
                 for team in matrix_builder.teams:
+                    check_stop()
                     team_idx = matrix_builder.team_indices[team]
                     team_info = self.get_team_info(team, year)
                     team_info.teamNumber = team
@@ -123,18 +205,30 @@ class FirstAPI:
                     team_info.teleOPR = team_opr_values["tele"][team_idx]
                     team_info.endgameOPR = team_opr_values["endgame"][team_idx]
                     team_info.overallOPR = team_info.autoOPR + team_info.teleOPR
+                    team_info.overallOPRError = float(overall_errors[team_idx])
                     team_info.penalties = team_opr_values["penalties"][team_idx]
                     team_info.eventDate = modified_on_match_data.get(team)
                     event_obj.teams.append(team_info)
 
+                # Rankings only feed averagePlace, so an event whose rankings are not served yet keeps its OPRs.
+                check_stop()
+                try:
+                    event_obj.rankings = self.get_event_rankings(event, year)
+                except Exception as e:
+                    print(f"No rankings for event {event}: {e}")
+
                 season.events[event] = event_obj
                 for new_team in event_obj.teams:
                     existing = season.teams.get(new_team.teamNumber)
                     if not existing or new_team.overallOPR > existing.overallOPR:
                         season.teams[new_team.teamNumber] = new_team
 
+            return True
+        except _EventAbandoned:
+            return False
         except Exception as e:
             print(f"Error processing event {event}: {e}")
+            return False
         finally:
             if progress_bar:
                 progress_bar.update(1)
@@ -142,37 +236,94 @@ class FirstAPI:
     def get_event_data(self, eventCode, year=None):
         year = year or self.find_year()
         params = APIParams(path_segments=[year, 'matches', eventCode])
-        response = self.client.api_request(params)
-        return response.get('matches', [])
+        return self.client.api_request(params, record_type=MatchesPayload).matches
     
-    def get_endgame_stats(self, eventCode, year=None):
+    def get_event_rankings(self, eventCode, year=None):
+        """
+        :return: (dict) teamNumber -> current rank at the event, empty before rankings are published.
+        """
+        year = year or self.find_year()
+        params = APIParams(path_segments=[year, 'rankings', eventCode])
+        rankings = self.client.api_request(params, record_type=RankingsPayload).rankings
+        return {r.teamNumber: r.rank for r in rankings if r.teamNumber and r.rank}
+
+    def get_event_schedule(self, eventCode, year=None, tournamentLevel='qual'):
+        year = year or self.find_year()
+        params = APIParams(path_segments=[year, 'schedule', eventCode], query_params={'tournamentLevel': tournamentLevel})
+        return self.client.api_request(params, record_type=SchedulePayload).schedule
+
+    def simulate_event(self, eventCode, year=None, season=None, num_sims=20000, workers=None, seed=None):
+        """
+        Simulate the rest of an event.
+        :param season: (Season, optional) Season OPRs and residual variances, from get_season. Needed for an
+            event without played matches; teams missing from it are predicted at the season mean.
+        :return: (SimulationResult)
+        """
+        year = year or self.find_year()
+        from API_Library.RobotMath import EventSimulator, MatchPredictor
+
+        results = self.get_event_data(eventCode, year)
+        schedule = self.get_event_schedule(eventCode, year)
+        event_obj = self.event_overall_opr(eventCode, year, results)
+        predictor = MatchPredictor.from_season(season or Season(seasonCode=year), event_obj)
+        simulator = EventSimulator(schedule, predictor, results)
+        return simulator.simulate(num_sims, workers=workers, seed=seed)
+
+    def event_overall_opr(self, eventCode, year, event_data):
+        """
+        Overall OPRs and residual variance of the matches played so far, without the team-info lookups.
+        :return: (Event) Teams carry only teamNumber and overallOPR; no teams when nothing was played.
+        """
+        event_obj = Event(eventCode=eventCode)
+        if not event_data:
+            return event_obj
+        from API_Library.RobotMath import MatrixBuilder, MatrixMath as mm
+
+        adapter = self.score_adapter(year)
+        matches = adapter.map_matches(event_data) if hasattr(adapter, "map_matches") else event_data
+        matrix_builder = MatrixBuilder(matches)
+        overall_matrix = matrix_builder.auto_matrix + matrix_builder.tele_matrix
+        overall_opr = mm.LSE(matrix_builder.binary_matrix, overall_matrix)
+        event_obj.residualVariance = mm.residual_variance(matrix_builder.binary_matrix, overall_matrix, overall_opr)
+        event_obj.teams = [
+            Team(teamNumber=team, overallOPR=float(overall_opr[matrix_builder.team_indices[team]]))
+            for team in matrix_builder.teams
+        ]
+        return event_obj
+
+    def get_match_scores(self, eventCode, year=None):
         year = year or self.find_year()
         params = APIParams(path_segments=[year, 'scores', eventCode, 'qual'])
-        response = self.client.api_request(params)
+        return self.client.api_request(params, record_type=ScoresPayload).matchScores
+
+    def get_endgame_stats(self, eventCode, year=None, match_scores=None):
+        year = year or self.find_year()
+        if match_scores is None:
+            match_scores = self.get_match_scores(eventCode, year)
 
-        adapter = SCORE_ADAPTERS.get(year, DEFAULT_SCORE_ADAPTER)
+        adapter = self.score_adapter(year)
         result = []
-        for match in response.get('matchScores', []):
+        for match in match_scores:
             red, blue = adapter.endgame_points(match)
             result.append({
-                "matchNumber": match["matchNumber"],
+                "matchNumber": match.matchNumber,
                 "red": red,
                 "blue": blue
             })
 
         return result
 
-    def get_penalties(self, eventCode, year=None):
+    def get_penalties(self, eventCode, year=None, match_scores=None):
         year = year or self.find_year()
-        params = APIParams(path_segments=[year, 'scores', eventCode, 'qual'])
-        response = self.client.api_request(params)
+        if match_scores is None:
+            match_scores = self.get_match_scores(eventCode, year)
 
-        adapter = SCORE_ADAPTERS.get(year, DEFAULT_SCORE_ADAPTER)
+        adapter = self.score_adapter(year)
         result = []
-        for match in response.get('matchScores', []):
+        for match in match_scores:
             red, blue = adapter.penalties(match)
             result.append({
-                "matchNumber": match["matchNumber"],
+                "matchNumber": match.matchNumber,
                 "red": red,
                 "blue": blue
             })
@@ -195,9 +346,16 @@ class FirstAPI:
         )
         return team
     
+    @staticmethod
+    def score_adapter(year):
+        from API_Library.YearAdapters import DEFAULT_SCORE_ADAPTER, SCORE_ADAPTERS
+        return SCORE_ADAPTERS.get(year, DEFAULT_SCORE_ADAPTER)
+
     @staticmethod
     def find_year(date = datetime.now()) -> int:
-        date = date if isinstance(date, datetime) else parser.isoparse(date)
+        if not isinstance(date, datetime):
+            from dateutil import parser
+            date = parser.isoparse(date)
         return date.year - 1 if date.month < 8 else date.year
 
 def main():
@@ -1,11 +1,13 @@
 import hashlib
-from typing import Dict
-from API_Library.API_Models.Event import Alliance
+from typing import Dict, List
+from API_Library.API_Models.Event import Alliance, MatchResult
+from API_Library.API_Models.Records import MatchRecord
 from API_Library.API_Models.Team import Team
 
 class MatchMaker:
     def __init__(self):
         self.matches_data: Dict[str, Alliance] = {}
+        self.match_results: Dict[str, MatchResult] = {}
 
     def generate_hash(self, event: str, alliance: Alliance) -> str:
         t1 = alliance.team1
@@ -16,15 +18,18 @@ class MatchMaker:
 
     def get_all_matches(self) -> Dict[str, Alliance]:
         return self.matches_data
+
+    def get_match_results(self) -> List[MatchResult]:
+        """ Played matches in chronological order; matches without a start time come last."""
+        return sorted(self.match_results.values(), key=lambda r: (r.date is None, r.date or "", r.matchKey))
     
     def pick_two_any(self, teams, color: str):
         """ Picks two teams from the given list of teams based on the specified color ('red' or 'blue')."""
         color = color.lower()
         out, seen = [], set()
         for t in teams or []:
-            st = str(t.get('station','')).lower()
-            if st.startswith(color):
-                n = int(t.get('teamNumber', 0) or 0)
+            if t.station.lower().startswith(color):
+                n = int(t.teamNumber or 0)
                 if n not in seen:
                     out.append(n); seen.add(n)
                 if len(out) == 2:
@@ -33,25 +38,27 @@ class MatchMaker:
             out.append(0)
         return out[0], out[1]
     
-    def save_matches_for_event(self, event, eventData):
+    def save_matches_for_event(self, event, eventData: List[MatchRecord]):
         if not eventData:
             return self.matches_data
 
         for match in eventData:
-            teams = match.get('teams') or []
-            r1, r2 = self.pick_two_any(teams, 'red')
-            b1, b2 = self.pick_two_any(teams, 'blue')
+            r1, r2 = self.pick_two_any(match.teams, 'red')
+            b1, b2 = self.pick_two_any(match.teams, 'blue')
+            red_final, blue_final = int(match.scoreRedFinal), int(match.scoreBlueFinal)
+            date = match.actualStartTime if match.actualStartTime is not None else 'Unknown'
+            matchType = match.tournamentLevel or 'Unknown'
 
             redAlliance = Alliance(
                 color='red',
                 team1=Team(teamNumber=r1),
                 team2=Team(teamNumber=r2),
-                combined_overallOPR=int(match.get('scoreRedFinal', 0)),
-                date=match.get('actualStartTime', 'Unknown'),
-                win=int(match.get('scoreRedFinal', 0)) > int(match.get('scoreBlueFinal', 0)),
-                tele=int(match.get('scoreRedFinal', 0)) - int(match.get('scoreRedAuto', 0)) - int(match.get('scoreBlueFoul', 0)),
-                penalty=int(match.get('scoreRedFoul', 0)),
-                matchType=match.get('tournamentLevel', 'Unknown'),
+                combined_overallOPR=red_final,
+                date=date,
+                win=red_final > blue_final,
+                tele=red_final - int(match.scoreRedAuto) - int(match.scoreBlueFoul),
+                penalty=int(match.scoreRedFoul),
+                matchType=matchType,
                 skip=True,
             )
 
@@ -59,16 +66,26 @@ class MatchMaker:
                 color='blue',
                 team1=Team(teamNumber=b1),
                 team2=Team(teamNumber=b2),
-                combined_overallOPR=int(match.get('scoreBlueFinal', 0)),
-                date=match.get('actualStartTime', 'Unknown'),
-                win=int(match.get('scoreBlueFinal', 0)) > int(match.get('scoreRedFinal', 0)),
-                tele=int(match.get('scoreBlueFinal', 0)) - int(match.get('scoreBlueAuto', 0)) - int(match.get('scoreRedFoul', 0)),
-                penalty=int(match.get('scoreBlueFoul', 0)),
-                matchType=match.get('tournamentLevel', 'Unknown'),
+                combined_overallOPR=blue_final,
+                date=date,
+                win=blue_final > red_final,
+                tele=blue_final - int(match.scoreBlueAuto) - int(match.scoreRedFoul),
+                penalty=int(match.scoreBlueFoul),
+                matchType=matchType,
                 skip=True,
             )
             
             self.matches_data[self.generate_hash(event, redAlliance)] = redAlliance
             self.matches_data[self.generate_hash(event, blueAlliance)] = blueAlliance
+
+            match_key = f"{event}-{matchType}-{match.series}-{match.matchNumber}"
+            self.match_results[match_key] = MatchResult(
+                matchKey=match_key,
+                date=match.actualStartTime,
+                redTeams=(r1, r2),
+                blueTeams=(b1, b2),
+                redScore=red_final,
+                blueScore=blue_final,
+            )
             
         return self.matches_data
@@ -0,0 +1,149 @@
+import os
+
+import numpy as np
+
+class EloEngine:
+    '''
+    Streaming Alliance-Aware Elo Ratings
+
+    Consumes MatchResults in chronological order with constant work per match, so
+    unlike MatrixMath.LSE nothing is re-solved and strength carries across events. An
+    alliance's rating is the mean of its teams' ratings; the expected red score is
+    E = 1 / (1 + 10^((R_blue - R_red) / scale)) and every red team moves by
+    k * (S - E) (S = 1, 0.5 or 0), every blue team by the opposite amount.
+
+    Ratings and match counts live in flat arrays indexed through a team -> slot dict.
+    The state, including the keys of every match already applied, is checkpointed to
+    an .npz file so each cycle only processes new matches.
+
+    Example usage:
+    --------------
+    from RobotMath import EloEngine
+
+    engine = EloEngine.load('ares_elo.npz')
+    engine.update(season.results)
+    engine.save('ares_elo.npz')
+    print(engine.rating(16379))
+    '''
+    def __init__(self, k_factor=32.0, initial=1500.0, scale=400.0):
+        '''
+        Parameters
+        ----------
+        k_factor : float
+            Maximum rating change of a single match.
+        initial : float
+            Rating of a team the engine has not seen.
+        scale : float
+            Rating difference at which the stronger alliance is expected to win 10:1.
+        '''
+        self.k_factor = float(k_factor)
+        self.initial = float(initial)
+        self.scale = float(scale)
+        self.team_index = {}
+        self.team_numbers = np.zeros(0, dtype=np.int64)
+        self.ratings = np.zeros(0, dtype=np.float64)
+        self.matches_played = np.zeros(0, dtype=np.int32)
+        self.processed = set()
+
+    def _slot(self, team_number):
+        slot = self.team_index.get(team_number)
+        if slot is None:
+            slot = len(self.team_index)
+            if slot == len(self.ratings):
+                # Grow geometrically so adding teams stays amortized O(1).
+                size = max(64, 2 * len(self.ratings))
+                self.team_numbers = np.resize(self.team_numbers, size)
+                self.ratings = np.resize(self.ratings, size)
+                self.matches_played = np.resize(self.matches_played, size)
+            self.team_index[team_number] = slot
+            self.team_numbers[slot] = team_number
+            self.ratings[slot] = self.initial
+            self.matches_played[slot] = 0
+        return slot
+
+    def expected(self, red_rating, blue_rating):
+        '''Expected score of the red alliance against the blue alliance.'''
+        return 1.0 / (1.0 + 10.0 ** ((blue_rating - red_rating) / self.scale))
+
+    def update(self, results):
+        '''
+        Apply match results that have not been applied before.
+
+        Parameters
+        ----------
+        results : iterable
+            MatchResults in chronological order (MatchMaker.get_match_results).
+
+        Returns
+        -------
+        applied : int
+            Number of new matches.
+        '''
+        applied = 0
+        for result in results:
+            if result.matchKey in self.processed:
+                continue
+            red = [self._slot(n) for n in result.redTeams if n]
+            blue = [self._slot(n) for n in result.blueTeams if n]
+            self.processed.add(result.matchKey)
+            if not red or not blue:
+                continue
+            ratings = self.ratings  # read after _slot, which may have grown the array
+
+            red_rating = sum(ratings[i] for i in red) / len(red)
+            blue_rating = sum(ratings[i] for i in blue) / len(blue)
+            outcome = 1.0 if result.redScore > result.blueScore else 0.5 if result.redScore == result.blueScore else 0.0
+            delta = self.k_factor * (outcome - self.expected(red_rating, blue_rating))
+            for i in red:
+                ratings[i] += delta
+                self.matches_played[i] += 1
+            for i in blue:
+                ratings[i] -= delta
+                self.matches_played[i] += 1
+            applied += 1
+        return applied
+
+    def rating(self, team_number):
+        '''Current rating of a team, the initial rating if it has not played.'''
+        slot = self.team_index.get(team_number)
+        return float(self.ratings[slot]) if slot is not None else self.initial
+
+    def get_ratings(self):
+        '''teamNumber -> rating of every team that has played.'''
+        count = len(self.team_index)
+        return dict(zip(self.team_numbers[:count].tolist(), self.ratings[:count].tolist()))
+
+    def save(self, path):
+        '''
+        Checkpoint the state to an .npz file. The file is written next to the target and
+        renamed over it, so a crash never leaves a half-written checkpoint.
+        '''
+        count = len(self.team_index)
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            np.savez_compressed(
+                f,
+                params=np.array([self.k_factor, self.initial, self.scale]),
+                team_numbers=self.team_numbers[:count],
+                ratings=self.ratings[:count],
+                matches_played=self.matches_played[:count],
+                processed=np.array(sorted(self.processed), dtype=str),
+            )
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path, **kwargs):
+        '''
+        Restore an engine from a checkpoint, or start a fresh one when the file does not exist.
+        Keyword arguments are passed to the constructor of a fresh engine.
+        '''
+        if not path or not os.path.exists(path):
+            return cls(**kwargs)
+        with np.load(path) as data:
+            engine = cls(*data["params"].tolist())
+            engine.team_numbers = data["team_numbers"].astype(np.int64)
+            engine.ratings = data["ratings"].astype(np.float64)
+            engine.matches_played = data["matches_played"].astype(np.int32)
+            engine.processed = set(data["processed"].tolist())
+        engine.team_index = {n: i for i, n in enumerate(engine.team_numbers.tolist())}
+        return engine
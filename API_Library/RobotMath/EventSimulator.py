@@ -0,0 +1,199 @@
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from .MatchPredictor import schedule_alliances
+
+@dataclass
+class SimulationResult:
+    '''
+    Aggregated outcome of an EventSimulator run.
+
+    Attributes:
+        team_numbers (np.ndarray): Teams in the order of the rows of rank_counts.
+        rank_counts (np.ndarray): (T, T) counts; rank_counts[i, r] is how often team i finished at rank r + 1.
+        num_sims (int): Number of simulations.
+        alliances (List[Counter]): Per alliance seed, counts of (captain, pick) team-number pairs.
+    '''
+    team_numbers: np.ndarray
+    rank_counts: np.ndarray
+    num_sims: int
+    alliances: List[Counter] = field(default_factory=list)
+
+    def rank_probabilities(self) -> np.ndarray:
+        '''(T, T) probability of each team finishing at each rank.'''
+        return self.rank_counts / max(self.num_sims, 1)
+
+    def expected_ranks(self) -> Dict[int, float]:
+        '''Mean final rank per team number.'''
+        ranks = np.arange(1, len(self.team_numbers) + 1)
+        means = self.rank_probabilities() @ ranks
+        return {int(n): float(m) for n, m in zip(self.team_numbers, means)}
+
+    def likely_alliances(self, top=3) -> List[List[Tuple[Tuple[int, int], float]]]:
+        '''For every alliance seed, the `top` most frequent (captain, pick) pairs with their probability.'''
+        return [
+            [(pair, count / self.num_sims) for pair, count in counter.most_common(top)]
+            for counter in self.alliances
+        ]
+
+    def merge(self, other: "SimulationResult") -> "SimulationResult":
+        alliances = [a + b for a, b in zip(self.alliances, other.alliances)] if self.alliances else other.alliances
+        return SimulationResult(self.team_numbers, self.rank_counts + other.rank_counts,
+                                self.num_sims + other.num_sims, alliances)
+
+class EventSimulator:
+    '''
+    Monte Carlo Event Simulator
+
+    Projects final qualification rankings and playoff alliances for an event. Every
+    simulation draws each unplayed match's alliance scores from Normal(OPR sum, residual
+    variance) using a MatchPredictor, keeps the real result of matches already played, awards
+    ranking points and ranks the teams by average ranking points, then average score. All
+    simulations of a chunk are computed together as (sims x matches) arrays; chunks can be
+    spread across a process pool.
+
+    Alliance selection is modelled simply: the highest-ranked team still available captains
+    the next alliance and picks the available team with the highest OPR.
+
+    Example usage:
+    --------------
+    from RobotMath import EventSimulator, MatchPredictor
+
+    schedule = first_api.get_event_schedule('USCALAQ1')
+    results = first_api.get_event_data('USCALAQ1')
+    predictor = MatchPredictor.from_season(season, season.events.get('USCALAQ1'))
+    outcome = EventSimulator(schedule, predictor, results).simulate(20000, workers=4)
+    print(outcome.expected_ranks())
+    '''
+    def __init__(self, schedule, predictor, results=None, num_alliances=None, win_points=2, tie_points=1):
+        '''
+        Parameters
+        ----------
+        schedule : list
+            Qualification MatchRecords with teams and stations.
+        predictor : MatchPredictor
+            OPRs and residual variance used for unplayed matches.
+        results : list, optional
+            MatchRecords of matches already played (get_event_data); their scores are kept as is.
+        num_alliances : int, optional
+            Number of playoff alliances, defaults to 4 (2 for events with fewer than 10 teams).
+        win_points, tie_points : int
+            Ranking points for a win and a tie.
+        '''
+        schedule = [m for m in schedule if _is_qualification(m)]
+        played = {m.matchNumber: m for m in (results or []) if _is_qualification(m)}
+        red, blue = schedule_alliances(schedule)
+
+        self.team_numbers = np.unique(np.concatenate([red.ravel(), blue.ravel()]))
+        self.team_numbers = self.team_numbers[self.team_numbers != 0]
+        num_teams = len(self.team_numbers)
+        self.num_alliances = num_alliances or (4 if num_teams >= 10 else 2)
+        self.win_points = win_points
+        self.tie_points = tie_points
+
+        self.red_mean = predictor.lookup(red).sum(axis=1)
+        self.blue_mean = predictor.lookup(blue).sum(axis=1)
+        self.sigma = np.sqrt(max(predictor.variance, 0.0))
+        self.team_opr = predictor.lookup(self.team_numbers)
+
+        self.played = np.array([m.matchNumber in played for m in schedule], dtype=bool)
+        self.red_actual = np.array([played[m.matchNumber].scoreRedFinal if m.matchNumber in played else 0 for m in schedule], dtype=float)
+        self.blue_actual = np.array([played[m.matchNumber].scoreBlueFinal if m.matchNumber in played else 0 for m in schedule], dtype=float)
+
+        # (M, T) incidence matrices so per-team totals are a single matrix product per chunk.
+        self.red_incidence = np.zeros((len(schedule), num_teams))
+        self.blue_incidence = np.zeros((len(schedule), num_teams))
+        for incidence, alliance in ((self.red_incidence, red), (self.blue_incidence, blue)):
+            for slot in range(2):
+                known = alliance[:, slot] != 0
+                idx = np.searchsorted(self.team_numbers, alliance[known, slot])
+                np.add.at(incidence, (np.nonzero(known)[0], idx), 1)
+        self.matches_played = np.maximum(self.red_incidence.sum(axis=0) + self.blue_incidence.sum(axis=0), 1)
+
+    def simulate(self, num_sims=20000, workers=None, chunk_size=5000, seed=None):
+        '''
+        Run the simulations.
+
+        Parameters
+        ----------
+        num_sims : int
+            Number of simulated events.
+        workers : int, optional
+            Processes to spread chunks over; None or 1 runs in this process, 0 uses every CPU.
+        chunk_size : int
+            Simulations per vectorized chunk, bounds memory to about chunk_size x matches floats.
+        seed : int, optional
+            Seed for reproducible results.
+
+        Returns
+        -------
+        result : SimulationResult
+        '''
+        sizes = [chunk_size] * (num_sims // chunk_size) + ([num_sims % chunk_size] if num_sims % chunk_size else [])
+        seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+        if workers == 0:
+            workers = os.cpu_count()
+
+        if workers and workers > 1 and len(sizes) > 1:
+            with ProcessPoolExecutor(min(workers, len(sizes))) as executor:
+                chunks = list(executor.map(_simulate_chunk, [self] * len(sizes), sizes, seeds))
+        else:
+            chunks = [self.simulate_chunk(size, s) for size, s in zip(sizes, seeds)]
+
+        result = chunks[0]
+        for chunk in chunks[1:]:
+            result = result.merge(chunk)
+        return result
+
+    def simulate_chunk(self, num_sims, seed):
+        '''Simulate num_sims events as one vectorized batch.'''
+        rng = np.random.default_rng(seed)
+        num_matches, num_teams = self.red_incidence.shape
+
+        red = self.red_mean + self.sigma * rng.standard_normal((num_sims, num_matches))
+        blue = self.blue_mean + self.sigma * rng.standard_normal((num_sims, num_matches))
+        red = np.where(self.played, self.red_actual, np.maximum(red, 0).round())
+        blue = np.where(self.played, self.blue_actual, np.maximum(blue, 0).round())
+
+        red_rp = np.where(red > blue, self.win_points, np.where(red == blue, self.tie_points, 0))
+        blue_rp = np.where(blue > red, self.win_points, np.where(red == blue, self.tie_points, 0))
+        ranking_points = (red_rp @ self.red_incidence + blue_rp @ self.blue_incidence) / self.matches_played
+        scores = (red @ self.red_incidence + blue @ self.blue_incidence) / self.matches_played
+
+        # Highest ranking points first, then highest average score, then a random tie-break.
+        order = np.lexsort((rng.random((num_sims, num_teams)), -scores, -ranking_points), axis=-1)
+        ranks = np.empty_like(order)
+        np.put_along_axis(ranks, order, np.arange(num_teams)[None, :].repeat(num_sims, axis=0), axis=-1)
+        flat = (np.arange(num_teams)[None, :] * num_teams + ranks).ravel()
+        rank_counts = np.bincount(flat, minlength=num_teams * num_teams).reshape(num_teams, num_teams)
+
+        return SimulationResult(self.team_numbers, rank_counts, num_sims, self._select_alliances(order))
+
+    def _select_alliances(self, order):
+        num_sims, num_teams = order.shape
+        available = np.ones((num_sims, num_teams), dtype=bool)
+        rows = np.arange(num_sims)
+        alliances = []
+        for _ in range(min(self.num_alliances, num_teams // 2)):
+            in_rank_order = np.take_along_axis(available, order, axis=1)
+            captain = order[rows, in_rank_order.argmax(axis=1)]
+            available[rows, captain] = False
+            pick = np.where(available, self.team_opr[None, :], -np.inf).argmax(axis=1)
+            available[rows, pick] = False
+
+            pairs, counts = np.unique(np.stack([captain, pick], axis=1), axis=0, return_counts=True)
+            alliances.append(Counter({
+                (int(self.team_numbers[c]), int(self.team_numbers[p])): int(n) for (c, p), n in zip(pairs, counts)
+            }))
+        return alliances
+
+def _simulate_chunk(simulator, num_sims, seed):
+    return simulator.simulate_chunk(num_sims, seed)
+
+def _is_qualification(match):
+    return match.tournamentLevel.upper().startswith("QUAL") or "Qualification" in match.description
@@ -0,0 +1,178 @@
+import numpy as np
+
+class MatchPredictor:
+    '''
+    Vectorized Match Predictor
+
+    Predicts alliance scores, margins and win probabilities for many matchups at once.
+    An alliance's predicted score is the sum of its two teams' overall OPRs; the score of
+    each alliance carries independent noise with the residual variance of the event's OPR
+    solve, so the margin is Normal(red - blue, 2 * variance) and
+    P(red wins) = Phi(margin / sqrt(2 * variance)).
+
+    Example usage:
+    --------------
+    from RobotMath import MatchPredictor
+
+    predictor = MatchPredictor.from_event(season.events['USCALAQ1'])
+    result = predictor.predict(np.array([[16379, 7303]]), np.array([[4042, 9999]]))
+    print(result["red_win_probability"])
+    '''
+    def __init__(self, team_numbers, opr, variance, default_opr=None):
+        '''
+        Parameters
+        ----------
+        team_numbers : array_like
+            Team numbers, one per OPR.
+        opr : array_like
+            Overall OPR of each team.
+        variance : float
+            Residual variance of a single alliance score.
+        default_opr : float, optional
+            OPR assumed for teams without one, defaults to the mean OPR.
+        '''
+        team_numbers = np.asarray(team_numbers, dtype=np.int64)
+        opr = np.asarray(opr, dtype=float)
+        order = np.argsort(team_numbers)
+        self.team_numbers = team_numbers[order]
+        self.opr = opr[order]
+        self.variance = float(variance)
+        self.default_opr = float(self.opr.mean()) if default_opr is None and len(self.opr) else float(default_opr or 0.0)
+
+    @classmethod
+    def from_teams(cls, teams, variance, default_opr=None):
+        '''Build a predictor from Team objects.'''
+        teams = list(teams)
+        return cls([t.teamNumber for t in teams], [t.overallOPR for t in teams], variance, default_opr)
+
+    @classmethod
+    def from_event(cls, event, default_opr=None):
+        '''Build a predictor from an Event's per-event OPRs and residual variance.'''
+        return cls.from_teams(event.teams, event.residualVariance, default_opr)
+
+    @classmethod
+    def from_season(cls, season, event=None, variance=None):
+        '''
+        Build a predictor from season OPRs, for events that have not been played yet.
+
+        Parameters
+        ----------
+        season : Season
+            Season whose teams supply each team's best OPR and whose events supply the
+            residual variance.
+        event : Event, optional
+            Event being predicted; its per-event OPRs replace the season ones and its
+            residual variance is used when it is positive.
+        variance : float, optional
+            Residual variance to fall back to, defaults to the mean over the season's events.
+
+        Returns
+        -------
+        predictor : MatchPredictor
+            Teams without an OPR get the season mean.
+        '''
+        opr = {t.teamNumber: t.overallOPR for t in season.teams.values() if t.teamNumber}
+        default_opr = float(np.mean(list(opr.values()))) if opr else None
+        if event is not None:
+            opr.update({t.teamNumber: t.overallOPR for t in event.teams if t.teamNumber})
+        if event is not None and event.residualVariance > 0:
+            variance = event.residualVariance
+        elif variance is None:
+            variances = [e.residualVariance for e in season.events.values() if e.residualVariance > 0]
+            variance = float(np.mean(variances)) if variances else 0.0
+        if not opr or variance <= 0:
+            raise ValueError("Season OPRs and a residual variance are needed to predict an unplayed event")
+        return cls(list(opr), list(opr.values()), variance, default_opr)
+
+    def lookup(self, team_numbers):
+        '''
+        Overall OPR for an array of team numbers, default_opr for unknown teams.
+        '''
+        team_numbers = np.asarray(team_numbers, dtype=np.int64)
+        if not len(self.team_numbers):
+            return np.full(team_numbers.shape, self.default_opr)
+        idx = np.clip(np.searchsorted(self.team_numbers, team_numbers), 0, len(self.team_numbers) - 1)
+        return np.where(self.team_numbers[idx] == team_numbers, self.opr[idx], self.default_opr)
+
+    def predict(self, red, blue):
+        '''
+        Predict a batch of matches.
+
+        Parameters
+        ----------
+        red : array_like
+            (N, 2) team numbers of the red alliances.
+        blue : array_like
+            (N, 2) team numbers of the blue alliances.
+
+        Returns
+        -------
+        result : dict
+            red_score, blue_score, margin (red - blue) and red_win_probability, each of shape (N,).
+        '''
+        red_score = self.lookup(red).sum(axis=-1)
+        blue_score = self.lookup(blue).sum(axis=-1)
+        margin = red_score - blue_score
+        return {
+            "red_score": red_score,
+            "blue_score": blue_score,
+            "margin": margin,
+            "red_win_probability": self.win_probability(margin),
+        }
+
+    def win_probability(self, margin):
+        '''P(red wins) for predicted margins, a step function when the variance is zero.'''
+        margin = np.asarray(margin, dtype=float)
+        if self.variance <= 0:
+            return np.where(margin > 0, 1.0, np.where(margin < 0, 0.0, 0.5))
+        return normal_cdf(margin / np.sqrt(2.0 * self.variance))
+
+    def predict_schedule(self, matches):
+        '''
+        Predict every match of a schedule.
+
+        Parameters
+        ----------
+        matches : list
+            MatchRecord objects (from get_event_data or get_event_schedule).
+
+        Returns
+        -------
+        result : dict
+            The arrays from predict plus match_number, in schedule order.
+        '''
+        red, blue = schedule_alliances(matches)
+        result = self.predict(red, blue)
+        result["match_number"] = np.array([m.matchNumber for m in matches], dtype=np.int64)
+        return result
+
+def schedule_alliances(matches):
+    '''
+    Extract (N, 2) red and blue team-number arrays from MatchRecords. Missing slots are 0.
+    '''
+    red = np.zeros((len(matches), 2), dtype=np.int64)
+    blue = np.zeros((len(matches), 2), dtype=np.int64)
+    for i, match in enumerate(matches):
+        r = b = 0
+        for team in match.teams:
+            station = team.station.lower()
+            if station.startswith("red") and r < 2:
+                red[i, r] = team.teamNumber or 0
+                r += 1
+            elif station.startswith("blue") and b < 2:
+                blue[i, b] = team.teamNumber or 0
+                b += 1
+    return red, blue
+
+def normal_cdf(z):
+    '''
+    Standard normal CDF, vectorized.
+
+    Uses the Abramowitz-Stegun 7.1.26 approximation of erf (absolute error < 1.5e-7),
+    which avoids a SciPy dependency.
+    '''
+    x = np.abs(np.asarray(z, dtype=float)) / np.sqrt(2.0)
+    t = 1.0 / (1.0 + 0.3275911 * x)
+    poly = t * (0.254829592 + t * (-0.284496736 + t * (1.421413741 + t * (-1.453152027 + t * 1.061405429))))
+    erf = 1.0 - poly * np.exp(-x * x)
+    return 0.5 * (1.0 + np.sign(z) * erf)
@@ -54,6 +54,110 @@ class MatrixMath:
         '''
         return np.linalg.lstsq(A, B, rcond=None)[0]
 
+    @staticmethod
+    def residual_variance(A: np.matrix, B: np.matrix, x: np.ndarray):
+        '''
+        Residual Variance
+
+        Estimates the variance of the alliance-score noise left over after a least-squares fit,
+        RSS / (m - n), counting only rows of A that have at least one team (playoff rows are all zero).
+
+        Parameters
+        ----------
+        A : np.matrix
+            Coefficient matrix used for the fit.
+        B : np.matrix
+            Ordinate values used for the fit.
+        x : np.ndarray
+            Least-squares solution, e.g. from LSE.
+
+        Returns
+        -------
+        variance : float
+            Residual variance per alliance score, 0.0 when there are no degrees of freedom.
+
+        Example
+        -------
+        >>> A = np.array([[1, 1, 0], [0, 1, 1], [1, 0, 1], [1, 1, 0]])
+        >>> B = np.array([10, 12, 8, 12])
+        >>> MatrixMath.residual_variance(A, B, MatrixMath.LSE(A, B))
+        2.0
+        '''
+        A = np.asarray(A, dtype=float)
+        used = A.any(axis=1)
+        residuals = np.asarray(B, dtype=float).reshape(len(A), -1)[used] - A[used] @ np.asarray(x, dtype=float).reshape(A.shape[1], -1)
+        dof = int(used.sum()) - np.linalg.matrix_rank(A[used]) if used.any() else 0
+        if dof <= 0:
+            return 0.0
+        return float((residuals ** 2).sum() / dof)
+
+    @staticmethod
+    def standard_errors(A: np.matrix, B: np.matrix, x: np.ndarray = None, num_resamples=500,
+                        max_condition=1e8, seed=None):
+        '''
+        OPR Standard Errors
+
+        Standard error of every entry of the least-squares solution. When A has full column rank
+        and AᵀA is well conditioned they are analytic, sqrt(σ² · diag((AᵀA)⁻¹)) with σ² the residual
+        variance. Otherwise (teams that always play together, very few matches) a residual bootstrap
+        is used: every resample adds resampled residuals to the fitted scores, and all resamples are
+        solved at once as the columns of a single multi-RHS least-squares problem.
+
+        Only the first column of B is used. The update cycle calls this for overall OPR alone, so
+        auto, tele and endgame OPRs carry no standard error.
+
+        Parameters
+        ----------
+        A : np.matrix
+            Coefficient matrix used for the fit.
+        B : np.matrix
+            Ordinate values used for the fit.
+        x : np.ndarray, optional
+            Least-squares solution, computed with LSE when omitted.
+        num_resamples : int
+            Bootstrap resamples for ill-conditioned systems.
+        max_condition : float
+            Largest condition number of AᵀA for which the analytic errors are used.
+        seed : int, optional
+            Seed for the bootstrap.
+
+        Returns
+        -------
+        errors : np.ndarray
+            One standard error per column of A, zeros when there are no degrees of freedom.
+
+        Example
+        -------
+        >>> A = np.array([[1, 1, 0], [0, 1, 1], [1, 0, 1], [1, 1, 0]])
+        >>> B = np.array([10, 12, 8, 12])
+        >>> MatrixMath.standard_errors(A, B)
+        array([1.11803399, 1.11803399, 1.11803399])
+        '''
+        A = np.asarray(A, dtype=float)
+        B = np.asarray(B, dtype=float).reshape(len(A), -1)[:, 0]
+        x = (MatrixMath.LSE(A, B) if x is None else np.asarray(x, dtype=float)).reshape(-1)
+        used = A.any(axis=1)
+        A, B = A[used], B[used]
+        rank = np.linalg.matrix_rank(A) if len(A) else 0
+        dof = len(A) - rank
+        if dof <= 0:
+            return np.zeros(len(x))
+
+        fitted = A @ x
+        residuals = B - fitted
+        variance = float((residuals ** 2).sum() / dof)
+
+        gram = A.T @ A
+        if rank == A.shape[1] and np.linalg.cond(gram) < max_condition:
+            return np.sqrt(variance * np.clip(np.diag(np.linalg.inv(gram)), 0, None))
+
+        # Rescale so the resampled residuals carry the unbiased variance.
+        residuals = residuals * np.sqrt(len(A) / dof)
+        rng = np.random.default_rng(seed)
+        samples = fitted[:, None] + residuals[rng.integers(0, len(A), (len(A), num_resamples))]
+        solutions = np.linalg.lstsq(A, samples, rcond=None)[0]
+        return solutions.std(axis=1, ddof=1)
+
     @staticmethod
     def SVD(matrix: np.matrix):
         '''
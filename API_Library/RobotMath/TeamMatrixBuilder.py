@@ -18,12 +18,13 @@ class MatrixBuilder():
     def create_team_matrices(self):
         '''This function is neccesary to find all teams in a given tournament.'''
         
+        self.team_indices = {}
         for match in self.matches:
-            for team in match['teams']:
-                if team['teamNumber'] not in self.teams:
-                    self.teams.append(team['teamNumber'])
+            for team in match.teams:
+                if team.teamNumber not in self.team_indices:
+                    self.team_indices[team.teamNumber] = len(self.teams)
+                    self.teams.append(team.teamNumber)
             
-        self.team_indices = {team: idx for idx, team in enumerate(self.teams)}
         self.num_teams = len(self.teams)
         self.binary_matrix = np.zeros((self.num_matches * 2, self.num_teams), dtype=int)
         
@@ -34,24 +35,25 @@ class MatrixBuilder():
         self.create_team_matrices()
         
         for match_idx, match in enumerate(self.matches):
-            red_score = match.get('scoreRedFinal', 0) - match.get('scoreRedAuto', 0) - match.get('scoreBlueFoul', 0)
-            blue_score = match.get('scoreBlueFinal', 0) - match.get('scoreBlueAuto', 0) - match.get('scoreRedFoul', 0)
-            red_score_auto = match.get('scoreRedAuto', 0)
-            blue_score_auto = match.get('scoreBlueAuto', 0)
-            red_score_endgame = match.get('scoreRedEndgame', 0)
-            blue_score_endgame = match.get('scoreBlueEndgame', 0)
-            red_score_penalties = match.get('penaltyPointsRed', 0)
-            blue_score_penalties = match.get('penaltyPointsBlue', 0)
+            red_score = match.scoreRedFinal - match.scoreRedAuto - match.scoreBlueFoul
+            blue_score = match.scoreBlueFinal - match.scoreBlueAuto - match.scoreRedFoul
+            red_score_auto = match.scoreRedAuto
+            blue_score_auto = match.scoreBlueAuto
+            red_score_endgame = match.scoreRedEndgame
+            blue_score_endgame = match.scoreBlueEndgame
+            red_score_penalties = match.penaltyPointsRed
+            blue_score_penalties = match.penaltyPointsBlue
+            qualification = 'Qualification' in match.description
             
-            for team in match['teams']:
-                team_idx = self.team_indices[team['teamNumber']]
-                station = str(team['station'])
+            for team in match.teams:
+                team_idx = self.team_indices[team.teamNumber]
+                station = team.station
                 
                 '''
                 This calls 'onField', which checks to see if a team is on the field during this match.
                 However, this is not used in normal OPR calculations so it is subject to change.
                 '''
-                if 'Qualification' in match['description'] and (team.get("onField", True) or match['actualStartTime'] < "2021-08-01"):
+                if qualification and (team.onField or (match.actualStartTime or "") < "2021-08-01"):
                     if "Red" in station:
                         self.binary_matrix[2*match_idx, team_idx] = 1
                     elif "Blue" in station:
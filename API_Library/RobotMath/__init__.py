@@ -1,2 +1,5 @@
 from .MatrixMath import MatrixMath
-from .TeamMatrixBuilder import MatrixBuilder
\ No newline at end of file
+from .TeamMatrixBuilder import MatrixBuilder
+from .MatchPredictor import MatchPredictor
+from .EventSimulator import EventSimulator, SimulationResult
+from .EloEngine import EloEngine
@@ -0,0 +1,152 @@
+import os
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from API_Library.EventResults import EventResult, merge_event_results
+
+class ShardWorker:
+    """
+    Runs the per-event fetch and OPR work for shards leased from a ShardCoordinator.
+
+    Every event of a shard is processed by FirstAPI.fetch_event_result, exactly
+    as in a single-process get_season, and the shard's EventResults are
+    published as one compact result. While a shard is being processed a
+    heartbeat renews its lease; when the lease is lost the shard's events stop
+    before their next API request, since another worker now owns them.
+
+    Example usage:
+    --------------
+    worker = ShardWorker(FirstAPI(), ShardCoordinator("ares_coordination.sqlite3"))
+    worker.run(wait=300)
+    """
+    def __init__(self, first_api, coordinator, worker_id=None, lease_seconds=120.0, max_threads=32):
+        """
+        :param first_api: (FirstAPI) Client used for the FTC API calls.
+        :param coordinator: (ShardCoordinator) Source of shard leases.
+        :param worker_id: (str, optional) Unique worker id, defaults to host and pid.
+        :param lease_seconds: (float) Lease duration; the heartbeat renews it every third of that.
+        :param max_threads: (int) Events of a shard processed concurrently.
+        """
+        self.first_api = first_api
+        self.coordinator = coordinator
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.lease_seconds = lease_seconds
+        self.max_threads = max_threads
+        self.completed = 0
+        self.lost = 0
+
+    def process(self, lease, deadline=None):
+        """
+        Process one leased shard and publish its result.
+        :param lease: (dict) Lease returned by ShardCoordinator.lease.
+        :param deadline: (float, optional) time.monotonic() after which the shard is given up like a lost lease.
+        :return: (bool) True when the result was accepted.
+        """
+        done, lost = threading.Event(), threading.Event()
+        heartbeat = threading.Thread(target=self._heartbeat, args=(lease, done, lost, deadline), daemon=True)
+        heartbeat.start()
+        try:
+            result = run_shard(self.first_api, lease["year"], lease["events"], self.max_threads, stop=lost)
+        finally:
+            done.set()
+            heartbeat.join()
+
+        accepted = not lost.is_set() and self.coordinator.complete(
+            lease["cycleId"], lease["shardId"], self.worker_id, result
+        )
+        if accepted:
+            self.completed += 1
+        elif deadline is not None and time.monotonic() >= deadline:
+            print(f"Shard {lease['shardId']} of cycle {lease['cycleId']} was given up at the deadline")
+        else:
+            self.lost += 1
+            print(f"Shard {lease['shardId']} of cycle {lease['cycleId']} was reassigned, result dropped")
+        return accepted
+
+    def _heartbeat(self, lease, done, lost, deadline=None):
+        renewed = time.monotonic()
+        while True:
+            interval = self.lease_seconds / 3
+            if deadline is not None:
+                interval = max(0.0, min(interval, deadline - time.monotonic()))
+            if done.wait(interval):
+                return
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            try:
+                if self.coordinator.renew(lease["cycleId"], lease["shardId"], self.worker_id, self.lease_seconds):
+                    renewed = time.monotonic()
+                    continue
+            except Exception as e:
+                # A coordination database that is briefly unreachable does not cost the lease until it expires.
+                print(f"⚠️ Could not renew shard {lease['shardId']}: {e}")
+                if time.monotonic() - renewed < self.lease_seconds:
+                    continue
+            break
+        lost.set()
+
+    def run(self, cycle_id=None, wait=0.0, timeout=None, poll_interval=1.0):
+        """
+        Work on shards until the cycle is complete.
+        :param cycle_id: (str, optional) Cycle to work on, defaults to the open cycle.
+        :param wait: (float) Seconds to wait for an open cycle to appear.
+        :param timeout: (float, optional) Stop after this many seconds even if shards are left; a shard
+            still being processed then is given up.
+        :param poll_interval: (float) Seconds between lease attempts while other workers hold the remaining shards.
+        :return: (bool) True when the cycle is complete.
+        """
+        start = time.monotonic()
+        deadline = start + timeout if timeout is not None else None
+        while cycle_id is None:
+            cycle = self.coordinator.open_cycle()
+            if cycle:
+                cycle_id = cycle["cycleId"]
+            elif time.monotonic() - start >= wait:
+                return False
+            else:
+                time.sleep(poll_interval)
+
+        while True:
+            lease = self.coordinator.lease(self.worker_id, self.lease_seconds, cycle_id=cycle_id)
+            if lease:
+                self.process(lease, deadline=deadline)
+                continue
+            if self.coordinator.is_complete(cycle_id):
+                return True
+            if timeout is not None and time.monotonic() - start >= timeout:
+                return False
+            # Remaining shards are leased by other workers; poll until they finish or their leases expire.
+            time.sleep(poll_interval)
+
+def run_shard(first_api, year, events, max_threads=32, stop=None):
+    """
+    Fetch and solve a list of events.
+    :param stop: (threading.Event, optional) Once set, events stop before their next API request
+        and count as failed.
+    :return: (dict) JSON-serializable shard result, {"events": [EventResult.to_dict(), ...]}.
+    """
+    with ThreadPoolExecutor(max(1, min(max_threads, len(events)))) as executor:
+        results = list(executor.map(lambda event: first_api.fetch_event_result(event, year, stop), events))
+    return {
+        "events": [result.to_dict() for result in results if result is not None],
+        "failed": [event for event, result in zip(events, results) if result is None],
+    }
+
+def shard_event_results(results):
+    """
+    :param results: (list) Shard results from ShardCoordinator.results.
+    :return: (list) The EventResults of every processed event.
+    """
+    return [EventResult.from_dict(event) for result in results for event in result["events"]]
+
+def merge_shard_results(results, year, fallbacks=()):
+    """
+    Reduce shard results into one Season, as get_season would have built it.
+    :param results: (list) EventResults from shard_event_results.
+    :param year: (int) Season year.
+    :param fallbacks: (iterable, optional) Last known EventResults of events the shards did not finish.
+    :return: (Season)
+    """
+    return merge_event_results([*results, *fallbacks], year)
@@ -0,0 +1,157 @@
+import json
+import os
+import threading
+from datetime import datetime, timezone
+
+class ChangeFeed:
+    """
+    Sequence-numbered feed of per-cycle changesets.
+
+    Every update cycle that changed anything appends one entry to an
+    append-only JSON Lines log: the teams whose OPR, rank or profile changed
+    (new teams in full, known teams with only the changed columns) and the
+    matches that were added or corrected. Sequence numbers increase by one
+    per entry, so a consumer keeps the last sequence number it applied and
+    asks for everything after it instead of polling the season tables.
+
+    Entries carry the new values rather than increments, so applying an entry
+    twice is harmless; a cycle that crashes after appending but before its
+    mirror transaction commits is simply published again by the next cycle.
+
+    Entry format:
+        {"seq": 42, "publishedAt": "...", "season": 2025,
+         "teams": [{"teamNumber": 1, "op": "update", "fields": {"overallOPR": 81.2, ...}}],
+         "matches": [{"matchcode": "...", "op": "correct", "replaces": "...", "row": {...}}]}
+
+    Example usage:
+    --------------
+    feed = ChangeFeed("ares_changes.jsonl", 2025)
+    entry = feed.publish(mirror.team_changes(rows), changed_matches, mirror.replaced_matches(changed_matches))
+    for entry in feed.read_since(41):
+        apply(entry)
+    """
+    def __init__(self, path="ares_changes.jsonl", season=2025):
+        """
+        :param path: (str) Log file, created on the first publish.
+        :param season: (int) Season year recorded in every entry.
+        """
+        self.path = path
+        self.season = season
+        self.lock = threading.Lock()
+        self._truncate_torn_tail()
+        self.last_seq = self._read_last_seq()
+
+    def _truncate_torn_tail(self):
+        # A crash mid-write leaves a last line without its newline; the next publish would be
+        # appended to it and both entries lost, so it is cut off here and its seq is reused.
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r+b") as f:
+            end = f.seek(0, os.SEEK_END)
+            if end == 0:
+                return
+            f.seek(end - 1)
+            if f.read(1) == b"\n":
+                return
+            block, pos = 4096, end
+            while pos > 0:
+                start = max(0, pos - block)
+                f.seek(start)
+                newline = f.read(pos - start).rfind(b"\n")
+                if newline >= 0:
+                    f.truncate(start + newline + 1)
+                    break
+                pos = start
+            else:
+                f.truncate(0)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _read_last_seq(self):
+        if not os.path.exists(self.path):
+            return 0
+        with open(self.path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            end = f.tell()
+            # Read backwards in blocks until the last complete line is in the buffer.
+            block, data = 4096, b""
+            while end > 0 and data.count(b"\n") < 2:
+                start = max(0, end - block)
+                f.seek(start)
+                data = f.read(end - start) + data
+                end = start
+        for line in reversed(data.splitlines()):
+            try:
+                return json.loads(line)["seq"]
+            except (ValueError, KeyError):
+                continue
+        return 0
+
+    def build(self, team_changes, match_rows, replaced=None):
+        """
+        Build the changeset of a cycle.
+        :param team_changes: (list) (row, columns) pairs from LocalMirror.team_changes.
+        :param match_rows: (list) Match rows the mirror had not seen.
+        :param replaced: (dict, optional) New match code -> corrected match code, from LocalMirror.replaced_matches.
+        :return: (dict) {"teams": [...], "matches": [...]}.
+        """
+        replaced = replaced or {}
+        teams = []
+        for row, columns in team_changes:
+            if columns is None:
+                fields = {k: v for k, v in row.items() if k != "teamNumber"}
+            else:
+                fields = {column: row.get(column) for column in columns}
+            teams.append({"teamNumber": row["teamNumber"], "op": "update" if columns else "insert", "fields": fields})
+        matches = []
+        for row in match_rows:
+            change = {"matchcode": row["matchcode"], "op": "insert", "row": row}
+            if row["matchcode"] in replaced:
+                change.update(op="correct", replaces=replaced[row["matchcode"]])
+            matches.append(change)
+        return {"teams": teams, "matches": matches}
+
+    def publish(self, team_changes, match_rows, replaced=None):
+        """
+        Append the changeset of a cycle to the log.
+        :return: (dict | None) The published entry, None when nothing changed.
+        """
+        changeset = self.build(team_changes, match_rows, replaced)
+        if not changeset["teams"] and not changeset["matches"]:
+            return None
+        with self.lock:
+            entry = {
+                "seq": self.last_seq + 1,
+                "publishedAt": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "season": self.season,
+                **changeset,
+            }
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, separators=(",", ":"), default=str) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self.last_seq = entry["seq"]
+        return entry
+
+    def read_since(self, seq=0, limit=None):
+        """
+        Entries published after a sequence number, oldest first.
+        :param seq: (int) Last sequence number the consumer applied, 0 for the whole feed.
+        :param limit: (int, optional) Maximum number of entries.
+        :return: (list) Entries.
+        """
+        entries = []
+        if not os.path.exists(self.path):
+            return entries
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if entry["seq"] <= seq:
+                    continue
+                entries.append(entry)
+                if limit is not None and len(entries) >= limit:
+                    break
+        return entries
@@ -0,0 +1,91 @@
+class EventPlacements:
+    """
+    Per-event ranks of every team and the running totals behind averagePlace.
+
+    Each (team, event) rank is stored once, next to the mirror tables,
+    together with a per-team running sum and count of those ranks. update()
+    only touches ranks that are new, moved or no longer listed since the last
+    cycle and adjusts the totals by the difference, so a finished event costs nothing in later
+    cycles and averagePlace never has to be recomputed across all events.
+
+    Example usage:
+    --------------
+    placements = EventPlacements(mirror, "season_2025")
+    placements.update({"USCAFFFAQ": {14584: 1, 16379: 2}})
+    placements.averages()[14584]
+    """
+    def __init__(self, mirror, season_table):
+        """
+        :param mirror: (LocalMirror) Mirror whose database holds the placements.
+        :param season_table: (str) Season table name, e.g. 'season_2025'; local tables are prefixed with it.
+        """
+        self.mirror = mirror
+        self.ranks_table = f"{season_table}_event_ranks"
+        self.totals_table = f"{season_table}_place_totals"
+        with self.mirror.transaction() as conn:
+            conn.execute(
+                f'CREATE TABLE IF NOT EXISTS "{self.ranks_table}" ('
+                f'"teamNumber" INTEGER NOT NULL, "eventCode" TEXT NOT NULL, "rank" INTEGER NOT NULL, '
+                f'PRIMARY KEY ("teamNumber", "eventCode")) WITHOUT ROWID'
+            )
+            conn.execute(
+                f'CREATE TABLE IF NOT EXISTS "{self.totals_table}" ('
+                f'"teamNumber" INTEGER PRIMARY KEY, "rankSum" INTEGER NOT NULL, "events" INTEGER NOT NULL)'
+            )
+
+    def update(self, rankings, conn=None):
+        """
+        Record the latest rankings of some events.
+        :param rankings: (dict) eventCode -> {teamNumber: rank}, the full rankings of each event;
+            ranks of teams an event no longer lists are removed.
+        :param conn: (sqlite3.Connection, optional) Connection of an open mirror transaction to join.
+        :return: (set) Team numbers whose averagePlace changed.
+        """
+        if conn is None:
+            with self.mirror.transaction() as conn:
+                return self.update(rankings, conn=conn)
+
+        changed = set()
+        for event_code, ranks in rankings.items():
+            known = dict(conn.execute(
+                f'SELECT "teamNumber", "rank" FROM "{self.ranks_table}" WHERE "eventCode" = ?', (event_code,)
+            ))
+            for team_number, rank in ranks.items():
+                team_number, rank = int(team_number), int(rank)
+                old = known.get(team_number)
+                if old == rank:
+                    continue
+                conn.execute(
+                    f'INSERT OR REPLACE INTO "{self.ranks_table}" VALUES (?, ?, ?)', (team_number, event_code, rank)
+                )
+                conn.execute(
+                    f'INSERT INTO "{self.totals_table}" VALUES (?, ?, 1) ON CONFLICT("teamNumber") DO UPDATE SET '
+                    f'"rankSum" = "rankSum" + ?, "events" = "events" + ?',
+                    (team_number, rank, rank - (old or 0), 0 if old is not None else 1),
+                )
+                changed.add(team_number)
+            listed = {int(team_number) for team_number in ranks}
+            for team_number, old in known.items():
+                if team_number in listed:
+                    continue
+                conn.execute(
+                    f'DELETE FROM "{self.ranks_table}" WHERE "teamNumber" = ? AND "eventCode" = ?',
+                    (team_number, event_code),
+                )
+                conn.execute(
+                    f'UPDATE "{self.totals_table}" SET "rankSum" = "rankSum" - ?, "events" = "events" - 1 '
+                    f'WHERE "teamNumber" = ?',
+                    (old, team_number),
+                )
+                changed.add(team_number)
+        return changed
+
+    def averages(self):
+        """
+        :return: (dict) teamNumber -> average rank over every event the team was ranked at.
+        """
+        with self.mirror.lock:
+            rows = self.mirror.conn.execute(
+                f'SELECT "teamNumber", "rankSum", "events" FROM "{self.totals_table}" WHERE "events" > 0'
+            ).fetchall()
+        return {team_number: rank_sum / events for team_number, rank_sum, events in rows}
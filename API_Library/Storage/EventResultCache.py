@@ -0,0 +1,64 @@
+import json
+import time
+import zlib
+
+class EventResultCache:
+    """
+    Last known EventResult of every event, kept next to the mirror tables.
+
+    Each update cycle saves the events it finished. When an event misses the
+    cycle deadline or fails, its previous result is loaded instead, so the
+    cycle still publishes a complete season rather than dropping the event's
+    teams and matches until the next run.
+
+    Example usage:
+    --------------
+    cache = EventResultCache(mirror, "season_2025")
+    cache.save(results)
+    fallbacks = cache.load(["USCAFFFAQ"])
+    """
+    def __init__(self, mirror, season_table):
+        """
+        :param mirror: (LocalMirror) Mirror whose database holds the cache.
+        :param season_table: (str) Season table name, e.g. 'season_2025'; the cache table is prefixed with it.
+        """
+        self.mirror = mirror
+        self.table = f"{season_table}_event_results"
+        with self.mirror.transaction() as conn:
+            conn.execute(
+                f'CREATE TABLE IF NOT EXISTS "{self.table}" ('
+                f'"eventCode" TEXT PRIMARY KEY, "updatedAt" REAL NOT NULL, "payload" BLOB NOT NULL)'
+            )
+
+    def save(self, results):
+        """
+        Store the latest result of each event.
+        :param results: (iterable) EventResults.
+        :return: (int) Number of events stored.
+        """
+        now = time.time()
+        rows = [
+            (result.eventCode, now, zlib.compress(json.dumps(result.to_dict(), separators=(",", ":")).encode()))
+            for result in results
+        ]
+        with self.mirror.transaction() as conn:
+            conn.executemany(f'INSERT OR REPLACE INTO "{self.table}" VALUES (?, ?, ?)', rows)
+        return len(rows)
+
+    def load(self, event_codes):
+        """
+        :param event_codes: (list) Event codes to look up.
+        :return: (dict) eventCode -> EventResult for the events that have a stored result.
+        """
+        from API_Library.EventResults import EventResult
+
+        codes = list(event_codes)
+        if not codes:
+            return {}
+        with self.mirror.lock:
+            rows = self.mirror.conn.execute(
+                f'SELECT "eventCode", "payload" FROM "{self.table}" '
+                f'WHERE "eventCode" IN ({", ".join("?" * len(codes))})',
+                codes,
+            ).fetchall()
+        return {code: EventResult.from_dict(json.loads(zlib.decompress(payload))) for code, payload in rows}
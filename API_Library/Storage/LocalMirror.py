@@ -0,0 +1,272 @@
+import ast
+import sqlite3
+import threading
+
+TEAM_COLUMNS = {
+    "teamNumber": "INTEGER PRIMARY KEY",
+    "teamName": "TEXT",
+    "sponsors": "TEXT",
+    "location": "TEXT",
+    "autoOPR": "REAL",
+    "teleOPR": "REAL",
+    "endgameOPR": "REAL",
+    "overallOPR": "REAL",
+    "autoRank": "INTEGER",
+    "teleRank": "INTEGER",
+    "endgameRank": "INTEGER",
+    "overallRank": "INTEGER",
+    "penalties": "REAL",
+    "penaltyRank": "INTEGER",
+    "profileUpdate": "TEXT",
+    "teamLogo": "TEXT",
+    "founded": "INTEGER",
+    "website": "TEXT",
+    "averagePlace": "REAL",
+    "eloRating": "REAL",
+    "overallOPRError": "REAL",
+}
+
+MATCH_COLUMNS = {
+    "matchcode": "TEXT PRIMARY KEY",
+    "team_1": "INTEGER",
+    "team_2": "INTEGER",
+    "totalPoints": "INTEGER",
+    "alliance": "TEXT",
+    "date": "TEXT",
+    "matchType": "TEXT",
+    "win": "INTEGER",
+    "tele": "INTEGER",
+    "penalty": "INTEGER",
+}
+
+# Columns that change on every write and so never count as a change by themselves.
+VOLATILE_COLUMNS = {"profileUpdate"}
+
+class LocalMirror:
+    """
+    Embedded SQLite mirror of the season_* and matches_* tables.
+
+    The mirror is the source of truth for merge_with_database: rows are read
+    locally instead of selecting the whole remote table every cycle, and
+    eventsAttended lives in a typed (teamNumber, eventCode) join table instead
+    of a stringified Python list. Each cycle computes the rows that actually
+    changed against the mirror, sends only those to Supabase and then commits
+    them to the mirror in a single transaction.
+
+    Example usage:
+    --------------
+    mirror = LocalMirror("ares_mirror.sqlite3", "season_2025", "matches_2025")
+    existing = mirror.load_teams()
+    changed = mirror.changed_teams(rows)
+    mirror.save(changed, [])
+    """
+    def __init__(self, path, season_table, match_table, read_only=False):
+        """
+        :param path: (str) SQLite database file, ':memory:' for a throwaway mirror.
+        :param season_table: (str) Name of the team table, e.g. 'season_2025'.
+        :param match_table: (str) Name of the match table, e.g. 'matches_2025'.
+        :param read_only: (bool) Open an existing mirror read-only, for readers next to the
+            update cycle: no tables are created or migrated and the writer lock is never taken.
+        """
+        self.path = path
+        self.season_table = season_table
+        self.match_table = match_table
+        self.events_table = f"{season_table}_events"
+        self.lock = threading.RLock()
+        if read_only:
+            self.conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False, isolation_level=None)
+            self.conn.row_factory = sqlite3.Row
+            return
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_tables()
+
+    def _create_tables(self):
+        team_columns = ", ".join(f'"{name}" {kind}' for name, kind in TEAM_COLUMNS.items())
+        match_columns = ", ".join(f'"{name}" {kind}' for name, kind in MATCH_COLUMNS.items())
+        with self.transaction() as conn:
+            conn.execute(f'CREATE TABLE IF NOT EXISTS "{self.season_table}" ({team_columns})')
+            conn.execute(
+                f'CREATE TABLE IF NOT EXISTS "{self.events_table}" ('
+                f'"teamNumber" INTEGER NOT NULL, "eventCode" TEXT NOT NULL, '
+                f'PRIMARY KEY ("teamNumber", "eventCode")) WITHOUT ROWID'
+            )
+            conn.execute(f'CREATE TABLE IF NOT EXISTS "{self.match_table}" ({match_columns})')
+            # Mirrors created before a column was added to TEAM_COLUMNS get it here.
+            existing = {row["name"] for row in conn.execute(f'PRAGMA table_info("{self.season_table}")')}
+            for name, kind in TEAM_COLUMNS.items():
+                if name not in existing:
+                    conn.execute(f'ALTER TABLE "{self.season_table}" ADD COLUMN "{name}" {kind}')
+
+    def transaction(self):
+        """
+        Context manager running the enclosed statements in one IMMEDIATE transaction.
+        :return: (sqlite3.Connection) The connection to execute on.
+        """
+        return _Transaction(self)
+
+    def is_empty(self):
+        with self.lock:
+            return self.conn.execute(f'SELECT 1 FROM "{self.season_table}" LIMIT 1').fetchone() is None
+
+    def load_teams(self):
+        """
+        Load all mirrored team rows.
+        :return: (dict) teamNumber -> row dict, with eventsAttended as a sorted list.
+        """
+        with self.lock:
+            rows = {row["teamNumber"]: dict(row) for row in self.conn.execute(f'SELECT * FROM "{self.season_table}"')}
+            for row in rows.values():
+                row["eventsAttended"] = []
+            for team_number, event_code in self.conn.execute(
+                f'SELECT "teamNumber", "eventCode" FROM "{self.events_table}" ORDER BY "teamNumber", "eventCode"'
+            ):
+                if team_number in rows:
+                    rows[team_number]["eventsAttended"].append(event_code)
+        return rows
+
+    def load_match_codes(self):
+        with self.lock:
+            return {row[0] for row in self.conn.execute(f'SELECT "matchcode" FROM "{self.match_table}"')}
+
+    def bootstrap(self, team_rows, match_rows=()):
+        """
+        Seed an empty mirror from rows selected from Supabase. Legacy
+        eventsAttended values stored as stringified lists are parsed here, once.
+        :param team_rows: (list) Rows of the season table.
+        :param match_rows: (list) Rows of the match table.
+        """
+        rows = []
+        for row in team_rows:
+            row = dict(row)
+            events = row.get("eventsAttended")
+            try:
+                events = ast.literal_eval(events) if isinstance(events, str) else events
+                row["eventsAttended"] = sorted(set(events or []))
+            except Exception:
+                row["eventsAttended"] = []
+            rows.append(row)
+        self.save(rows, match_rows)
+
+    def changed_teams(self, rows):
+        """
+        Filter rows down to the ones that differ from the mirror.
+        :param rows: (list) Team rows as they would be upserted.
+        :return: (list) New rows and rows where any non-volatile column changed.
+        """
+        return [row for row, _ in self.team_changes(rows)]
+
+    def team_changes(self, rows):
+        """
+        Diff team rows against the mirror column by column.
+        :param rows: (list) Team rows as they would be upserted.
+        :return: (list) (row, columns) for every changed row; columns is None for a team the mirror has not seen.
+        """
+        existing = self.load_teams()
+        changes = []
+        for row in rows:
+            current = existing.get(row["teamNumber"])
+            if current is None:
+                changes.append((row, None))
+                continue
+            columns = [
+                column for column in list(TEAM_COLUMNS) + ["eventsAttended"]
+                if column not in VOLATILE_COLUMNS
+                and _normalize(column, row.get(column)) != _normalize(column, current.get(column))
+            ]
+            if columns:
+                changes.append((row, columns))
+        return changes
+
+    def changed_matches(self, rows):
+        """
+        Filter match rows down to the ones the mirror has not seen. Match codes
+        hash the teams and score, so a corrected match arrives under a new code.
+        :param rows: (list) Match rows as they would be upserted.
+        :return: (list) Rows with unknown match codes.
+        """
+        known = self.load_match_codes()
+        return [row for row in rows if row["matchcode"] not in known]
+
+    def replaced_matches(self, rows):
+        """
+        Find the stored alliance rows that new match rows correct: same teams, alliance and start time
+        under a different match code.
+        :param rows: (list) Match rows with unknown match codes.
+        :return: (dict) New match code -> replaced match code.
+        """
+        with self.lock:
+            index = {
+                (r["team_1"], r["team_2"], r["alliance"], r["date"]): r["matchcode"]
+                for r in self.conn.execute(
+                    f'SELECT "matchcode", "team_1", "team_2", "alliance", "date" FROM "{self.match_table}"'
+                )
+            }
+        replaced = {}
+        for row in rows:
+            old = index.get((row["team_1"], row["team_2"], row["alliance"], row["date"]))
+            if old is not None and old != row["matchcode"]:
+                replaced[row["matchcode"]] = old
+        return replaced
+
+    def save(self, team_rows, match_rows, conn=None):
+        """
+        Upsert team and match rows into the mirror atomically.
+        :param team_rows: (list) Team rows, eventsAttended as a list of event codes.
+        :param match_rows: (list) Match rows.
+        :param conn: (sqlite3.Connection, optional) Connection of an open transaction to join.
+        """
+        if conn is None:
+            with self.transaction() as conn:
+                return self.save(team_rows, match_rows, conn=conn)
+
+        conn.executemany(
+            _upsert_sql(self.season_table, TEAM_COLUMNS),
+            [tuple(_normalize(c, row.get(c)) for c in TEAM_COLUMNS) for row in team_rows],
+        )
+        for row in team_rows:
+            events = row.get("eventsAttended")
+            if isinstance(events, (list, set, tuple)):
+                conn.execute(f'DELETE FROM "{self.events_table}" WHERE "teamNumber" = ?', (row["teamNumber"],))
+                conn.executemany(
+                    f'INSERT OR IGNORE INTO "{self.events_table}" VALUES (?, ?)',
+                    [(row["teamNumber"], str(event)) for event in events],
+                )
+
+        conn.executemany(
+            _upsert_sql(self.match_table, MATCH_COLUMNS),
+            [tuple(_normalize(c, row.get(c)) for c in MATCH_COLUMNS) for row in match_rows],
+        )
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+class _Transaction:
+    def __init__(self, mirror):
+        self.mirror = mirror
+
+    def __enter__(self):
+        self.mirror.lock.acquire()
+        self.mirror.conn.execute("BEGIN IMMEDIATE")
+        return self.mirror.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            self.mirror.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        finally:
+            self.mirror.lock.release()
+
+def _upsert_sql(table, columns):
+    names = ", ".join(f'"{name}"' for name in columns)
+    placeholders = ", ".join("?" for _ in columns)
+    return f'INSERT OR REPLACE INTO "{table}" ({names}) VALUES ({placeholders})'
+
+def _normalize(column, value):
+    if column == "eventsAttended":
+        return sorted(str(event) for event in value) if isinstance(value, (list, set, tuple)) else []
+    if isinstance(value, bool):
+        return int(value)
+    return value
@@ -0,0 +1,150 @@
+import hashlib
+import re
+import unicodedata
+
+# Words are indexed by their prefixes of MIN_PREFIX..MAX_PREFIX characters; longer queries fall
+# back to trigrams. Shorter prefixes would match most teams and change with almost every profile.
+MIN_PREFIX = 2
+MAX_PREFIX = 10
+NGRAM = 3
+# Prefix and trigram tokens live in separate namespaces, so "iro" the prefix is not "iro" the trigram.
+PREFIX_TAG = "p:"
+NGRAM_TAG = "t:"
+
+class SearchIndex:
+    """
+    Incremental inverted index over team profile text.
+
+    Team name, sponsors, city, state and country are normalized (case and
+    accents folded) and split into words. Every word is indexed under each of
+    its prefixes of MIN_PREFIX to MAX_PREFIX characters ("p:robo") and under
+    its trigrams ("t:oti"), so both "robo" and "otic" find "Robotics".
+    Postings live next to the mirror tables
+    as (token, teamNumber) rows, together with a fingerprint of each team's
+    profile text: update() re-tokenizes only teams whose text changed and
+    returns the posting lists of the tokens that gained or lost a team, ready
+    to be published through the WriteQueue.
+
+    Example usage:
+    --------------
+    index = SearchIndex(mirror, "search_2025")
+    with mirror.transaction() as conn:
+        changed = index.update(team_rows, conn=conn)
+        queue.enqueue("search_2025", "token", changed, conn=conn)
+    index.search("iron tx")
+    """
+    def __init__(self, mirror, table):
+        """
+        :param mirror: (LocalMirror) Mirror whose database holds the index.
+        :param table: (str) Published table name, e.g. 'search_2025'; local tables are prefixed with it.
+        """
+        self.mirror = mirror
+        self.table = table
+        self.docs_table = f"{table}_docs"
+        self.postings_table = f"{table}_postings"
+        with self.mirror.transaction() as conn:
+            conn.execute(
+                f'CREATE TABLE IF NOT EXISTS "{self.docs_table}" ('
+                f'"teamNumber" INTEGER PRIMARY KEY, "fingerprint" TEXT NOT NULL)'
+            )
+            conn.execute(
+                f'CREATE TABLE IF NOT EXISTS "{self.postings_table}" ('
+                f'"token" TEXT NOT NULL, "teamNumber" INTEGER NOT NULL, '
+                f'PRIMARY KEY ("token", "teamNumber")) WITHOUT ROWID'
+            )
+            conn.execute(
+                f'CREATE INDEX IF NOT EXISTS "{self.postings_table}_team" '
+                f'ON "{self.postings_table}" ("teamNumber")'
+            )
+
+    def update(self, rows, conn=None):
+        """
+        Re-index the teams whose profile text changed since the last update.
+        :param rows: (list) Team rows with teamNumber, teamName, sponsors and location.
+        :param conn: (sqlite3.Connection, optional) Connection of an open mirror transaction to join.
+        :return: (list) {"token", "teamNumbers"} rows for every token whose posting list changed;
+            an empty list means no team matches the token any more.
+        """
+        if conn is None:
+            with self.mirror.transaction() as conn:
+                return self.update(rows, conn=conn)
+
+        changed_tokens = set()
+        known = dict(conn.execute(f'SELECT "teamNumber", "fingerprint" FROM "{self.docs_table}"'))
+        for row in rows:
+            team_number = int(row["teamNumber"])
+            fingerprint = hashlib.sha1(_profile_text(row).encode()).hexdigest()
+            if known.get(team_number) == fingerprint:
+                continue
+
+            old = {token for (token,) in conn.execute(
+                f'SELECT "token" FROM "{self.postings_table}" WHERE "teamNumber" = ?', (team_number,)
+            )}
+            new = tokenize_profile(row)
+            conn.executemany(
+                f'DELETE FROM "{self.postings_table}" WHERE "token" = ? AND "teamNumber" = ?',
+                [(token, team_number) for token in old - new],
+            )
+            conn.executemany(
+                f'INSERT OR IGNORE INTO "{self.postings_table}" VALUES (?, ?)',
+                [(token, team_number) for token in new - old],
+            )
+            conn.execute(
+                f'INSERT OR REPLACE INTO "{self.docs_table}" VALUES (?, ?)', (team_number, fingerprint)
+            )
+            changed_tokens |= old ^ new
+
+        return [{"token": token, "teamNumbers": self.postings(token, conn)} for token in sorted(changed_tokens)]
+
+    def postings(self, token, conn=None):
+        """
+        :return: (list) Sorted team numbers indexed under a token.
+        """
+        conn = conn or self.mirror.conn
+        with self.mirror.lock:
+            return [n for (n,) in conn.execute(
+                f'SELECT "teamNumber" FROM "{self.postings_table}" WHERE "token" = ? ORDER BY "teamNumber"', (token,)
+            )]
+
+    def search(self, query):
+        """
+        Teams matching every word of a query, the way a client of the published table would look them up.
+        :param query: (str) Free text, e.g. 'iron tx'.
+        :return: (list) Sorted team numbers.
+        """
+        result = None
+        # Single characters are not indexed and would match nearly everyone anyway.
+        for word in (w for w in _words(query) if len(w) >= MIN_PREFIX):
+            # A word matches as a prefix, or anywhere inside a word when all of its trigrams do.
+            matches = set(self.postings(PREFIX_TAG + word)) if len(word) <= MAX_PREFIX else set()
+            infix = None
+            for gram in _ngrams(word):
+                postings = set(self.postings(NGRAM_TAG + gram))
+                infix = postings if infix is None else infix & postings
+            matches |= infix or set()
+            result = matches if result is None else result & matches
+            if not result:
+                return []
+        return sorted(result or [])
+
+def tokenize_profile(row):
+    """
+    Tokens of a team row: prefixes ("p:") and trigrams ("t:") of every word of
+    the name, sponsors and location (city, state, country).
+    :return: (set) Tokens.
+    """
+    tokens = set()
+    for word in _words(_profile_text(row)):
+        tokens.update(PREFIX_TAG + word[:i] for i in range(MIN_PREFIX, min(len(word), MAX_PREFIX) + 1))
+        tokens.update(NGRAM_TAG + gram for gram in _ngrams(word))
+    return tokens
+
+def _profile_text(row):
+    return " | ".join(str(row.get(column) or "") for column in ("teamName", "sponsors", "location"))
+
+def _words(text):
+    text = unicodedata.normalize("NFKD", str(text)).encode("ascii", "ignore").decode().casefold()
+    return [word for word in re.split(r"[^0-9a-z]+", text) if word and word != "unknown"]
+
+def _ngrams(word):
+    return {word[i:i + NGRAM] for i in range(len(word) - NGRAM + 1)}
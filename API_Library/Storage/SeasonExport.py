@@ -0,0 +1,193 @@
+import json
+import os
+import shutil
+import uuid
+from datetime import datetime, timezone
+
+from API_Library.API_Models.Team import split_location
+
+# pyarrow is optional and only imported when an export is written, so the update
+# cycle still runs (without exports) where it is not installed.
+
+class SeasonExport:
+    """
+    Columnar snapshot of a season for analytics.
+
+    Each cycle writes three tables straight from the in-memory season:
+    teams (the rows upserted to season_*), alliances (the MatchMaker rows of
+    matches_*) and event_opr (one row per team per event with that event's
+    OPR vector). Every table is written twice: as zstd Parquet for analytics
+    tools and as an uncompressed Arrow IPC file that can be memory-mapped.
+    Repeated strings (names, locations, event codes, alliance colors) are
+    dictionary encoded.
+
+    Each cycle writes into its own directory,
+    <root>/season=<year>/cycle=<timestamp>/, which is never modified once
+    complete. <root>/season=<year>/_manifest.json names the current cycle
+    directory and its files, and is replaced atomically last. A reader that
+    resolves files through the manifest always gets all tables of the same
+    cycle. The newest `keep` cycle directories are kept, so readers still
+    holding an older manifest can finish.
+
+    Example usage:
+    --------------
+    export = SeasonExport("exports", 2025)
+    export.write(team_rows, alliance_rows, season.events)
+
+    import pyarrow as pa
+    teams = pa.ipc.open_file(pa.memory_map(SeasonExport.latest("exports", 2025)["teams.arrow"])).read_all()
+    """
+    def __init__(self, root="exports", season=2025, keep=3):
+        """
+        :param root: (str) Directory holding one partition per season.
+        :param season: (int) Season year, used as the partition key.
+        :param keep: (int) Number of cycle directories to keep.
+        """
+        self.root = root
+        self.season = season
+        self.keep = keep
+        self.directory = os.path.join(root, f"season={season}")
+
+    @staticmethod
+    def latest(root="exports", season=2025):
+        """
+        Resolve the files of the current cycle through the manifest.
+        :return: (dict) File name (e.g. 'teams.parquet') -> path.
+        """
+        directory = os.path.join(root, f"season={season}")
+        with open(os.path.join(directory, "_manifest.json")) as f:
+            manifest = json.load(f)
+        return {name: os.path.join(directory, manifest["cycle"], name) for name in manifest["files"]}
+
+    @staticmethod
+    def available():
+        """
+        :return: (bool) True when pyarrow is installed.
+        """
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def write(self, team_rows, alliance_rows, events):
+        """
+        Write the snapshot of one cycle.
+        :param team_rows: (list) Team rows as upserted to the season table.
+        :param alliance_rows: (list) Alliance rows as upserted to the match table.
+        :param events: (dict) eventCode -> Event with per-event team OPRs.
+        :return: (dict) The manifest that was written.
+        """
+        import pyarrow as pa
+
+        now = datetime.now(timezone.utc)
+        cycle = f"cycle={now.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:6]}"
+        cycle_dir = os.path.join(self.directory, cycle)
+        tables = {
+            "teams": self._teams_table(pa, team_rows),
+            "alliances": self._alliances_table(pa, alliance_rows),
+            "event_opr": self._event_opr_table(pa, events),
+        }
+        os.makedirs(cycle_dir)
+        files = {}
+        try:
+            for name, table in tables.items():
+                files[f"{name}.parquet"] = self._write_parquet(table, os.path.join(cycle_dir, f"{name}.parquet"))
+                files[f"{name}.arrow"] = self._write_ipc(pa, table, os.path.join(cycle_dir, f"{name}.arrow"))
+        except BaseException:
+            shutil.rmtree(cycle_dir, ignore_errors=True)
+            raise
+
+        manifest = {
+            "season": self.season,
+            "writtenAt": now.isoformat(timespec="seconds"),
+            "cycle": cycle,
+            "files": files,
+        }
+        self._atomic_write(os.path.join(self.directory, "_manifest.json"),
+                           lambda f: f.write(json.dumps(manifest, indent=2).encode()))
+        self._prune(cycle)
+        return manifest
+
+    def _prune(self, current):
+        cycles = sorted(name for name in os.listdir(self.directory) if name.startswith("cycle="))
+        for name in cycles[:-self.keep] if self.keep > 0 else cycles:
+            if name != current:
+                shutil.rmtree(os.path.join(self.directory, name), ignore_errors=True)
+
+    @staticmethod
+    def _teams_table(pa, rows):
+        location = [split_location(row.get("location")) for row in rows]
+        floats = ["autoOPR", "teleOPR", "endgameOPR", "overallOPR", "penalties", "averagePlace",
+                  "eloRating", "overallOPRError"]
+        ranks = ["autoRank", "teleRank", "endgameRank", "overallRank", "penaltyRank"]
+        columns = {
+            "teamNumber": pa.array([row["teamNumber"] for row in rows], pa.int32()),
+            "teamName": _dictionary(pa, [row.get("teamName") for row in rows]),
+            "sponsors": _dictionary(pa, [row.get("sponsors") for row in rows]),
+            "location": _dictionary(pa, [row.get("location") for row in rows]),
+            "city": _dictionary(pa, [city for city, _, _ in location]),
+            "state": _dictionary(pa, [state for _, state, _ in location]),
+            "country": _dictionary(pa, [country for _, _, country in location]),
+            **{c: pa.array([row.get(c) for row in rows], pa.float64()) for c in floats},
+            **{c: pa.array([row.get(c) for row in rows], pa.int32()) for c in ranks},
+            "founded": pa.array([row.get("founded") or None for row in rows], pa.int32()),
+            "website": pa.array([row.get("website") for row in rows], pa.string()),
+            "eventsAttended": pa.array(
+                [[str(e) for e in row.get("eventsAttended") or []] for row in rows], pa.list_(pa.string())
+            ),
+            "profileUpdate": pa.array([row.get("profileUpdate") for row in rows], pa.string()),
+        }
+        return pa.table(columns)
+
+    @staticmethod
+    def _alliances_table(pa, rows):
+        ints = ["team_1", "team_2", "totalPoints", "tele", "penalty"]
+        return pa.table({
+            "matchcode": pa.array([row["matchcode"] for row in rows], pa.string()),
+            **{c: pa.array([row.get(c) for row in rows], pa.int32()) for c in ints},
+            "alliance": _dictionary(pa, [row.get("alliance") for row in rows]),
+            "date": pa.array([row.get("date") for row in rows], pa.string()),
+            "matchType": _dictionary(pa, [row.get("matchType") for row in rows]),
+            "win": pa.array([bool(row.get("win")) for row in rows], pa.bool_()),
+        })
+
+    @staticmethod
+    def _event_opr_table(pa, events):
+        rows = [(code, event, team) for code, event in sorted(events.items()) for team in event.teams]
+        metrics = ["autoOPR", "teleOPR", "endgameOPR", "overallOPR", "penalties", "overallOPRError"]
+        return pa.table({
+            "eventCode": _dictionary(pa, [code for code, _, _ in rows]),
+            "teamNumber": pa.array([int(team.teamNumber) for _, _, team in rows], pa.int32()),
+            **{m: pa.array([float(getattr(team, m)) for _, _, team in rows], pa.float64()) for m in metrics},
+            "residualVariance": pa.array([float(event.residualVariance) for _, event, _ in rows], pa.float64()),
+            "eventDate": pa.array([team.eventDate or None for _, _, team in rows], pa.string()),
+        })
+
+    def _write_parquet(self, table, path):
+        import pyarrow.parquet as pq
+        self._atomic_write(path, lambda f: pq.write_table(table, f, compression="zstd", use_dictionary=True))
+        return table.num_rows
+
+    def _write_ipc(self, pa, table, path):
+        def write(f):
+            with pa.ipc.new_file(f, table.schema) as writer:
+                writer.write_table(table)
+        self._atomic_write(path, write)
+        return table.num_rows
+
+    @staticmethod
+    def _atomic_write(path, write):
+        tmp = f"{path}.tmp-{os.getpid()}"
+        try:
+            with open(tmp, "wb") as f:
+                write(f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+def _dictionary(pa, values):
+    return pa.array(values, pa.string()).dictionary_encode()
@@ -0,0 +1,213 @@
+import json
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+import zlib
+
+class ShardCoordinator:
+    """
+    Lease-based work distribution for sharded update cycles.
+
+    A coordinator splits a cycle's events into shards. Workers lease a shard,
+    renew the lease while they work and complete it with a compact, compressed
+    result. A lease that is not renewed expires and the shard goes back to any
+    worker that asks, so a slow or dead worker never stalls the cycle; a late
+    completion from a worker that lost its lease is ignored.
+
+    The coordination table is a SQLite file in WAL mode and every state
+    change is a single IMMEDIATE transaction. WAL needs shared memory and
+    reliable file locks, which network file systems (NFS, SMB) do not
+    provide, so all roles must run on one host with the file on local disk.
+    The host that creates the file is recorded and any other host is refused.
+    To spread a cycle over several machines use PostgresShardCoordinator,
+    which has the same interface; open_coordinator() picks one from a
+    location. Creating a cycle abandons cycles that are still open from an
+    earlier coordinator that died.
+
+    Example usage:
+    --------------
+    coordinator = ShardCoordinator("ares_coordination.sqlite3")
+    cycle_id = coordinator.create_cycle(2025, events, shard_size=8)
+    lease = coordinator.lease("worker-1", lease_seconds=120)
+    coordinator.complete(lease["cycleId"], lease["shardId"], "worker-1", result)
+    coordinator.results(cycle_id)
+    """
+    def __init__(self, path="ares_coordination.sqlite3"):
+        """
+        :param path: (str) SQLite database file on local disk, shared by the coordinator and the workers.
+        :raises RuntimeError: When the file was created by another host.
+        """
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        with self._transaction() as conn:
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS "cycles" ('
+                '"cycleId" TEXT PRIMARY KEY, "year" INTEGER NOT NULL, "createdAt" REAL NOT NULL, '
+                '"status" TEXT NOT NULL)'
+            )
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS "shards" ('
+                '"cycleId" TEXT NOT NULL, "shardId" INTEGER NOT NULL, "events" TEXT NOT NULL, '
+                '"status" TEXT NOT NULL, "owner" TEXT, "leaseExpires" REAL, "attempts" INTEGER NOT NULL, '
+                '"result" BLOB, PRIMARY KEY ("cycleId", "shardId"))'
+            )
+            conn.execute('CREATE TABLE IF NOT EXISTS "meta" ("key" TEXT PRIMARY KEY, "value" TEXT NOT NULL)')
+            conn.execute('INSERT OR IGNORE INTO "meta" VALUES (\'host\', ?)', (socket.gethostname(),))
+            host = conn.execute('SELECT "value" FROM "meta" WHERE "key" = \'host\'').fetchone()[0]
+        if host != socket.gethostname():
+            self.conn.close()
+            raise RuntimeError(
+                f"{path} belongs to host {host}; SQLite coordination only works between processes on one host, "
+                f"use a postgresql:// coordination URL to run workers on several hosts"
+            )
+
+    def _transaction(self):
+        return _Transaction(self)
+
+    def create_cycle(self, year, events, shard_size=8):
+        """
+        Open a cycle and split its events into shards.
+        :param year: (int) Season year.
+        :param events: (list) Event codes.
+        :param shard_size: (int) Events per shard.
+        :return: (str) Cycle id.
+        """
+        cycle_id = f"{time.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:6]}"
+        shards = [events[i:i + shard_size] for i in range(0, len(events), shard_size)]
+        with self._transaction() as conn:
+            # Cycles left open by a coordinator that died would otherwise keep attracting workers.
+            conn.execute('UPDATE "cycles" SET "status" = \'abandoned\' WHERE "status" = \'open\'')
+            conn.execute('INSERT INTO "cycles" VALUES (?, ?, ?, ?)', (cycle_id, year, time.time(), "open"))
+            conn.executemany(
+                'INSERT INTO "shards" VALUES (?, ?, ?, ?, NULL, NULL, 0, NULL)',
+                [(cycle_id, i, json.dumps(shard), "pending") for i, shard in enumerate(shards)],
+            )
+        return cycle_id
+
+    def open_cycle(self):
+        """
+        :return: (dict | None) The most recent open cycle, {"cycleId", "year"}.
+        """
+        with self.lock:
+            row = self.conn.execute(
+                'SELECT "cycleId", "year" FROM "cycles" WHERE "status" = ? ORDER BY "createdAt" DESC LIMIT 1', ("open",)
+            ).fetchone()
+        return {"cycleId": row[0], "year": row[1]} if row else None
+
+    def close_cycle(self, cycle_id, status="reduced"):
+        with self._transaction() as conn:
+            conn.execute('UPDATE "cycles" SET "status" = ? WHERE "cycleId" = ?', (status, cycle_id))
+
+    def lease(self, worker_id, lease_seconds=120.0, cycle_id=None):
+        """
+        Lease a pending shard, or one whose lease expired.
+        :param worker_id: (str) Unique id of the leasing worker.
+        :param lease_seconds: (float) Lease duration; renew before it runs out.
+        :param cycle_id: (str, optional) Only lease from this cycle, defaults to any open cycle.
+        :return: (dict | None) {"cycleId", "shardId", "year", "events"} or None when nothing is leasable.
+        """
+        now = time.time()
+        cycle_clause, args = ('AND s."cycleId" = ?', (cycle_id,)) if cycle_id else ("", ())
+        with self._transaction() as conn:
+            row = conn.execute(
+                f'SELECT s."cycleId", s."shardId", c."year", s."events" FROM "shards" s '
+                f'JOIN "cycles" c ON c."cycleId" = s."cycleId" '
+                f'WHERE c."status" = \'open\' {cycle_clause} AND (s."status" = \'pending\' '
+                f'OR (s."status" = \'leased\' AND s."leaseExpires" < ?)) '
+                f'ORDER BY c."createdAt", s."attempts", s."shardId" LIMIT 1',
+                (*args, now),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                'UPDATE "shards" SET "status" = \'leased\', "owner" = ?, "leaseExpires" = ?, '
+                '"attempts" = "attempts" + 1 WHERE "cycleId" = ? AND "shardId" = ?',
+                (worker_id, now + lease_seconds, row[0], row[1]),
+            )
+        return {"cycleId": row[0], "shardId": row[1], "year": row[2], "events": json.loads(row[3])}
+
+    def renew(self, cycle_id, shard_id, worker_id, lease_seconds=120.0):
+        """
+        Extend a lease the worker still holds.
+        :return: (bool) False when the lease was lost to another worker.
+        """
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                'UPDATE "shards" SET "leaseExpires" = ? WHERE "cycleId" = ? AND "shardId" = ? '
+                'AND "owner" = ? AND "status" = \'leased\'',
+                (time.time() + lease_seconds, cycle_id, shard_id, worker_id),
+            )
+            return cursor.rowcount == 1
+
+    def complete(self, cycle_id, shard_id, worker_id, result):
+        """
+        Store a shard's result. Rejected when the shard was reassigned to another worker.
+        :param result: (dict) JSON-serializable shard result.
+        :return: (bool) True when the result was accepted.
+        """
+        blob = zlib.compress(json.dumps(result, separators=(",", ":")).encode())
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                'UPDATE "shards" SET "status" = \'done\', "result" = ?, "leaseExpires" = NULL '
+                'WHERE "cycleId" = ? AND "shardId" = ? AND "owner" = ? AND "status" = \'leased\'',
+                (blob, cycle_id, shard_id, worker_id),
+            )
+            return cursor.rowcount == 1
+
+    def progress(self, cycle_id):
+        """
+        :return: (dict) Number of shards per status, e.g. {"done": 5, "leased": 2, "pending": 1}.
+        """
+        with self.lock:
+            return dict(self.conn.execute(
+                'SELECT "status", COUNT(*) FROM "shards" WHERE "cycleId" = ? GROUP BY "status"', (cycle_id,)
+            ).fetchall())
+
+    def is_complete(self, cycle_id):
+        progress = self.progress(cycle_id)
+        return sum(progress.values()) == progress.get("done", 0)
+
+    def results(self, cycle_id):
+        """
+        :return: (list) Decoded results of the completed shards of a cycle.
+        """
+        with self.lock:
+            rows = self.conn.execute(
+                'SELECT "result" FROM "shards" WHERE "cycleId" = ? AND "status" = \'done\' ORDER BY "shardId"',
+                (cycle_id,),
+            ).fetchall()
+        return [json.loads(zlib.decompress(blob)) for (blob,) in rows]
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+def open_coordinator(location):
+    """
+    Open the coordinator for a location.
+    :param location: (str) A postgresql:// connection string for coordination across hosts,
+        otherwise a SQLite file on local disk for processes on one host.
+    :return: (ShardCoordinator | PostgresShardCoordinator)
+    """
+    if location.startswith(("postgres://", "postgresql://")):
+        from .PostgresShardCoordinator import PostgresShardCoordinator
+        return PostgresShardCoordinator(location)
+    return ShardCoordinator(location)
+
+class _Transaction:
+    def __init__(self, coordinator):
+        self.coordinator = coordinator
+
+    def __enter__(self):
+        self.coordinator.lock.acquire()
+        self.coordinator.conn.execute("BEGIN IMMEDIATE")
+        return self.coordinator.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            self.coordinator.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        finally:
+            self.coordinator.lock.release()
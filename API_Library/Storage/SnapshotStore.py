@@ -0,0 +1,210 @@
+import bisect
+import sqlite3
+import threading
+import zlib
+from array import array
+from datetime import datetime, timezone
+
+METRICS = ("autoOPR", "teleOPR", "endgameOPR", "overallOPR", "penalties", "overallRank")
+
+# Metrics are stored as fixed-point integers so deltas add back up exactly.
+SCALE = 10_000
+
+class SnapshotStore:
+    """
+    Append-only history of per-team metric vectors.
+
+    Each append writes one segment holding only the teams whose metrics changed
+    since the previous append. A segment is columnar: the sorted team numbers
+    (gap encoded) and one column per metric holding the fixed-point delta
+    against that team's previous value, each zlib compressed. Every
+    `keyframe_interval` segments a keyframe with the absolute values of every
+    team is added, so "rankings as of date D" only replays the deltas since the
+    nearest keyframe. A (teamNumber, segmentId) index answers "team X's
+    trajectory" by decoding only the segments in which that team changed.
+
+    Example usage:
+    --------------
+    store = SnapshotStore("ares_history.sqlite3")
+    store.append(teams)
+    store.trajectory(16379)
+    store.rankings_as_of("2025-12-01T00:00:00+00:00", metric="overallOPR", top=10)
+    """
+    def __init__(self, path, keyframe_interval=64):
+        """
+        :param path: (str) SQLite database file, ':memory:' for a throwaway store.
+        :param keyframe_interval: (int) Delta segments between keyframes.
+        """
+        self.keyframe_interval = keyframe_interval
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        with self.conn:
+            self.conn.execute(
+                'CREATE TABLE IF NOT EXISTS "segments" ('
+                '"segmentId" INTEGER PRIMARY KEY, "ts" TEXT NOT NULL, "keyframe" INTEGER NOT NULL, '
+                '"numTeams" INTEGER NOT NULL, "teams" BLOB NOT NULL, "columns" BLOB NOT NULL)'
+            )
+            self.conn.execute('CREATE INDEX IF NOT EXISTS "segments_ts" ON "segments" ("keyframe", "ts")')
+            self.conn.execute(
+                'CREATE TABLE IF NOT EXISTS "team_index" ('
+                '"teamNumber" INTEGER NOT NULL, "segmentId" INTEGER NOT NULL, '
+                'PRIMARY KEY ("teamNumber", "segmentId")) WITHOUT ROWID'
+            )
+        self._latest = None
+
+    def _latest_state(self):
+        """Current fixed-point vectors per team, rebuilt once from the history and then kept in memory."""
+        if self._latest is None:
+            self._latest = self._state_as_of(None)
+        return self._latest
+
+    def append(self, teams, timestamp=None):
+        """
+        Record the metrics of every team that changed since the last append.
+        :param teams: (iterable) Team objects.
+        :param timestamp: (datetime | str, optional) Snapshot time, defaults to now (UTC).
+        :return: (int) Number of teams recorded.
+        """
+        ts = _iso(timestamp or datetime.now(timezone.utc))
+        with self.lock:
+            latest = self._latest_state()
+            changes = {}
+            for team in teams:
+                vector = tuple(_fixed(getattr(team, metric, 0)) for metric in METRICS)
+                if latest.get(team.teamNumber) != vector:
+                    changes[int(team.teamNumber)] = vector
+            if not changes:
+                return 0
+
+            numbers = sorted(changes)
+            zero = (0,) * len(METRICS)
+            deltas = [
+                [changes[n][i] - latest.get(n, zero)[i] for n in numbers]
+                for i in range(len(METRICS))
+            ]
+            with self.conn:
+                segment_id = self._write_segment(ts, False, numbers, deltas)
+                self.conn.executemany(
+                    'INSERT INTO "team_index" VALUES (?, ?)', [(n, segment_id) for n in numbers]
+                )
+                latest.update(changes)
+
+                last_keyframe = self.conn.execute(
+                    'SELECT COALESCE(MAX("segmentId"), 0) FROM "segments" WHERE "keyframe" = 1'
+                ).fetchone()[0]
+                if segment_id - last_keyframe >= self.keyframe_interval:
+                    everyone = sorted(latest)
+                    self._write_segment(ts, True, everyone, [[latest[n][i] for n in everyone] for i in range(len(METRICS))])
+            return len(numbers)
+
+    def _write_segment(self, ts, keyframe, numbers, columns):
+        gaps = array("q", [numbers[0]] + [b - a for a, b in zip(numbers, numbers[1:])])
+        packed = b"".join(array("q", column).tobytes() for column in columns)
+        cursor = self.conn.execute(
+            'INSERT INTO "segments" ("ts", "keyframe", "numTeams", "teams", "columns") VALUES (?, ?, ?, ?, ?)',
+            (ts, int(keyframe), len(numbers), zlib.compress(gaps.tobytes()), zlib.compress(packed)),
+        )
+        return cursor.lastrowid
+
+    @staticmethod
+    def _decode(num_teams, teams_blob, columns_blob):
+        gaps = array("q")
+        gaps.frombytes(zlib.decompress(teams_blob))
+        numbers, total = [], 0
+        for gap in gaps:
+            total += gap
+            numbers.append(total)
+        values = array("q")
+        values.frombytes(zlib.decompress(columns_blob))
+        columns = [values[i * num_teams:(i + 1) * num_teams] for i in range(len(METRICS))]
+        return numbers, columns
+
+    def _state_as_of(self, timestamp):
+        ts = _iso(timestamp) if timestamp is not None else None
+        clause, args = ("AND \"ts\" <= ?", (ts,)) if ts else ("", ())
+        keyframe = self.conn.execute(
+            f'SELECT "segmentId", "numTeams", "teams", "columns" FROM "segments" '
+            f'WHERE "keyframe" = 1 {clause} ORDER BY "segmentId" DESC LIMIT 1', args
+        ).fetchone()
+
+        state, start = {}, 0
+        if keyframe:
+            start = keyframe[0]
+            numbers, columns = self._decode(*keyframe[1:])
+            for j, n in enumerate(numbers):
+                state[n] = tuple(column[j] for column in columns)
+
+        zero = (0,) * len(METRICS)
+        for num_teams, teams_blob, columns_blob in self.conn.execute(
+            f'SELECT "numTeams", "teams", "columns" FROM "segments" '
+            f'WHERE "keyframe" = 0 AND "segmentId" > ? {clause} ORDER BY "segmentId"', (start, *args)
+        ):
+            numbers, columns = self._decode(num_teams, teams_blob, columns_blob)
+            for j, n in enumerate(numbers):
+                previous = state.get(n, zero)
+                state[n] = tuple(previous[i] + columns[i][j] for i in range(len(METRICS)))
+        return state
+
+    def state_as_of(self, timestamp):
+        """
+        Metrics of every team as of a point in time.
+        :param timestamp: (datetime | str) Point in time.
+        :return: (dict) teamNumber -> {metric: value}.
+        """
+        with self.lock:
+            state = self._state_as_of(timestamp)
+        return {n: _unfixed(vector) for n, vector in state.items()}
+
+    def rankings_as_of(self, timestamp, metric="overallOPR", top=None):
+        """
+        Teams ordered by a metric as of a point in time.
+        :param timestamp: (datetime | str) Point in time.
+        :param metric: (str) One of METRICS.
+        :param top: (int, optional) Only return the first `top` teams.
+        :return: (list) (rank, teamNumber, value) tuples.
+        """
+        state = self.state_as_of(timestamp)
+        reverse = metric not in ("penalties", "overallRank")
+        ordered = sorted(state.items(), key=lambda item: item[1][metric], reverse=reverse)[:top]
+        return [(rank, n, values[metric]) for rank, (n, values) in enumerate(ordered, start=1)]
+
+    def trajectory(self, team_number, metric=None):
+        """
+        Every recorded change of one team.
+        :param team_number: (int) Team number.
+        :param metric: (str, optional) Only return this metric instead of the whole vector.
+        :return: (list) (timestamp, values) tuples in chronological order.
+        """
+        with self.lock:
+            rows = self.conn.execute(
+                'SELECT s."ts", s."numTeams", s."teams", s."columns" FROM "team_index" i '
+                'JOIN "segments" s ON s."segmentId" = i."segmentId" '
+                'WHERE i."teamNumber" = ? ORDER BY i."segmentId"', (team_number,)
+            ).fetchall()
+
+        points, current = [], [0] * len(METRICS)
+        for ts, num_teams, teams_blob, columns_blob in rows:
+            numbers, columns = self._decode(num_teams, teams_blob, columns_blob)
+            j = bisect.bisect_left(numbers, team_number)
+            current = [current[i] + columns[i][j] for i in range(len(METRICS))]
+            values = _unfixed(current)
+            points.append((ts, values[metric] if metric else values))
+        return points
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+def _fixed(value):
+    return round(float(value or 0) * SCALE)
+
+def _unfixed(vector):
+    return {metric: value / SCALE for metric, value in zip(METRICS, vector)}
+
+def _iso(timestamp):
+    if isinstance(timestamp, str):
+        timestamp = datetime.fromisoformat(timestamp)
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.astimezone(timezone.utc).isoformat(timespec="microseconds")
@@ -0,0 +1,268 @@
+import json
+import threading
+import time
+
+class WriteQueue:
+    """
+    Durable write-behind queue for Supabase upserts.
+
+    Pending rows live in a table of the LocalMirror database, keyed by
+    (table, conflict key), so enqueueing a newer version of a row replaces the
+    older one: several updates to the same teamNumber or matchcode coalesce
+    into a single write. A background flusher drains the queue in batches,
+    taking the tables in turn, and backs off per table while Supabase is slow
+    or down, so one failing table never holds back the others. Rows stay on
+    disk until Supabase accepted them, so a run that exits before the queue is
+    empty picks them up again on the next start.
+
+    Errors that retrying cannot fix (4xx responses, a missing table or
+    column, rejected values) move the batch to the "dead_writes" table
+    instead of blocking the queue. dead_letters() reports them and
+    requeue_dead() puts them back once the schema is fixed.
+
+    Enqueue inside a mirror transaction to update the mirror and the queue
+    atomically.
+
+    Example usage:
+    --------------
+    queue = WriteQueue(mirror, supabase).start()
+    with mirror.transaction() as conn:
+        mirror.save(rows, [], conn=conn)
+        queue.enqueue("season_2025", "teamNumber", rows, conn=conn)
+    queue.drain(timeout=60)
+    queue.stop()
+    """
+    def __init__(self, mirror, supabase, batch_size=500, min_backoff=1.0, max_backoff=60.0):
+        """
+        :param mirror: (LocalMirror) Mirror whose database holds the queue.
+        :param supabase: (Client) Supabase client used to flush.
+        :param batch_size: (int) Maximum rows per upsert.
+        :param min_backoff: (float) Seconds to wait after the first failed flush.
+        :param max_backoff: (float) Upper bound for the exponential backoff.
+        """
+        self.mirror = mirror
+        self.supabase = supabase
+        self.batch_size = batch_size
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self.flushed = 0
+        self.failures = 0
+        self.dead_lettered = 0
+        self.last_error = None
+        self._next_table = None
+        self._retry_at = {}
+        self._backoff = {}
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+        with self.mirror.transaction() as conn:
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS "pending_writes" ('
+                '"tableName" TEXT NOT NULL, "onConflict" TEXT NOT NULL, "rowKey" TEXT NOT NULL, '
+                '"version" INTEGER NOT NULL, "payload" TEXT NOT NULL, '
+                'PRIMARY KEY ("tableName", "rowKey"))'
+            )
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS "dead_writes" ('
+                '"tableName" TEXT NOT NULL, "onConflict" TEXT NOT NULL, "rowKey" TEXT NOT NULL, '
+                '"version" INTEGER NOT NULL, "payload" TEXT NOT NULL, "error" TEXT NOT NULL, '
+                '"failedAt" REAL NOT NULL, PRIMARY KEY ("tableName", "rowKey"))'
+            )
+
+    def enqueue(self, table, on_conflict, rows, conn=None):
+        """
+        Queue rows for upsert, replacing any pending version of the same rows.
+        :param table: (str) Supabase table.
+        :param on_conflict: (str) Conflict column, also the coalescing key.
+        :param rows: (list) Row dicts.
+        :param conn: (sqlite3.Connection, optional) Connection of an open mirror transaction to join.
+        """
+        if not rows:
+            return
+        if conn is None:
+            with self.mirror.transaction() as conn:
+                return self.enqueue(table, on_conflict, rows, conn=conn)
+
+        version = conn.execute('SELECT COALESCE(MAX("version"), 0) + 1 FROM "pending_writes"').fetchone()[0]
+        conn.executemany(
+            'INSERT OR REPLACE INTO "pending_writes" VALUES (?, ?, ?, ?, ?)',
+            [(table, on_conflict, str(row[on_conflict]), version, json.dumps(row)) for row in rows],
+        )
+        self._wakeup.set()
+
+    def pending(self):
+        """
+        :return: (int) Number of rows waiting to be flushed.
+        """
+        with self.mirror.lock:
+            return self.mirror.conn.execute('SELECT COUNT(*) FROM "pending_writes"').fetchone()[0]
+
+    def dead_letters(self):
+        """
+        :return: (dict) Table -> (rows, last error) for rows that Supabase rejected permanently.
+        """
+        with self.mirror.lock:
+            rows = self.mirror.conn.execute(
+                'SELECT "tableName", "error" FROM "dead_writes" ORDER BY "failedAt"'
+            ).fetchall()
+        letters = {}
+        for table, error in rows:
+            count, _ = letters.get(table, (0, None))
+            letters[table] = (count + 1, error)
+        return letters
+
+    def requeue_dead(self, table=None):
+        """
+        Move dead-lettered rows back into the queue, e.g. after a missing table or column was created.
+        A pending newer version of a row wins over its dead-lettered one.
+        :param table: (str, optional) Only requeue this table.
+        :return: (int) Rows requeued.
+        """
+        clause, args = ('WHERE "tableName" = ?', (table,)) if table else ("", ())
+        with self.mirror.transaction() as conn:
+            cursor = conn.execute(
+                f'INSERT OR IGNORE INTO "pending_writes" '
+                f'SELECT "tableName", "onConflict", "rowKey", "version", "payload" FROM "dead_writes" {clause}',
+                args,
+            )
+            conn.execute(f'DELETE FROM "dead_writes" {clause}', args)
+        self._wakeup.set()
+        return cursor.rowcount
+
+    def _next_batch(self):
+        now = time.monotonic()
+        with self.mirror.lock:
+            heads = self.mirror.conn.execute(
+                'SELECT "tableName", "onConflict" FROM "pending_writes" '
+                'GROUP BY "tableName", "onConflict" ORDER BY MIN("version")'
+            ).fetchall()
+            ready = [tuple(head) for head in heads if self._retry_at.get(head[0], 0) <= now]
+            if not ready:
+                return None, None, []
+            # Round robin: continue with the first table after the one flushed last.
+            names = [table for table, _ in ready]
+            index = names.index(self._next_table) if self._next_table in names else 0
+            table, on_conflict = ready[index]
+            self._next_table = names[(index + 1) % len(names)]
+            batch = self.mirror.conn.execute(
+                'SELECT "rowKey", "version", "payload" FROM "pending_writes" '
+                'WHERE "tableName" = ? AND "onConflict" = ? ORDER BY "version" LIMIT ?',
+                (table, on_conflict, self.batch_size),
+            ).fetchall()
+        return table, on_conflict, batch
+
+    def flush_once(self):
+        """
+        Upsert one batch. A transient failure backs off its table only; a permanent one
+        dead-letters the batch.
+        :return: (int) Rows flushed or dead-lettered, 0 when no table is ready to flush.
+        """
+        table, on_conflict, batch = self._next_batch()
+        if not batch:
+            return 0
+        rows = [json.loads(payload) for _, _, payload in batch]
+        try:
+            self.supabase.table(table).upsert(rows, on_conflict=on_conflict).execute()
+        except Exception as e:
+            self.failures += 1
+            self.last_error = e
+            if _is_permanent(e):
+                self._dead_letter(table, on_conflict, batch, e)
+                return len(batch)
+            backoff = self._backoff.get(table, self.min_backoff)
+            self._retry_at[table] = time.monotonic() + backoff
+            self._backoff[table] = min(backoff * 2, self.max_backoff)
+            print(f"Write-behind flush of `{table}` failed, retrying in {backoff:g}s: {e}")
+            return 0
+
+        self._backoff.pop(table, None)
+        self._retry_at.pop(table, None)
+        with self.mirror.transaction() as conn:
+            # A row re-enqueued while this batch was in flight has a newer version and stays queued.
+            conn.executemany(
+                'DELETE FROM "pending_writes" WHERE "tableName" = ? AND "rowKey" = ? AND "version" = ?',
+                [(table, key, version) for key, version, _ in batch],
+            )
+        self.flushed += len(batch)
+        return len(batch)
+
+    def _dead_letter(self, table, on_conflict, batch, error):
+        now = time.time()
+        with self.mirror.transaction() as conn:
+            conn.executemany(
+                'INSERT OR REPLACE INTO "dead_writes" VALUES (?, ?, ?, ?, ?, ?, ?)',
+                [(table, on_conflict, key, version, payload, str(error), now) for key, version, payload in batch],
+            )
+            conn.executemany(
+                'DELETE FROM "pending_writes" WHERE "tableName" = ? AND "rowKey" = ? AND "version" = ?',
+                [(table, key, version) for key, version, _ in batch],
+            )
+        self.dead_lettered += len(batch)
+        print(f"❌ Supabase rejected {len(batch)} rows for `{table}`, moved to dead_writes: {error}")
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                if self.flush_once():
+                    continue
+            except Exception as e:
+                # Local errors (mirror I/O); the upsert itself never raises out of flush_once.
+                self.last_error = e
+                print(f"Write-behind flush failed: {e}")
+            retry_at = min(self._retry_at.values(), default=None)
+            wait = 1.0 if retry_at is None else min(1.0, max(0.05, retry_at - time.monotonic()))
+            self._wakeup.wait(wait)
+            self._wakeup.clear()
+
+    def start(self):
+        """Start the background flusher. Rows left over from a previous run are flushed first."""
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+            self._thread.start()
+        return self
+
+    def drain(self, timeout=None):
+        """
+        Wait for the queue to empty.
+        :param timeout: (float, optional) Maximum seconds to wait.
+        :return: (bool) True when everything was flushed.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.pending():
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            self._wakeup.set()
+            time.sleep(0.05)
+        return True
+
+    def stop(self, timeout=None):
+        """
+        Stop the flusher. Unflushed rows stay on disk for the next run.
+        :param timeout: (float, optional) Maximum seconds to wait for an in-flight upsert.
+        :return: (bool) True when the flusher has exited; False when it is still inside an upsert,
+            in which case the mirror must stay open.
+        """
+        self._stop.set()
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                return False
+            self._thread = None
+        return True
+
+# PostgREST request (PGRST1xx) and schema cache (PGRST2xx) errors, and SQLSTATE
+# classes for data exceptions (22), integrity violations (23) and undefined or invalid
+# objects such as a missing table or column (42). Retrying these never succeeds.
+_PERMANENT_SQLSTATE_CLASSES = ("22", "23", "42")
+
+def _is_permanent(error):
+    status = getattr(error, "status_code", None) or getattr(getattr(error, "response", None), "status_code", None)
+    if isinstance(status, int) and 400 <= status < 500 and status not in (408, 429):
+        return True
+    code = getattr(error, "code", None)
+    if isinstance(code, str):
+        return code.startswith(("PGRST1", "PGRST2")) or code[:2] in _PERMANENT_SQLSTATE_CLASSES
+    return False
@@ -0,0 +1,10 @@
+from .LocalMirror import LocalMirror
+from .WriteQueue import WriteQueue
+from .SnapshotStore import SnapshotStore
+from .SearchIndex import SearchIndex
+from .SeasonExport import SeasonExport
+from .ShardCoordinator import ShardCoordinator, open_coordinator
+from .PostgresShardCoordinator import PostgresShardCoordinator
+from .EventResultCache import EventResultCache
+from .ChangeFeed import ChangeFeed
+from .EventPlacements import EventPlacements
@@ -1,25 +1,26 @@
-from typing import Dict, Any, Tuple, Protocol, List
+from typing import Dict, Tuple, Protocol, List
+from API_Library.API_Models.Records import MatchRecord, MatchScore
 
 class ScoreAdapter(Protocol):
-    def endgame_points(self, match: Dict[str, Any]) -> Tuple[int, int]:
+    def endgame_points(self, match: MatchScore) -> Tuple[int, int]:
         ...
-    def penalties(self, match: Dict[str, Any]) -> Tuple[int, int]:
+    def penalties(self, match: MatchScore) -> Tuple[int, int]:
         ...
-    def map_matches(self, raw_matches: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def map_matches(self, raw_matches: List[MatchRecord]) -> List[MatchRecord]:
         return raw_matches
 
 class DefaultModernAdapter:
     """
     Seasons exposing teleop park/ascent and 'foulPointsCommitted' per alliance.
     """
-    def endgame_points(self, match: Dict[str, Any]) -> Tuple[int, int]:
-        red = match["alliances"][1]["teleopParkPoints"] + match["alliances"][1]["teleopAscentPoints"]
-        blue = match["alliances"][0]["teleopParkPoints"] + match["alliances"][0]["teleopAscentPoints"]
+    def endgame_points(self, match: MatchScore) -> Tuple[int, int]:
+        red = match.alliances[1].teleopParkPoints + match.alliances[1].teleopAscentPoints
+        blue = match.alliances[0].teleopParkPoints + match.alliances[0].teleopAscentPoints
         return red, blue
 
-    def penalties(self, match: Dict[str, Any]) -> Tuple[int, int]:
-        red = match["alliances"][1]["foulPointsCommitted"]
-        blue = match["alliances"][0]["foulPointsCommitted"]
+    def penalties(self, match: MatchScore) -> Tuple[int, int]:
+        red = match.alliances[1].foulPointsCommitted
+        blue = match.alliances[0].foulPointsCommitted
         return red, blue
 
 class Skystone2019Adapter:
@@ -27,14 +28,14 @@ class Skystone2019Adapter:
     2019 exposes:
       ... endGamePoints, penaltyPoints, totalPoints, autonomousPoints, etc.
     """
-    def endgame_points(self, match: Dict[str, Any]) -> Tuple[int, int]:
-        red = match["alliances"][1]["parkingPoints"] + match["alliances"][1]["capstonePoints"]
-        blue = match["alliances"][0]["parkingPoints"] + match["alliances"][0]["capstonePoints"]
+    def endgame_points(self, match: MatchScore) -> Tuple[int, int]:
+        red = match.alliances[1].parkingPoints + match.alliances[1].capstonePoints
+        blue = match.alliances[0].parkingPoints + match.alliances[0].capstonePoints
         return red, blue
 
-    def penalties(self, match: Dict[str, Any]) -> Tuple[int, int]:
-        red = match["alliances"][1]["penaltyPoints"]
-        blue = match["alliances"][0]["penaltyPoints"]
+    def penalties(self, match: MatchScore) -> Tuple[int, int]:
+        red = match.alliances[1].penaltyPoints
+        blue = match.alliances[0].penaltyPoints
         return red, blue
 
 class UltimateGoal2020Adapter:
@@ -42,14 +43,14 @@ class UltimateGoal2020Adapter:
     2020 exposes:
       ... endGamePoints, penaltyPoints, totalPoints, autonomousPoints, etc.
     """
-    def endgame_points(self, match: Dict[str, Any]) -> Tuple[int, int]:
-        red = match["alliances"][1]["endgamePoints"]
-        blue = match["alliances"][0]["endgamePoints"]
+    def endgame_points(self, match: MatchScore) -> Tuple[int, int]:
+        red = match.alliances[1].endgamePoints
+        blue = match.alliances[0].endgamePoints
         return red, blue
 
-    def penalties(self, match: Dict[str, Any]) -> Tuple[int, int]:
-        red = match["alliances"][1]["penaltyPoints"]
-        blue = match["alliances"][0]["penaltyPoints"]
+    def penalties(self, match: MatchScore) -> Tuple[int, int]:
+        red = match.alliances[1].penaltyPoints
+        blue = match.alliances[0].penaltyPoints
         return red, blue
     
 class FreightFrenzy2021Adapter:
@@ -57,18 +58,18 @@ class FreightFrenzy2021Adapter:
     2021 exposes:
       ... endGamePoints, penaltyPoints, totalPoints, autonomousPoints, etc.
     """
-    def endgame_points(self, match: Dict[str, Any]) -> Tuple[int, int]:
-        if match["alliances"]:
-            red = match["alliances"][1]["endgamePoints"]
-            blue = match["alliances"][0]["endgamePoints"]
+    def endgame_points(self, match: MatchScore) -> Tuple[int, int]:
+        if match.alliances:
+            red = match.alliances[1].endgamePoints
+            blue = match.alliances[0].endgamePoints
             return red, blue
         else:
             print(match)
             return None, None
 
-    def penalties(self, match: Dict[str, Any]) -> Tuple[int, int]:
-        red = match["alliances"][1]["penaltyPoints"]
-        blue = match["alliances"][0]["penaltyPoints"]
+    def penalties(self, match: MatchScore) -> Tuple[int, int]:
+        red = match.alliances[1].penaltyPoints
+        blue = match.alliances[0].penaltyPoints
         return red, blue
     
 class Powerplay2022Adapater:
@@ -76,14 +77,14 @@ class Powerplay2022Adapater:
     2022 exposes:
       ... endGamePoints, penaltyPoints, totalPoints, autonomousPoints, etc.
     """
-    def endgame_points(self, match: Dict[str, Any]) -> Tuple[int, int]:
-        red = match["alliances"][1]["endgamePoints"]
-        blue = match["alliances"][0]["endgamePoints"]
+    def endgame_points(self, match: MatchScore) -> Tuple[int, int]:
+        red = match.alliances[1].endgamePoints
+        blue = match.alliances[0].endgamePoints
         return red, blue
 
-    def penalties(self, match: Dict[str, Any]) -> Tuple[int, int]:
-        red = match["alliances"][1]["penaltyPointsCommitted"]
-        blue = match["alliances"][0]["penaltyPointsCommitted"]
+    def penalties(self, match: MatchScore) -> Tuple[int, int]:
+        red = match.alliances[1].penaltyPointsCommitted
+        blue = match.alliances[0].penaltyPointsCommitted
         return red, blue
 
 class Centerstage2023Adapter:
@@ -91,28 +92,28 @@ class Centerstage2023Adapter:
     2023 exposes:
       ... endGamePoints, penaltyPoints, totalPoints, autonomousPoints, etc.
     """
-    def endgame_points(self, match: Dict[str, Any]) -> Tuple[int, int]:
-        red = match["alliances"][1]["endgamePoints"]
-        blue = match["alliances"][0]["endgamePoints"]
+    def endgame_points(self, match: MatchScore) -> Tuple[int, int]:
+        red = match.alliances[1].endgamePoints
+        blue = match.alliances[0].endgamePoints
         return red, blue
 
-    def penalties(self, match: Dict[str, Any]) -> Tuple[int, int]:
-        red = match["alliances"][1]["penaltyPointsCommitted"]
-        blue = match["alliances"][0]["penaltyPointsCommitted"]
+    def penalties(self, match: MatchScore) -> Tuple[int, int]:
+        red = match.alliances[1].penaltyPointsCommitted
+        blue = match.alliances[0].penaltyPointsCommitted
         return red, blue
 
 class IntoTheDeep2024Adapter:
     """
     Seasons exposing teleop park/ascent and 'foulPointsCommitted' per alliance.
     """
-    def endgame_points(self, match: Dict[str, Any]) -> Tuple[int, int]:
-        red = match["alliances"][1]["teleopParkPoints"] + match["alliances"][1]["teleopAscentPoints"]
-        blue = match["alliances"][0]["teleopParkPoints"] + match["alliances"][0]["teleopAscentPoints"]
+    def endgame_points(self, match: MatchScore) -> Tuple[int, int]:
+        red = match.alliances[1].teleopParkPoints + match.alliances[1].teleopAscentPoints
+        blue = match.alliances[0].teleopParkPoints + match.alliances[0].teleopAscentPoints
         return red, blue
 
-    def penalties(self, match: Dict[str, Any]) -> Tuple[int, int]:
-        red = match["alliances"][1]["foulPointsCommitted"]
-        blue = match["alliances"][0]["foulPointsCommitted"]
+    def penalties(self, match: MatchScore) -> Tuple[int, int]:
+        red = match.alliances[1].foulPointsCommitted
+        blue = match.alliances[0].foulPointsCommitted
         return red, blue
 
 class Decode2025Adapter:
@@ -120,14 +121,14 @@ class Decode2025Adapter:
     2025 exposes:
       ... endGamePoints, penaltyPoints, totalPoints, autonomousPoints, etc.
     """
-    def endgame_points(self, match: Dict[str, Any]) -> Tuple[int, int]:
-        red = match["alliances"][1]["endgamePoints"]
-        blue = match["alliances"][0]["endgamePoints"]
+    def endgame_points(self, match: MatchScore) -> Tuple[int, int]:
+        red = match.alliances[1].endgamePoints
+        blue = match.alliances[0].endgamePoints
         return red, blue
 
-    def penalties(self, match: Dict[str, Any]) -> Tuple[int, int]:
-        red = match["alliances"][1]["foulPointsCommitted"]
-        blue = match["alliances"][0]["foulPointsCommitted"]
+    def penalties(self, match: MatchScore) -> Tuple[int, int]:
+        red = match.alliances[1].foulPointsCommitted
+        blue = match.alliances[0].foulPointsCommitted
         return red, blue
 
 SCORE_ADAPTERS: Dict[int, ScoreAdapter] = {
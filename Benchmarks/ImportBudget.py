@@ -0,0 +1,69 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGET_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "import_budget.json")
+
+def measure(module, runs=7):
+    """
+    Measure the cumulative import time of a module in fresh interpreters.
+
+    Uses `python -X importtime`, so interpreter start-up is excluded and only
+    the cost of importing the module and everything it pulls in is counted.
+    :param module: (str) Module to import, e.g. 'ManageDatabase'.
+    :param runs: (int) Number of fresh interpreters to sample.
+    :return: (dict) median/min milliseconds and the heavy modules that got imported.
+    """
+    timings = []
+    loaded = set()
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c",
+             f"import json, sys, {module}; print(json.dumps(sorted(sys.modules)))"],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+        )
+        for line in result.stderr.splitlines():
+            parts = [part.strip() for part in line.split("|")]
+            if len(parts) == 3 and parts[2] == module:
+                timings.append(int(parts[1]) / 1000)
+        loaded = set(json.loads(result.stdout))
+    return {"median_ms": statistics.median(timings), "min_ms": min(timings), "modules": loaded}
+
+def check(budget, runs=7):
+    """
+    Compare every module in the budget against its limit.
+    :param budget: (dict) Parsed import_budget.json.
+    :return: (list) Human-readable budget violations, empty when within budget.
+    """
+    failures = []
+    for module, limits in budget.items():
+        result = measure(module, runs)
+        eager = sorted(m for m in limits.get("lazy", []) if m in result["modules"])
+        status = "OK" if result["median_ms"] <= limits["max_ms"] and not eager else "FAIL"
+        print(f"{status:<4} import {module:<16} median {result['median_ms']:>7.1f} ms "
+              f"(min {result['min_ms']:.1f}, budget {limits['max_ms']} ms)")
+        if result["median_ms"] > limits["max_ms"]:
+            failures.append(f"{module} takes {result['median_ms']:.1f} ms to import, budget is {limits['max_ms']} ms")
+        if eager:
+            failures.append(f"{module} eagerly imports {', '.join(eager)}")
+    return failures
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fail when start-up import time exceeds the budget.")
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--budget", default=BUDGET_FILE)
+    args = parser.parse_args(argv)
+
+    with open(args.budget) as f:
+        budget = json.load(f)
+    failures = check(budget, args.runs)
+    for failure in failures:
+        print(f"❌ {failure}")
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
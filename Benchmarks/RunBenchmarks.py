@@ -0,0 +1,275 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime
+
+from Benchmarks.SyntheticSeason import SyntheticSeason
+from Benchmarks.StandIn import FTCStandIn, PostgRESTStandIn
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+BENCHMARKS = {}
+
+def benchmark(name):
+    """Register a benchmark function taking the Harness and returning a result dict."""
+    def register(fn):
+        BENCHMARKS[name] = fn
+        return fn
+    return register
+
+def time_it(fn, repeat, setup=None):
+    """
+    Time fn() repeat times, calling setup() untimed before each run.
+    :return: (dict) min/median/mean seconds over the runs.
+    """
+    runs = []
+    for _ in range(repeat):
+        arg = setup() if setup else None
+        start = time.perf_counter()
+        fn(arg) if setup else fn()
+        runs.append(time.perf_counter() - start)
+    return {
+        "min": min(runs),
+        "median": statistics.median(runs),
+        "mean": statistics.fmean(runs),
+        "runs": runs,
+    }
+
+class Harness:
+    """
+    Holds the synthetic season and the local FTC API / PostgREST stand-ins
+    shared by all benchmarks.
+    """
+    def __init__(self, season, repeat, latency=0.0):
+        self.season = season
+        self.repeat = repeat
+        self.ftc = FTCStandIn(season, latency=latency)
+        self.postgrest = PostgRESTStandIn(latency=latency)
+
+    def __enter__(self):
+        os.environ.setdefault("FIRST_USERNAME", "benchmark")
+        os.environ.setdefault("FIRST_PASS", "benchmark")
+        self.ftc.start()
+        self.postgrest.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.ftc.stop()
+        self.postgrest.stop()
+
+    def first_api(self):
+        from API_Library import FirstAPI
+        return FirstAPI(base_url=self.ftc.api_url, logo_url=self.ftc.logo_url)
+
+    def processor(self):
+        from ManageDatabase import TeamDataProcessor
+        return TeamDataProcessor(self.postgrest.url, PostgRESTStandIn.KEY, first_api=self.first_api(),
+                                 mirror_path=":memory:", history_path=":memory:", elo_path=None,
+                                 export_dir=None)
+
+    def raw_payloads(self, event_code):
+        """The matches and scores responses of an event as raw JSON bytes."""
+        return (json.dumps(self.season.matches_payload(event_code)).encode(),
+                json.dumps(self.season.scores_payload(event_code)).encode())
+
+    def decoded_matches(self, event_code):
+        from API_Library.FastDecode import FastDecode
+        from API_Library.API_Models.Records import MatchesPayload
+        return FastDecode.decode(self.raw_payloads(event_code)[0], MatchesPayload).matches
+
+    def prepared_matches(self, event_code):
+        """Event match records with the endgame/penalty columns filled in, as fetch_event_data_thread does."""
+        from API_Library.FastDecode import FastDecode
+        from API_Library.API_Models.Records import ScoresPayload
+        from API_Library.YearAdapters import DEFAULT_SCORE_ADAPTER, SCORE_ADAPTERS
+        adapter = SCORE_ADAPTERS.get(self.season.year, DEFAULT_SCORE_ADAPTER)
+        matches = self.decoded_matches(event_code)
+        scores = FastDecode.decode(self.raw_payloads(event_code)[1], ScoresPayload).matchScores
+        for match, score in zip(matches, scores):
+            match.scoreRedEndgame, match.scoreBlueEndgame = adapter.endgame_points(score)
+            match.penaltyPointsRed, match.penaltyPointsBlue = adapter.penalties(score)
+        return matches
+
+@benchmark("decode")
+def bench_decode(h):
+    from API_Library.FastDecode import FastDecode
+    from API_Library.API_Models.Records import MatchesPayload, ScoresPayload
+    payloads = [h.raw_payloads(code) for code in h.season.event_codes]
+
+    def decode():
+        for matches, scores in payloads:
+            FastDecode.decode(matches, MatchesPayload)
+            FastDecode.decode(scores, ScoresPayload)
+
+    timing = time_it(decode, h.repeat)
+    return {**timing, "items": h.season.num_matches, "unit": "matches", "msgspec": FastDecode.available()}
+
+@benchmark("matrix_builder")
+def bench_matrix_builder(h):
+    from API_Library.RobotMath import MatrixBuilder
+    events = [h.prepared_matches(code) for code in h.season.event_codes]
+    timing = time_it(lambda: [MatrixBuilder(matches) for matches in events], h.repeat)
+    return {**timing, "items": len(events), "unit": "events"}
+
+@benchmark("lse")
+def bench_lse(h):
+    from API_Library.RobotMath import MatrixBuilder, MatrixMath as mm
+    builders = [MatrixBuilder(h.prepared_matches(code)) for code in h.season.event_codes]
+
+    def solve():
+        for builder in builders:
+            for metric in ["auto", "tele", "endgame", "penalties"]:
+                mm.LSE(builder.binary_matrix, getattr(builder, f"{metric}_matrix"))
+
+    timing = time_it(solve, h.repeat)
+    return {**timing, "items": len(builders) * 4, "unit": "solves"}
+
+@benchmark("predict")
+def bench_predict(h):
+    import numpy as np
+    from API_Library.RobotMath import MatchPredictor
+    teams = list(h.season.teams.values())
+    predictor = MatchPredictor([t.teamNumber for t in teams], [t.auto + t.tele for t in teams], variance=h.season.noise ** 2)
+    numbers = np.array([t.teamNumber for t in teams])
+    rng = np.random.default_rng(h.season.rng.randrange(2 ** 32))
+    red, blue = rng.choice(numbers, (100_000, 2)), rng.choice(numbers, (100_000, 2))
+    timing = time_it(lambda: predictor.predict(red, blue), h.repeat)
+    return {**timing, "items": len(red), "unit": "matchups"}
+
+@benchmark("simulate_event")
+def bench_simulate_event(h):
+    from API_Library.RobotMath import EventSimulator, MatchPredictor
+    code = h.season.event_codes[0]
+    matches = h.decoded_matches(code)
+    teams = [h.season.teams[n] for n in h.season.events[code].teams]
+    predictor = MatchPredictor([t.teamNumber for t in teams], [t.auto + t.tele for t in teams], variance=h.season.noise ** 2)
+    # Only the first half of the qualification matches has been played.
+    simulator = EventSimulator(matches, predictor, results=matches[:len(matches) // 2])
+    num_sims = 20_000
+    timing = time_it(lambda: simulator.simulate(num_sims, seed=0), h.repeat)
+    return {**timing, "items": num_sims, "unit": "simulations"}
+
+@benchmark("match_maker")
+def bench_match_maker(h):
+    from API_Library.MatchMaker import MatchMaker
+    events = {code: h.decoded_matches(code) for code in h.season.event_codes}
+
+    def run():
+        match_maker = MatchMaker()
+        for code, matches in events.items():
+            match_maker.save_matches_for_event(code, matches)
+
+    timing = time_it(run, h.repeat)
+    return {**timing, "items": h.season.num_matches, "unit": "matches"}
+
+@benchmark("update_rankings")
+def bench_update_rankings(h):
+    from API_Library.API_Models.Team import Team
+    processor = h.processor()
+    rng = h.season.rng
+
+    def setup():
+        processor.team_data = {
+            number: Team(teamNumber=number, autoOPR=rng.uniform(0, 40), teleOPR=rng.uniform(0, 90),
+                         endgameOPR=rng.uniform(0, 30), penalties=rng.uniform(0, 10))
+            for number in h.season.teams
+        }
+
+    timing = time_it(lambda _: processor.update_rankings(), h.repeat, setup=setup)
+    return {**timing, "items": len(h.season.teams), "unit": "teams"}
+
+@benchmark("get_season")
+def bench_get_season(h):
+    timing = time_it(lambda api: api.get_season(year=h.season.year, events="All"), h.repeat, setup=h.first_api)
+    return {**timing, "items": len(h.season.events), "unit": "events"}
+
+@benchmark("end_to_end")
+def bench_end_to_end(h):
+    def cycle(processor):
+        processor.fetch_and_save_to_database(year=h.season.year, force_update=True, events="All")
+        processor.flush()
+        processor.close()
+
+    timing = time_it(cycle, h.repeat, setup=h.processor)
+    return {**timing, "items": len(h.season.events), "unit": "events"}
+
+@benchmark("import_time")
+def bench_import_time(h):
+    from Benchmarks.ImportBudget import measure
+    result = measure("ManageDatabase", runs=h.repeat)
+    median = result["median_ms"] / 1000
+    return {"min": result["min_ms"] / 1000, "median": median, "mean": median, "items": 1, "unit": "imports"}
+
+def git_revision():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True, stderr=subprocess.DEVNULL).strip()
+    except Exception:
+        return "unknown"
+
+def compare(results, baseline_path):
+    with open(baseline_path) as f:
+        baseline = json.load(f)["results"]
+    print(f"\nCompared to {baseline_path}:")
+    for name, result in results.items():
+        if name in baseline:
+            ratio = result["median"] / baseline[name]["median"]
+            print(f"  {name:<18} {ratio:>6.2f}x median ({'slower' if ratio > 1 else 'faster'})")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the ARES benchmark suite against local stand-ins.")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="Benchmarks to run (default: all).")
+    parser.add_argument("--teams", type=int, default=2000)
+    parser.add_argument("--events", type=int, default=60)
+    parser.add_argument("--teams-per-event", type=int, default=30)
+    parser.add_argument("--matches-per-team", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds of latency added by the stand-ins.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Result file (default: Benchmarks/results/<timestamp>.json).")
+    parser.add_argument("--compare", help="Earlier result file to compare medians against.")
+    args = parser.parse_args(argv)
+
+    config = {
+        "teams": args.teams,
+        "events": args.events,
+        "teams_per_event": args.teams_per_event,
+        "matches_per_team": args.matches_per_team,
+        "repeat": args.repeat,
+        "latency": args.latency,
+        "seed": args.seed,
+    }
+    season = SyntheticSeason(
+        num_teams=args.teams, num_events=args.events, teams_per_event=args.teams_per_event,
+        matches_per_team=args.matches_per_team, seed=args.seed,
+    )
+
+    results = {}
+    with Harness(season, args.repeat, latency=args.latency) as harness:
+        for name in args.only or BENCHMARKS:
+            result = BENCHMARKS[name](harness)
+            result["throughput"] = result["items"] / result["median"] if result["median"] else None
+            results[name] = result
+            print(f"{name:<18} median {result['median'] * 1000:>10.2f} ms   "
+                  f"{result['throughput']:>12.1f} {result['unit']}/s")
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{datetime.now().strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w") as f:
+        json.dump({
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "config": config,
+            "results": results,
+        }, f, indent=2)
+    print(f"Results written to {output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+
+CITIES = [
+    ("San Diego", "CA", "USA"), ("Austin", "TX", "USA"), ("Seattle", "WA", "USA"),
+    ("Boston", "MA", "USA"), ("Toronto", "ON", "Canada"), ("Bucharest", "B", "Romania"),
+    ("Guadalajara", "JAL", "Mexico"), ("Shenzhen", "GD", "China"), ("Denver", "CO", "USA"),
+]
+WORDS = [
+    "Robo", "Gear", "Iron", "Cyber", "Quantum", "Titan", "Circuit", "Phoenix", "Volt",
+    "Nova", "Bolt", "Falcon", "Atlas", "Pixel", "Torque", "Vortex", "Ares", "Orbit",
+]
+SPONSORS = ["Acme Corp", "STEM Foundation", "City High School", "Makerspace", "Boeing", "Local 4-H"]
+
+@dataclass
+class SyntheticTeam:
+    teamNumber: int
+    auto: float
+    tele: float
+    endgame: float
+    fouls: float
+    nameShort: str
+    nameFull: str
+    city: str
+    stateProv: str
+    country: str
+    rookieYear: int
+
+@dataclass
+class SyntheticEvent:
+    code: str
+    dateStart: datetime
+    teams: List[int] = field(default_factory=list)
+    matches: List[dict] = field(default_factory=list)
+    scores: List[dict] = field(default_factory=list)
+
+class SyntheticSeason:
+    """
+    Deterministic generator for a season of FTC events.
+
+    Every payload matches the shape of the corresponding FTC API v2.0 response
+    (events, matches, scores/{event}/qual, rankings/{event} and teams), so the data can be fed
+    straight into FirstAPI, MatchMaker and MatrixBuilder or served over HTTP by
+    FTCStandIn. Score breakdowns carry the fields used by every ScoreAdapter.
+
+    Example usage:
+    --------------
+    season = SyntheticSeason(num_teams=500, num_events=20, seed=7)
+    matches = season.matches_payload(season.event_codes[0])["matches"]
+    """
+    def __init__(self, year=2025, num_teams=2000, num_events=60, teams_per_event=30,
+                 matches_per_team=5, noise=15.0, start_date=None, seed=0):
+        """
+        :param year: (int) Season year used in URLs and dates.
+        :param num_teams: (int) Size of the team pool.
+        :param num_events: (int) Number of events in the season.
+        :param teams_per_event: (int) Teams drawn from the pool for each event.
+        :param matches_per_team: (int) Qualification matches played by each team at an event.
+        :param noise: (float) Standard deviation of per-alliance score noise.
+        :param start_date: (datetime) Start of the first event, defaults to today so
+            the events also show up in FirstAPI.get_future_season_events.
+        :param seed: (int) Seed for the random generator.
+        """
+        if teams_per_event < 4:
+            raise ValueError("teams_per_event must be at least 4 to fill two alliances")
+        self.year = year
+        self.noise = noise
+        self.rng = random.Random(seed)
+        self.start_date = start_date or datetime.now(timezone.utc).replace(hour=9, minute=0, second=0, microsecond=0)
+        self.teams: Dict[int, SyntheticTeam] = {}
+        self.events: Dict[str, SyntheticEvent] = {}
+
+        for i in range(num_teams):
+            number = 1000 + i * 7
+            city, state, country = self.rng.choice(CITIES)
+            self.teams[number] = SyntheticTeam(
+                teamNumber=number,
+                auto=self.rng.uniform(0, 40),
+                tele=self.rng.uniform(5, 90),
+                endgame=self.rng.uniform(0, 30),
+                fouls=self.rng.uniform(0, 10),
+                nameShort=f"{self.rng.choice(WORDS)} {self.rng.choice(WORDS)}",
+                nameFull=" & ".join(self.rng.sample(SPONSORS, 2)),
+                city=city,
+                stateProv=state,
+                country=country,
+                rookieYear=self.rng.randint(2005, year),
+            )
+
+        numbers = list(self.teams)
+        for i in range(num_events):
+            event = SyntheticEvent(
+                code=f"SYN{i:04d}",
+                dateStart=self.start_date + timedelta(days=i % 7),
+                teams=self.rng.sample(numbers, min(teams_per_event, len(numbers))),
+            )
+            self._play_event(event, matches_per_team)
+            self.events[event.code] = event
+
+    @property
+    def event_codes(self):
+        return list(self.events)
+
+    @property
+    def num_matches(self):
+        return sum(len(event.matches) for event in self.events.values())
+
+    def _alliance_score(self, red_numbers):
+        t1, t2 = (self.teams[n] for n in red_numbers)
+        auto = max(0, round(t1.auto + t2.auto + self.rng.gauss(0, self.noise / 3)))
+        endgame = max(0, round(t1.endgame + t2.endgame + self.rng.gauss(0, self.noise / 3)))
+        tele = max(0, round(t1.tele + t2.tele + self.rng.gauss(0, self.noise))) + endgame
+        fouls = max(0, round(t1.fouls + t2.fouls + self.rng.gauss(0, 3)))
+        return auto, tele, endgame, fouls
+
+    def _play_event(self, event, matches_per_team):
+        num_matches = max(1, len(event.teams) * matches_per_team // 4)
+        order = []
+        time = event.dateStart
+        for number in range(1, num_matches + 1):
+            if len(order) < 4:
+                order += self.rng.sample(event.teams, len(event.teams))
+            red, blue, order = order[:2], order[2:4], order[4:]
+            if len(set(red + blue)) < 4:
+                # The shuffled order wrapped around and repeated a team; draw a fresh four.
+                drawn = self.rng.sample(event.teams, 4)
+                red, blue = drawn[:2], drawn[2:]
+
+            red_auto, red_tele, red_endgame, red_fouls = self._alliance_score(red)
+            blue_auto, blue_tele, blue_endgame, blue_fouls = self._alliance_score(blue)
+            red_final = red_auto + red_tele + blue_fouls
+            blue_final = blue_auto + blue_tele + red_fouls
+            stamp = time.strftime("%Y-%m-%dT%H:%M:%S")
+            time += timedelta(minutes=7)
+
+            event.matches.append({
+                "actualStartTime": stamp,
+                "description": f"Qualification {number}",
+                "tournamentLevel": "QUALIFICATION",
+                "series": 0,
+                "matchNumber": number,
+                "scoreRedFinal": red_final,
+                "scoreRedFoul": blue_fouls,
+                "scoreRedAuto": red_auto,
+                "scoreBlueFinal": blue_final,
+                "scoreBlueFoul": red_fouls,
+                "scoreBlueAuto": blue_auto,
+                "postResultTime": stamp,
+                "teams": [
+                    {"teamNumber": team, "station": station, "dq": False, "onField": True}
+                    for team, station in zip(red + blue, ["Red1", "Red2", "Blue1", "Blue2"])
+                ],
+                "modifiedOn": stamp,
+            })
+            event.scores.append({
+                "matchLevel": "QUALIFICATION",
+                "matchSeries": 0,
+                "matchNumber": number,
+                "randomization": self.rng.randint(1, 3),
+                "alliances": [
+                    self._alliance_breakdown("Blue", blue_auto, blue_tele, blue_endgame, blue_fouls),
+                    self._alliance_breakdown("Red", red_auto, red_tele, red_endgame, red_fouls),
+                ],
+            })
+
+    @staticmethod
+    def _alliance_breakdown(color, auto, tele, endgame, fouls):
+        park = endgame // 2
+        return {
+            "alliance": color,
+            "team": 0,
+            "autoPoints": auto,
+            "teleopPoints": tele,
+            "endgamePoints": endgame,
+            "teleopParkPoints": park,
+            "teleopAscentPoints": endgame - park,
+            "parkingPoints": park,
+            "capstonePoints": endgame - park,
+            "foulPointsCommitted": fouls,
+            "penaltyPoints": fouls,
+            "penaltyPointsCommitted": fouls,
+            "totalPoints": auto + tele,
+        }
+
+    def events_payload(self):
+        return {
+            "events": [
+                {
+                    "code": event.code,
+                    "name": f"Synthetic Qualifier {event.code}",
+                    "type": "2",
+                    "typeName": "Qualifier",
+                    "city": "Synthetic",
+                    "country": "USA",
+                    "dateStart": event.dateStart.strftime("%Y-%m-%dT%H:%M:%S"),
+                    "dateEnd": (event.dateStart + timedelta(days=1)).strftime("%Y-%m-%dT%H:%M:%S"),
+                    "published": True,
+                }
+                for event in self.events.values()
+            ],
+            "eventCount": len(self.events),
+        }
+
+    def matches_payload(self, event_code):
+        event = self.events.get(event_code)
+        return {"matches": list(event.matches) if event else []}
+
+    def schedule_payload(self, event_code):
+        event = self.events.get(event_code)
+        return {
+            "schedule": [
+                {
+                    "description": match["description"],
+                    "tournamentLevel": match["tournamentLevel"],
+                    "series": match["series"],
+                    "matchNumber": match["matchNumber"],
+                    "startTime": match["actualStartTime"],
+                    "teams": [{**team, "surrogate": False} for team in match["teams"]],
+                    "modifiedOn": match["modifiedOn"],
+                }
+                for match in (event.matches if event else [])
+            ]
+        }
+
+    def scores_payload(self, event_code):
+        event = self.events.get(event_code)
+        return {"matchScores": list(event.scores) if event else []}
+
+    def rankings_payload(self, event_code):
+        """Qualification rankings of an event: ranking points (2 per win, 1 per tie), then average score."""
+        event = self.events.get(event_code)
+        records = {number: {"wins": 0, "losses": 0, "ties": 0, "points": 0, "played": 0}
+                   for number in (event.teams if event else [])}
+        for match in (event.matches if event else []):
+            red, blue = match["scoreRedFinal"], match["scoreBlueFinal"]
+            for team in match["teams"]:
+                own, other = (red, blue) if team["station"].startswith("Red") else (blue, red)
+                record = records[team["teamNumber"]]
+                record["wins" if own > other else "losses" if own < other else "ties"] += 1
+                record["points"] += own
+                record["played"] += 1
+
+        def sort_orders(record):
+            played = max(1, record["played"])
+            return (2 * record["wins"] + record["ties"]) / played, record["points"] / played
+
+        ranked = sorted(records.items(), key=lambda item: sort_orders(item[1]), reverse=True)
+        rankings = []
+        for rank, (number, record) in enumerate(ranked, start=1):
+            if not record["played"]:
+                continue
+            sort_order1, qual_average = sort_orders(record)
+            rankings.append({
+                "rank": rank,
+                "teamNumber": number,
+                "displayTeamNumber": str(number),
+                "teamName": self.teams[number].nameShort,
+                "sortOrder1": round(sort_order1, 2),
+                "sortOrder2": round(qual_average, 2),
+                "wins": record["wins"],
+                "losses": record["losses"],
+                "ties": record["ties"],
+                "qualAverage": round(qual_average, 2),
+                "dq": 0,
+                "matchesPlayed": record["played"],
+                "matchesCounted": record["played"],
+            })
+        return {"rankings": rankings}
+
+    def teams_payload(self, team_number):
+        team = self.teams.get(int(team_number))
+        if not team:
+            return {"teams": [], "teamCountTotal": 0}
+        return {
+            "teams": [{
+                "teamNumber": team.teamNumber,
+                "nameFull": team.nameFull,
+                "nameShort": team.nameShort,
+                "city": team.city,
+                "stateProv": team.stateProv,
+                "country": team.country,
+                "website": f"https://team{team.teamNumber}.example.org",
+                "rookieYear": team.rookieYear,
+                "robotName": None,
+                "districtCode": None,
+                "homeCMP": None,
+                "homeRegion": None,
+                "displayLocation": f"{team.city}, {team.stateProv}, {team.country}",
+            }],
+            "teamCountTotal": 1,
+            "teamCountPage": 1,
+            "pageCurrent": 1,
+            "pageTotal": 1,
+        }
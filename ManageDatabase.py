@@ -1,34 +1,113 @@
-import ast
+import argparse
 import os
 import logging
+from contextlib import nullcontext
+from typing import TYPE_CHECKING
 from API_Library import FirstAPI
-from dotenv import load_dotenv
-from supabase import create_client, Client
 from API_Library.API_Models.Team import Team
+from API_Library.Storage import ChangeFeed, EventPlacements, EventResultCache, LocalMirror, SearchIndex, SeasonExport, SnapshotStore, WriteQueue
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
+if TYPE_CHECKING:
+    from supabase import Client
+
 class TeamDataProcessor:
-    def __init__(self, supabase_url=None, supabase_key=None):
+    def __init__(self, supabase_url=None, supabase_key=None, first_api=None, mirror_path="ares_mirror.sqlite3",
+                 history_path="ares_history.sqlite3", elo_path="ares_elo.npz", export_dir="exports",
+                 cycle_deadline=None, change_feed_path="ares_changes.jsonl", change_table=None):
+        # supabase and dotenv are only needed once a processor is built, not for `--help`.
+        from supabase import create_client
+
         if not supabase_url or not supabase_key:
+            from dotenv import load_dotenv
             load_dotenv(override=True)
             supabase_url = os.getenv("SUPABASE_URL")
             supabase_key = os.getenv("SUPABASE_KEY")
             if not supabase_url or not supabase_key:
                 raise RuntimeError("SUPABASE_URL and SUPABASE_KEY must be set in .env")
         
-        self.supabase: Client = create_client(supabase_url, supabase_key)
+        self.supabase: "Client" = create_client(supabase_url, supabase_key)
         self.table = "season_2025"
         self.match_table = "matches_2025"
+        self.search_table = "search_2025"
         self.team_data = {}
         self.alliance_data = []
-        self.first_api = FirstAPI()
+        self.match_results = []
+        self.events = {}
+        self.first_api = first_api or FirstAPI()
+        self.mirror = LocalMirror(mirror_path, self.table, self.match_table)
+        self.write_queue = WriteQueue(self.mirror, self.supabase).start()
+        self.search_index = SearchIndex(self.mirror, self.search_table)
+        self.event_cache = EventResultCache(self.mirror, self.table)
+        self.placements = EventPlacements(self.mirror, self.table)
+        self.cycle_deadline = cycle_deadline
+        self.history = SnapshotStore(history_path)
+        self.elo_path = elo_path
+        self.elo_engine = None
+        self.export = SeasonExport(export_dir, 2025) if export_dir else None
+        self.change_feed = ChangeFeed(change_feed_path, 2025) if change_feed_path else None
+        self.change_table = change_table
+        self.profiler = None
+
+    def stage(self, name):
+        """Profile the enclosed block when a CycleProfiler is attached."""
+        return self.profiler.stage(name) if self.profiler else nullcontext()
 
     def fetch_season_data(self,year, debug=False, events='Future'):
-        season = self.first_api.get_season(debug=debug, events=events, year=year)
+        # Events that miss cycle_deadline or fail are published from their last known result.
+        season = self.first_api.get_season(debug=debug, events=events, year=year, deadline=self.cycle_deadline,
+                                           event_cache=self.event_cache)
+        self.apply_season(season)
+
+    def fetch_sharded_season_data(self, year, coordinator, debug=False, events='Future', shard_size=8,
+                                  lease_seconds=120.0, timeout=None):
+        """
+        Reducer side of a sharded cycle: split the events into leased shards, work on shards
+        alongside the workers until every shard is done, then merge the per-event results.
+        :param coordinator: (ShardCoordinator) Coordination table shared with the workers.
+        :param timeout: (float, optional) Stop waiting and merge the finished shards after this many seconds.
+            Events of unfinished shards are reported as laggards; they and the events shards failed on
+            are published from their last known results, as in fetch_season_data.
+        """
+        from API_Library.ShardWorker import ShardWorker, merge_shard_results, shard_event_results
+
+        event_codes = self.first_api.select_events(year=year, events=events)
+        cycle_id = coordinator.create_cycle(year, event_codes, shard_size=shard_size)
+        if debug:
+            print(f"🧩 Cycle {cycle_id}: {len(event_codes)} events in shards of {shard_size}")
+
+        worker = ShardWorker(self.first_api, coordinator, worker_id=f"reducer-{os.getpid()}", lease_seconds=lease_seconds)
+        if not worker.run(cycle_id=cycle_id, timeout=timeout):
+            print(f"⚠️ Cycle {cycle_id} timed out, merging finished shards only: {coordinator.progress(cycle_id)}")
+        results = coordinator.results(cycle_id)
+        coordinator.close_cycle(cycle_id)
+
+        finished = shard_event_results(results)
+        self.event_cache.save(finished)
+        # Events of shards that never completed missed the deadline; events a shard failed on were attempted.
+        finished_codes = {result.eventCode for result in finished}
+        attempted = finished_codes | {event for result in results for event in result["failed"]}
+        laggards = [event for event in event_codes if event not in attempted]
+        missing = [event for event in event_codes if event not in finished_codes]
+        fallbacks = self.event_cache.load(missing)
+        if laggards:
+            print(f"⏰ {len(laggards)} events missed the {timeout:g}s deadline: {', '.join(laggards)}")
+        if missing:
+            print(f"↩️ Using last known results for {len(fallbacks)} of {len(missing)} unfinished events")
+        if debug:
+            print(f"🧩 Merging {len(results)} shard results ({worker.completed} processed by the reducer)")
+        season = merge_shard_results(finished, year, fallbacks=fallbacks.values())
+        season.laggards = laggards
+        season.fallbacks = sorted(fallbacks)
+        self.apply_season(season)
+
+    def apply_season(self, season):
         for team in season.teams.values():
             self.team_data[team.teamNumber] = team
         self.alliance_data = self.convert_alliances_to_serializable_format(season.matches)
+        self.match_results = season.results
+        self.events = season.events
         
     def convert_alliances_to_serializable_format(self, matches_dict):
         serializable = []
@@ -47,21 +126,21 @@ class TeamDataProcessor:
             })
         return serializable
 
+    def bootstrap_mirror(self):
+        """Seed an empty local mirror with the remote season table. Only the first cycle pays for this read."""
+        existing_data = self.supabase.table(self.table).select("*").execute().data or []
+        self.mirror.bootstrap(existing_data)
+
     def merge_with_database(self, force_update=True):
-        existing_data = self.supabase.table(self.table).select(
-            "teamNumber,teamName,sponsors,location,autoOPR,teleOPR,endgameOPR,overallOPR,autoRank,teleRank,endgameRank,overallRank,penalties,penaltyRank,profileUpdate,eventDate,eventsAttended,founded,website"
-        ).execute().data or []
+        if self.mirror.is_empty():
+            self.bootstrap_mirror()
+        existing_data = self.mirror.load_teams().values()
 
         for row in existing_data:
             team_number = row["teamNumber"]
 
             api_team = self.team_data[team_number] if team_number in self.team_data else Team(overallOPR=-100)
-            events_raw = row.get("eventsAttended")
-            try:
-                parsed_events = ast.literal_eval(events_raw) if isinstance(events_raw, str) else events_raw
-                existing_events = set(parsed_events)
-            except Exception:
-                existing_events = set()
+            existing_events = set(row["eventsAttended"])
             new_api_events = api_team.eventsAttended if isinstance(api_team.eventsAttended, list) else []
             merged_events = sorted(existing_events.union(new_api_events))
             api_team.eventsAttended = merged_events
@@ -71,7 +150,8 @@ class TeamDataProcessor:
                 api_team.website = row["website"]
             self.team_data[team_number] = api_team
 
-            if not force_update and api_team.overallOPR <= row.get("overallOPR", -1):
+            db_opr = row["overallOPR"] if row.get("overallOPR") is not None else -1
+            if not force_update and api_team.overallOPR <= db_opr:
                 db_team = Team(
                     teamName=row["teamName"],
                     sponsors=row["sponsors"],
@@ -93,11 +173,49 @@ class TeamDataProcessor:
                     founded= row.get("founded", 0),
                     website= row.get("website", ""),
                     eventsAttended=merged_events,
-                    averagePlace= row.get("averagePlace", 0.0),
+                    averagePlace= row.get("averagePlace") or 0.0,
+                    eloRating= row.get("eloRating") or 0.0,
+                    overallOPRError= row.get("overallOPRError") or 0.0,
                 )
                 
                 self.team_data[team_number] = db_team
 
+    def update_average_places(self, debug=False):
+        """
+        Fold this cycle's event rankings into the per-team running totals and set averagePlace.
+        Only ranks that are new or moved since the last cycle touch the totals.
+        """
+        changed = self.placements.update(
+            {code: event.rankings for code, event in self.events.items() if event.rankings}
+        )
+        averages = self.placements.averages()
+        for team_number, team in self.team_data.items():
+            if team_number in averages:
+                team.averagePlace = averages[team_number]
+            elif team_number in changed:
+                # Dropped from the only event it was ranked at.
+                team.averagePlace = 0.0
+        if debug:
+            print(f"🏁 Updated average placement of {len(changed)} teams")
+
+    def update_elo_ratings(self, debug=False):
+        """
+        Feed this cycle's match results to the Elo engine. The checkpoint remembers every
+        match already applied, so only new matches move the ratings.
+        """
+        if self.elo_engine is None:
+            from API_Library.RobotMath import EloEngine
+            self.elo_engine = EloEngine.load(self.elo_path)
+        engine = self.elo_engine
+        applied = engine.update(self.match_results)
+        for team_number, team in self.team_data.items():
+            if team_number in engine.team_index:
+                team.eloRating = engine.rating(team_number)
+        if self.elo_path:
+            engine.save(self.elo_path)
+        if debug:
+            print(f"📈 Applied {applied} new matches to Elo ratings")
+
     def update_rankings(self):
         teams = list(self.team_data.values())
 
@@ -117,11 +235,28 @@ class TeamDataProcessor:
         assign_rank("endgameOPR", "endgameRank")
         assign_rank("penalties", "penaltyRank", reverse=False)
 
-    def fetch_and_save_to_database(self, year, debug=False, force_update=False, events='Future'):
-        self.fetch_season_data(debug=debug, events=events, year=year)
-        self.merge_with_database(force_update=force_update)
-        self.update_rankings()
-        self.first_api.set_team_logos(list(self.team_data.values()))
+    def fetch_and_save_to_database(self, year, debug=False, force_update=False, events='Future', coordinator=None,
+                                   shard_size=8, lease_seconds=120.0):
+        with self.stage("fetch"):
+            if coordinator:
+                self.fetch_sharded_season_data(year, coordinator, debug=debug, events=events, shard_size=shard_size,
+                                               lease_seconds=lease_seconds, timeout=self.cycle_deadline)
+            else:
+                self.fetch_season_data(debug=debug, events=events, year=year)
+        with self.stage("merge"):
+            self.merge_with_database(force_update=force_update)
+        with self.stage("places"):
+            self.update_average_places(debug=debug)
+        with self.stage("elo"):
+            self.update_elo_ratings(debug=debug)
+        with self.stage("rank"):
+            self.update_rankings()
+        with self.stage("history"):
+            recorded = self.history.append([team for team in self.team_data.values() if team.teamNumber])
+            if debug:
+                print(f"🕓 Recorded OPR history for {recorded} changed teams")
+        with self.stage("logos"):
+            self.first_api.set_team_logos(list(self.team_data.values()))
 
         serializable_data = []
         now = datetime.now(ZoneInfo("America/Los_Angeles"))
@@ -148,43 +283,174 @@ class TeamDataProcessor:
                 "founded": team_info.founded,
                 "website": team_info.website,
                 "eventsAttended": team_info.eventsAttended,
-                "averagePlace": team_info.averagePlace,
+                "averagePlace": float(team_info.averagePlace),
+                "eloRating": float(team_info.eloRating),
+                "overallOPRError": float(team_info.overallOPRError),
             }
             serializable_data.append(team_dict)
             
-        resp = None
-        if serializable_data:
-            resp = (
-                self.supabase
-                .table(self.table)
-                .upsert(serializable_data, on_conflict="teamNumber")
-                .execute()
-            )
-            
-        if self.alliance_data:
-            self.supabase.table(self.match_table).upsert(self.alliance_data, on_conflict="matchcode").execute()
+        with self.stage("upsert"):
+            # Only rows that differ from the local mirror are written. They are committed to
+            # the mirror and the durable write-behind queue in one transaction; the queue's
+            # background flusher sends them to Supabase, so the cycle never waits on it.
+            # The search index re-tokenizes only teams whose profile text changed.
+            # The same diff is published as the cycle's change feed entry, appended last so a
+            # failed append rolls the mirror back and the changes are published next cycle.
+            team_changes = self.mirror.team_changes(serializable_data)
+            changed_teams = [row for row, _ in team_changes]
+            changed_matches = self.mirror.changed_matches(self.alliance_data)
+            entry = None
+            with self.mirror.transaction() as conn:
+                self.mirror.save(changed_teams, changed_matches, conn=conn)
+                changed_tokens = self.search_index.update(serializable_data, conn=conn)
+                self.write_queue.enqueue(self.table, "teamNumber", changed_teams, conn=conn)
+                self.write_queue.enqueue(self.match_table, "matchcode", changed_matches, conn=conn)
+                self.write_queue.enqueue(self.search_table, "token", changed_tokens, conn=conn)
+                if self.change_feed:
+                    replaced = self.mirror.replaced_matches(changed_matches)
+                    entry = self.change_feed.publish(team_changes, changed_matches, replaced)
+                    if entry and self.change_table:
+                        self.write_queue.enqueue(self.change_table, "seq", [entry], conn=conn)
 
-
-        count = len(resp and resp.data or [])
         if debug:
-            print(f"✅ Upserted {len(self.alliance_data)} matches into `{self.match_table}`")
-            print(f"✅ Upserted {count} rows into `{self.table}`")
+            print(f"✅ Queued {len(changed_matches)} of {len(self.alliance_data)} matches for `{self.match_table}`")
+            print(f"✅ Queued {len(changed_teams)} of {len(serializable_data)} rows for `{self.table}`")
+            print(f"✅ Queued {len(changed_tokens)} search tokens for `{self.search_table}`")
+            if entry:
+                print(f"📰 Published change feed entry {entry['seq']}: {len(entry['teams'])} teams, "
+                      f"{len(entry['matches'])} matches")
+
+        if self.export:
+            with self.stage("export"):
+                self.export_snapshot(serializable_data, debug=debug)
+
+    def export_snapshot(self, serializable_data, debug=False):
+        """Write the cycle's columnar snapshot for analytics; skipped when pyarrow is not installed."""
+        if not self.export.available():
+            if debug:
+                print("⚠️ pyarrow is not installed, skipping the columnar export")
+            return
+        try:
+            manifest = self.export.write(serializable_data, self.alliance_data, self.events)
+            if debug:
+                print(f"🗄 Exported {manifest['files']['teams.parquet']} teams to `{self.export.directory}/{manifest['cycle']}`")
+        except Exception as e:
+            print(f"Error writing columnar export: {e}")
+
+    def flush(self, timeout=None):
+        """
+        Give the write-behind queue up to `timeout` seconds to reach Supabase.
+        :return: (bool) True when nothing is left pending.
+        """
+        flushed = self.write_queue.drain(timeout)
+        if not flushed:
+            print(f"⏳ {self.write_queue.pending()} rows still queued for Supabase, they will be flushed next run")
+        for table, (count, error) in self.write_queue.dead_letters().items():
+            print(f"❌ {count} rows for `{table}` were rejected by Supabase and are parked in dead_writes "
+                  f"(fix the table, then WriteQueue.requeue_dead): {error}")
+        return flushed
 
     def close(self):
-        pass
+        self.history.close()
+        if self.write_queue.stop(timeout=5):
+            self.mirror.close()
+        else:
+            # The flusher is still inside an upsert and writes to the mirror when it returns. It is a
+            # daemon thread, so the mirror is left open rather than closed under it.
+            print("⏳ Write-behind flusher still busy, leaving the mirror open")
 
-def main(debug=False):
+def run_worker(coordination_path, worker_id=None, lease_seconds=120.0, wait=300.0, first_api=None):
+    """Worker role: process shards of the open cycle until it is complete. Needs no Supabase credentials."""
+    from API_Library.Storage import open_coordinator
+    from API_Library.ShardWorker import ShardWorker
+
+    coordinator = open_coordinator(coordination_path)
+    worker = ShardWorker(first_api or FirstAPI(), coordinator, worker_id=worker_id, lease_seconds=lease_seconds)
+    try:
+        if worker.run(wait=wait):
+            print(f"✅ Worker {worker.worker_id} finished, {worker.completed} shards processed")
+        else:
+            print(f"⏳ Worker {worker.worker_id} found no open cycle within {wait:.0f}s")
+    finally:
+        coordinator.close()
+
+def main(debug=False, profile=None, profile_dir=None, flush_timeout=60.0, export_dir="exports", role="single",
+         coordination_path="ares_coordination.sqlite3", shard_size=8, lease_seconds=120.0, worker_id=None,
+         worker_wait=300.0, cycle_deadline=240.0, connect_timeout=5.0, read_timeout=30.0, hedge_budget=0.05,
+         change_feed_path="ares_changes.jsonl", change_table=None):
     if debug:
         logging.basicConfig(level=logging.INFO)
-    processor = TeamDataProcessor()
+    first_api = FirstAPI(connect_timeout=connect_timeout, read_timeout=read_timeout, hedge_budget=hedge_budget)
+    if role == "worker":
+        return run_worker(coordination_path, worker_id=worker_id, lease_seconds=lease_seconds, wait=worker_wait,
+                          first_api=first_api)
+
+    coordinator = None
+    if role == "coordinator":
+        from API_Library.Storage import open_coordinator
+        coordinator = open_coordinator(coordination_path)
+    processor = TeamDataProcessor(first_api=first_api, export_dir=export_dir, cycle_deadline=cycle_deadline or None,
+                                  change_feed_path=change_feed_path, change_table=change_table)
+    if profile:
+        from API_Library.CycleProfiler import CycleProfiler
+        processor.profiler = CycleProfiler(mode=profile, run_dir=profile_dir)
+    sharding = {"coordinator": coordinator, "shard_size": shard_size, "lease_seconds": lease_seconds}
     try:
         if debug:
-            processor.fetch_and_save_to_database(year=2025, debug=debug, force_update=True, events='All')
+            processor.fetch_and_save_to_database(year=2025, debug=debug, force_update=True, events='All', **sharding)
         else:
-            processor.fetch_and_save_to_database(year=2025, debug=debug)
+            processor.fetch_and_save_to_database(year=2025, debug=debug, **sharding)
+        processor.flush(timeout=flush_timeout)
     finally:
         processor.close()
+        if coordinator:
+            coordinator.close()
+        if processor.profiler:
+            print(f"📊 Profile written to {processor.profiler.close()}")
         logging.info("Done.")
 
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Fetch FTC data, compute OPR rankings and upsert them into Supabase.")
+    parser.add_argument("--debug", action=argparse.BooleanOptionalAction, default=True,
+                        help="Process all events with force_update and show progress (default: on).")
+    parser.add_argument("--profile", choices=["cprofile", "sample"], nargs="?", const="cprofile",
+                        help="Profile the cycle with cProfile (default) or the sampling profiler.")
+    parser.add_argument("--profile-dir", help="Directory for profile reports (default: profiles/<timestamp>).")
+    parser.add_argument("--flush-timeout", type=float, default=60.0,
+                        help="Seconds to wait for queued Supabase writes before exiting; the rest is kept for the next run.")
+    parser.add_argument("--export-dir", default="exports",
+                        help="Root of the Parquet/Arrow season snapshot (needs pyarrow); pass '' to disable.")
+    parser.add_argument("--role", choices=["single", "coordinator", "worker"], default="single",
+                        help="single: one process does everything; coordinator: shard the events, reduce and upsert; "
+                             "worker: process shards of the open cycle.")
+    parser.add_argument("--coordination", default="ares_coordination.sqlite3",
+                        help="Coordination database shared by the coordinator and the workers: a postgresql:// URL "
+                             "(e.g. the Supabase database) for workers on several hosts, or a SQLite file on local "
+                             "disk for processes on one host.")
+    parser.add_argument("--shard-size", type=int, default=8, help="Events per shard (coordinator).")
+    parser.add_argument("--lease", type=float, default=120.0,
+                        help="Seconds a shard lease lasts without a heartbeat before it is reassigned.")
+    parser.add_argument("--worker-id", help="Unique worker id (default: host-pid).")
+    parser.add_argument("--worker-wait", type=float, default=300.0,
+                        help="Seconds a worker waits for a coordinator to open a cycle.")
+    parser.add_argument("--cycle-deadline", type=float, default=240.0,
+                        help="Seconds the event fetch may take; late events are published from their last known "
+                             "results (0 disables the deadline).")
+    parser.add_argument("--connect-timeout", type=float, default=5.0, help="Seconds to wait for an FTC API connection.")
+    parser.add_argument("--read-timeout", type=float, default=30.0, help="Seconds to wait for an FTC API response.")
+    parser.add_argument("--hedge-budget", type=float, default=0.05,
+                        help="Fraction of FTC API GETs that may be duplicated when slower than their endpoint's p95 "
+                             "(0 disables hedging).")
+    parser.add_argument("--change-feed", default="ares_changes.jsonl",
+                        help="Append-only log of per-cycle team and match changes; pass '' to disable.")
+    parser.add_argument("--change-table",
+                        help="Also publish change feed entries to this Supabase table (keyed by seq), e.g. changes_2025.")
+    return parser.parse_args(argv)
+
 if __name__ == "__main__":
-    main(debug=True)
\ No newline at end of file
+    args = parse_args()
+    main(debug=args.debug, profile=args.profile, profile_dir=args.profile_dir, flush_timeout=args.flush_timeout,
+         export_dir=args.export_dir, role=args.role, coordination_path=args.coordination, shard_size=args.shard_size,
+         lease_seconds=args.lease, worker_id=args.worker_id, worker_wait=args.worker_wait,
+         cycle_deadline=args.cycle_deadline, connect_timeout=args.connect_timeout, read_timeout=args.read_timeout,
+         hedge_budget=args.hedge_budget, change_feed_path=args.change_feed, change_table=args.change_table)
\ No newline at end of file
@@ -0,0 +1,323 @@
+import argparse
+import bisect
+import hashlib
+import json
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from API_Library.API_Models.Team import split_location
+from API_Library.Storage import LocalMirror
+
+# URL name -> rank column written by TeamDataProcessor.update_rankings.
+METRICS = {
+    "overall": "overallRank",
+    "auto": "autoRank",
+    "tele": "teleRank",
+    "endgame": "endgameRank",
+    "penalty": "penaltyRank",
+}
+MAX_LIMIT = 1000
+DEFAULT_LIMIT = 50
+
+class RankingsSnapshot:
+    """
+    Immutable, query-ready view of one ranked season.
+
+    For every metric the team numbers are kept sorted by rank, with a parallel
+    list of ranks for bisecting rank ranges, once for the whole season and once
+    per region (country and country/state). Responses are cached per snapshot,
+    and the snapshot's digest is the base of every ETag, so a client holding a
+    response from the same snapshot gets a 304.
+    """
+    def __init__(self, rows):
+        """
+        :param rows: (iterable) Team rows as stored in the season table.
+        """
+        self.teams = {}
+        regions = {}
+        for row in rows:
+            team = {k: v for k, v in row.items() if k != "teamLogo"}
+            self.teams[int(row["teamNumber"])] = team
+            country, state = _region(row.get("location"))
+            regions.setdefault((country, None), []).append(team)
+            regions.setdefault((country, state), []).append(team)
+
+        self.leaderboards = {
+            (metric, region): _leaderboard(teams, column)
+            for metric, column in METRICS.items()
+            for region, teams in [((None, None), list(self.teams.values())), *regions.items()]
+        }
+        self.digest = hashlib.sha1(
+            json.dumps(sorted(self.teams.items()), sort_keys=True, default=str).encode()
+        ).hexdigest()[:16]
+        self.loaded_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        self._responses = {}
+        self._lock = threading.Lock()
+
+    def leaderboard(self, metric, limit=DEFAULT_LIMIT, offset=0, rank_from=None, rank_to=None,
+                    country=None, state=None):
+        """
+        Teams ordered by a metric's rank.
+        :param metric: (str) One of METRICS.
+        :param limit: (int) Maximum number of teams.
+        :param offset: (int) Teams to skip, for paging through a top-K list.
+        :param rank_from: (int, optional) Smallest season rank to include.
+        :param rank_to: (int, optional) Largest season rank to include.
+        :param country: (str, optional) Only teams from this country.
+        :param state: (str, optional) Only teams from this state/province (with country).
+        :return: (dict) metric, total and the teams, each with its season and regional rank.
+        """
+        board = self.leaderboards.get((metric, (country, state if country else None)))
+        if board is None:
+            return {"metric": metric, "total": 0, "teams": []}
+        numbers, ranks = board
+        start = bisect.bisect_left(ranks, rank_from) if rank_from is not None else 0
+        end = bisect.bisect_right(ranks, rank_to) if rank_to is not None else len(ranks)
+        start = min(start + offset, end)
+        end = min(end, start + limit)
+        column = METRICS[metric]
+        return {
+            "metric": metric,
+            "total": len(numbers),
+            "teams": [
+                {**self.teams[n], "rank": self.teams[n][column], "regionalRank": i + 1}
+                for i, n in zip(range(start, end), numbers[start:end])
+            ],
+        }
+
+    def cached(self, key, build):
+        """
+        Serialized response for a request key, built once per snapshot.
+        :return: (bytes) JSON body.
+        """
+        with self._lock:
+            body = self._responses.get(key)
+        if body is None:
+            body = json.dumps(build(), default=str).encode()
+            with self._lock:
+                if len(self._responses) > 4096:
+                    self._responses.clear()
+                self._responses[key] = body
+        return body
+
+class RankingsService:
+    """
+    Read-only HTTP service for season leaderboards.
+
+    Serves the ranked season from the local mirror that TeamDataProcessor
+    writes, out of an in-memory RankingsSnapshot. A background thread watches
+    the mirror and, after every committed update cycle, builds a new snapshot
+    and swaps it in with a single reference assignment; requests in flight keep
+    the snapshot they started with.
+
+    Routes:
+        GET /rankings/<metric>?limit=&offset=           top-K (metric: overall, auto, tele, endgame, penalty)
+        GET /rankings/<metric>?from=&to=                season rank range
+        GET /rankings/<metric>?country=&state=&limit=   regional leaderboard
+        GET /teams/<teamNumber>
+        GET /health
+
+    Example usage:
+    --------------
+    service = RankingsService("ares_mirror.sqlite3", port=8080).start()
+    service.serve_forever()
+    """
+    def __init__(self, mirror_path="ares_mirror.sqlite3", season_table="season_2025", match_table="matches_2025",
+                 host="127.0.0.1", port=8080, poll_interval=5.0, max_age=30):
+        """
+        :param mirror_path: (str) Local mirror written by TeamDataProcessor.
+        :param season_table: (str) Team table in the mirror.
+        :param match_table: (str) Match table in the mirror.
+        :param host: (str) Interface to listen on.
+        :param port: (int) Port to listen on, 0 for an ephemeral port.
+        :param poll_interval: (float) Seconds between checks for a new update cycle.
+        :param max_age: (int) Cache-Control max-age of responses.
+        """
+        self.mirror_path = mirror_path
+        self.season_table = season_table
+        self.match_table = match_table
+        self.mirror = None
+        self.poll_interval = poll_interval
+        self.max_age = max_age
+        self.snapshot = RankingsSnapshot([])
+        self._data_version = None
+        self._stop = threading.Event()
+        self._watcher = None
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        try:
+            self.reload()
+        except sqlite3.Error as e:
+            print(f"Mirror not readable yet, serving an empty snapshot: {e}")
+
+    @property
+    def url(self):
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def publish(self, rows):
+        """
+        Swap in a snapshot built from team rows.
+        :param rows: (iterable) Team rows.
+        :return: (RankingsSnapshot) The new snapshot.
+        """
+        snapshot = RankingsSnapshot(rows)
+        self.snapshot = snapshot
+        return snapshot
+
+    def reload(self, force=False):
+        """
+        Rebuild the snapshot if the mirror changed since the last load. The mirror is opened
+        read-only, so the service never contends with the update cycle for the writer lock.
+        :return: (bool) True when a new snapshot was published.
+        """
+        if self.mirror is None:
+            # The mirror is created by the first update cycle; until then there is nothing to serve.
+            self.mirror = LocalMirror(self.mirror_path, self.season_table, self.match_table, read_only=True)
+        with self.mirror.lock:
+            # data_version changes whenever another connection commits to the database.
+            version = self.mirror.conn.execute("PRAGMA data_version").fetchone()[0]
+            if not force and version == self._data_version:
+                return False
+            # One read transaction, so teams and their events come from the same commit.
+            self.mirror.conn.execute("BEGIN")
+            try:
+                rows = self.mirror.load_teams().values()
+            finally:
+                self.mirror.conn.execute("COMMIT")
+        self._data_version = version
+        self.publish(rows)
+        return True
+
+    def _watch(self):
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.reload()
+            except Exception as e:
+                print(f"Error reloading rankings: {e}")
+
+    def route(self, path, query):
+        """
+        Resolve a request against the current snapshot.
+        :return: (tuple) status, body bytes and the snapshot that answered.
+        """
+        snapshot = self.snapshot
+        parts = [p for p in path.split("/") if p]
+        key = (path, tuple(sorted((k, tuple(v)) for k, v in query.items())))
+        try:
+            if parts == ["health"]:
+                return 200, json.dumps({
+                    "teams": len(snapshot.teams), "version": snapshot.digest, "loadedAt": snapshot.loaded_at,
+                }).encode(), snapshot
+            if len(parts) == 2 and parts[0] == "teams":
+                team = snapshot.teams.get(int(parts[1]))
+                if team is None:
+                    return 404, _error(f"Team {parts[1]} not found"), snapshot
+                return 200, snapshot.cached(key, lambda: team), snapshot
+            if len(parts) == 2 and parts[0] == "rankings" and parts[1] in METRICS:
+                args = {
+                    "limit": min(_int(query, "limit", DEFAULT_LIMIT), MAX_LIMIT),
+                    "offset": max(_int(query, "offset", 0), 0),
+                    "rank_from": _int(query, "from", None),
+                    "rank_to": _int(query, "to", None),
+                    "country": query.get("country", [None])[0],
+                    "state": query.get("state", [None])[0],
+                }
+                return 200, snapshot.cached(key, lambda: snapshot.leaderboard(parts[1], **args)), snapshot
+        except ValueError as e:
+            return 400, _error(str(e)), snapshot
+        return 404, _error(f"Unknown route {path}"), snapshot
+
+    def _handler_class(self):
+        service = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                status, body, snapshot = service.route(parsed.path, parse_qs(parsed.query))
+                etag = f'"{snapshot.digest}-{hashlib.sha1(self.path.encode()).hexdigest()[:8]}"'
+                if status == 200 and etag in (self.headers.get("If-None-Match") or ""):
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                if status == 200:
+                    self.send_header("ETag", etag)
+                    self.send_header("Cache-Control", f"public, max-age={service.max_age}")
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+    def start(self):
+        """Start watching the mirror for new update cycles."""
+        self._watcher = threading.Thread(target=self._watch, daemon=True)
+        self._watcher.start()
+        return self
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def serve_in_background(self):
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._server.shutdown()
+        self._server.server_close()
+        if self.mirror:
+            self.mirror.close()
+
+def _leaderboard(teams, column):
+    ranked = sorted(
+        (team[column], team["teamNumber"]) for team in teams if team.get(column) is not None
+    )
+    return [n for _, n in ranked], [r for r, _ in ranked]
+
+def _region(location):
+    _, state, country = split_location(location)
+    return country or "Unknown", state or "Unknown"
+
+def _int(query, name, default):
+    value = query.get(name, [None])[0]
+    if value is None or value == "":
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"'{name}' must be an integer")
+
+def _error(message):
+    return json.dumps({"message": message}).encode()
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Serve season leaderboards from the local mirror.")
+    parser.add_argument("--mirror", default="ares_mirror.sqlite3", help="Local mirror written by ManageDatabase.py.")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on.")
+    parser.add_argument("--port", type=int, default=8080, help="Port to listen on.")
+    parser.add_argument("--poll", type=float, default=5.0, help="Seconds between checks for a new update cycle.")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    service = RankingsService(args.mirror, host=args.host, port=args.port, poll_interval=args.poll).start()
+    print(f"📡 Serving rankings on {service.url}")
+    try:
+        service.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.stop()
@@ -0,0 +1,51 @@
+import os
+import tempfile
+import unittest
+
+from API_Library.Storage.ChangeFeed import ChangeFeed
+
+def _team(number, opr):
+    return ({"teamNumber": number, "overallOPR": opr}, ["overallOPR"])
+
+class ChangeFeedTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "changes.jsonl")
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_torn_last_entry_is_cut_off_and_its_seq_reused(self):
+        feed = ChangeFeed(self.path)
+        feed.publish([_team(1, 10.0)], [])
+        feed.publish([_team(2, 20.0)], [])
+        feed.publish([_team(3, 30.0)], [])
+        # Simulate a crash halfway through writing seq 3.
+        with open(self.path, "rb+") as f:
+            f.truncate(f.seek(0, os.SEEK_END) - 15)
+
+        feed = ChangeFeed(self.path)
+        self.assertEqual(feed.last_seq, 2)
+        feed.publish([_team(3, 31.0)], [])
+        feed.publish([_team(4, 40.0)], [])
+
+        entries = ChangeFeed(self.path).read_since(0)
+        self.assertEqual([entry["seq"] for entry in entries], [1, 2, 3, 4])
+        self.assertEqual(entries[2]["teams"][0]["fields"], {"overallOPR": 31.0})
+
+    def test_torn_only_entry_empties_the_feed(self):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write('{"seq":1,"teams":[')
+        feed = ChangeFeed(self.path)
+        self.assertEqual(feed.last_seq, 0)
+        feed.publish([_team(1, 10.0)], [])
+        self.assertEqual([entry["seq"] for entry in feed.read_since(0)], [1])
+
+    def test_read_since_resumes_after_seq(self):
+        feed = ChangeFeed(self.path)
+        for number in range(1, 6):
+            feed.publish([_team(number, float(number))], [])
+        self.assertEqual([entry["seq"] for entry in feed.read_since(2, limit=2)], [3, 4])
+
+if __name__ == "__main__":
+    unittest.main()